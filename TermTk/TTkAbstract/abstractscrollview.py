@@ -25,19 +25,18 @@
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.cfg import *
 from TermTk.TTkCore.signal import pyTTkSlot, pyTTkSignal
+from TermTk.TTkCore.helper import TTkHelper
 from TermTk.TTkWidgets.widget import TTkWidget
 
 class TTkAbstractScrollView(TTkWidget):
     __slots__ = (
-        '_viewOffsetX', '_viewOffsetY',
-        # Signals
-         'viewMovedTo', 'viewSizeChanged', 'viewChanged')
+        '_viewOffsetX', '_viewOffsetY')
+    # Signals
+    viewMovedTo     = pyTTkSignal(int, int) # x, y
+    viewSizeChanged = pyTTkSignal(int, int) # w, h
+    viewChanged     = pyTTkSignal(compressed=True)
 
     def __init__(self, *args, **kwargs):
-        # Signals
-        self.viewMovedTo = pyTTkSignal(int, int) # x, y
-        self.viewSizeChanged = pyTTkSignal(int, int) # w, h
-        self.viewChanged = pyTTkSignal()
         super().__init__(*args, **kwargs)
         self._name = kwargs.get('name' , 'TTkAbstractScrollView')
 
@@ -65,6 +64,9 @@ class TTkAbstractScrollView(TTkWidget):
         if self._viewOffsetX == x and \
            self._viewOffsetY == y: # Nothong to do
             return
+        # A vertical only movement can be rendered scrolling the terminal
+        if self._viewOffsetX == x:
+            TTkHelper.addScrollHint(self, y-self._viewOffsetY)
         self._viewOffsetX = x
         self._viewOffsetY = y
         self.viewMovedTo.emit(x,y)
@@ -72,7 +74,7 @@ class TTkAbstractScrollView(TTkWidget):
         self.update()
 
     def wheelEvent(self, evt):
-        delta = TTkCfg.scrollDelta
+        delta = TTkCfg.scrollDelta * evt.steps
         offx, offy = self.getViewOffsets()
         if evt.evt == TTkK.WHEEL_Up:
             delta = -delta
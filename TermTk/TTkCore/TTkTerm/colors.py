@@ -25,8 +25,10 @@
 # Ansi Escape Codes:
 # https://conemu.github.io/en/AnsiEscapeCodes.html
 
+import os
 import re
 
+from TermTk.TTkCore.constant import TTkK
 from .colors_ansi_map import ansiMap256, ansiMap16
 
 class TTkTermColor():
@@ -36,34 +38,135 @@ class TTkTermColor():
     STRIKETROUGH = 0x08
     BLINKING     = 0x10
 
+    # (modifier, set, reset) SGR parameters
+    _modParams = (
+        (BOLD,         '1', '22'),
+        (ITALIC,       '3', '23'),
+        (UNDERLINE,    '4', '24'),
+        (STRIKETROUGH, '9', '29'),
+        (BLINKING,     '5', '25'))
+
+    # Palettes used to quantize the rgb colors,
+    # the 256 colors one skips the 16 base colors that are often customized in the terminals
+    _palette = {
+        TTkK.DEP_8: [(i, ansiMap256[i]) for i in range(16,256)],
+        TTkK.DEP_4: [(i, ansiMap256[i]) for i in range(16)] }
+    # rgb -> palette index, one lookup cache for each depth
+    _quantCache = {
+        TTkK.DEP_8: {},
+        TTkK.DEP_4: {} }
+
+    @staticmethod
+    def detectDepth() -> int:
+        ''' Return the color depth supported by the terminal based on $TERMTK_COLOR_DEPTH, $COLORTERM and $TERM
+
+        The depth can be forced with the environment variable **TERMTK_COLOR_DEPTH** (2, 4, 8 or 24)
+        or assigning :attr:`TermTk.TTkCore.cfg.TTkCfg.color_depth`
+
+        :return: :class:`~TermTk.TTkCore.constant.TTkConstant.DEP_24`, :class:`~TermTk.TTkCore.constant.TTkConstant.DEP_8`,
+                 :class:`~TermTk.TTkCore.constant.TTkConstant.DEP_4` or :class:`~TermTk.TTkCore.constant.TTkConstant.DEP_2`
+        '''
+        depth = os.environ.get("TERMTK_COLOR_DEPTH", "")
+        if depth in ("2", "4", "8", "24"):
+            return int(depth)
+        colorterm = os.environ.get("COLORTERM", "").lower()
+        term      = os.environ.get("TERM", "").lower()
+        if colorterm in ("truecolor", "24bit") or term.endswith("-direct"):
+            return TTkK.DEP_24
+        if "256color" in term:
+            return TTkK.DEP_8
+        if term in ("dumb", "vt100", "vt102", "vt220"):
+            return TTkK.DEP_2
+        if term in ("linux", "ansi", "cygwin"):
+            # The consoles known to have only the 16 base colors
+            return TTkK.DEP_4
+        if term:
+            # xterm, screen, tmux, rxvt, ... (i.e. over ssh or in a multiplexer) without $COLORTERM,
+            # the 256 colors palette is supported by all of them and is not redefined by the terminal theme
+            return TTkK.DEP_8
+        # Unknown terminal, keep the full colors
+        return TTkK.DEP_24
+
+    @staticmethod
+    def _quantize(rgb:tuple, depth:int) -> int:
+        ''' Return the index of the nearest palette color '''
+        cache = TTkTermColor._quantCache[depth]
+        if (ret := cache.get(rgb)) is None:
+            if len(cache) > 0x10000:
+                cache.clear()
+            r,g,b = rgb
+            ret = min(TTkTermColor._palette[depth],
+                      key=lambda c: (c[1][0]-r)**2 + (c[1][1]-g)**2 + (c[1][2]-b)**2 )[0]
+            cache[rgb] = ret
+        return ret
+
     @staticmethod
-    def rgb2ansi(fg: tuple=None, bg:tuple=None, mod:int=0, clean:bool=False):
+    def _colorParam(rgb:tuple, bg:bool, depth:int) -> str:
+        ''' Return the SGR parameter of the fg/bg color, an empty string if the color is not displayed at this depth '''
+        if not rgb or depth == TTkK.DEP_2:
+            return ''
+        if depth == TTkK.DEP_24:
+            return f'{48 if bg else 38};2;{rgb[0]};{rgb[1]};{rgb[2]}'
+        idx = TTkTermColor._quantize(rgb, depth)
+        if depth == TTkK.DEP_8:
+            return f'{48 if bg else 38};5;{idx}'
+        # 16 colors, the bright ones use the aixterm codes
+        if idx < 8:
+            return str((40 if bg else 30) + idx)
+        return str((100 if bg else 90) + idx - 8)
+
+    @staticmethod
+    def _sgrParams(fg: tuple=None, bg:tuple=None, mod:int=0, depth:int=TTkK.DEP_24):
         ret = []
+        if fgp := TTkTermColor._colorParam(fg, False, depth):
+            ret.append(fgp)
+        if bgp := TTkTermColor._colorParam(bg, True, depth):
+            ret.append(bgp)
+        for m, on, _ in TTkTermColor._modParams:
+            if mod & m:
+                ret.append(on)
+        return ret
 
-        if clean:
-            ret.append(0)
-
-        if fg:
-            ret.append(f'38;2;{fg[0]};{fg[1]};{fg[2]}')
-        if bg:
-            ret.append(f'48;2;{bg[0]};{bg[1]};{bg[2]}')
-
-        if mod & TTkTermColor.BOLD:
-            ret.append('1')
-        if mod & TTkTermColor.ITALIC:
-            ret.append('3')
-        if mod & TTkTermColor.UNDERLINE:
-            ret.append('4')
-        if mod & TTkTermColor.STRIKETROUGH:
-            ret.append('9')
-        if mod & TTkTermColor.BLINKING:
-            ret.append('5')
+    @staticmethod
+    def rgb2ansi(fg: tuple=None, bg:tuple=None, mod:int=0, clean:bool=False, depth:int=TTkK.DEP_24):
+        ret = ['0'] if clean else []
+        ret += TTkTermColor._sgrParams(fg, bg, mod, depth)
 
         if ret:
-            return f'\033[{";".join(str(x) for x in ret)}m'
+            return f'\033[{";".join(ret)}m'
         else:
             return '\033[0m'
 
+    @staticmethod
+    def sgrTransition(fromColor: tuple, toColor: tuple, depth:int=TTkK.DEP_24) -> str:
+        ''' Return the shortest SGR sequence that switch the terminal attributes
+        from one color to another, an empty string if they are the same
+
+        :param fromColor: the current (fg, bg, mod) attributes
+        :param toColor: the new (fg, bg, mod) attributes
+        :param depth: the color depth of the terminal
+        '''
+        fg0, bg0, mod0 = fromColor
+        fg1, bg1, mod1 = toColor
+        colorParam = TTkTermColor._colorParam
+        # Switch only the changed attributes,
+        # the colors are compared after the quantization
+        delta = []
+        if colorParam(fg0, False, depth) != (fgp1 := colorParam(fg1, False, depth)):
+            delta.append(fgp1 or '39')
+        if colorParam(bg0, True, depth) != (bgp1 := colorParam(bg1, True, depth)):
+            delta.append(bgp1 or '49')
+        for m, on, off in TTkTermColor._modParams:
+            if   mod1 & m and not mod0 & m: delta.append(on)
+            elif mod0 & m and not mod1 & m: delta.append(off)
+        if not delta:
+            return ''
+        # Reset and set everything ("\033[m" is a reset)
+        full = [''] + TTkTermColor._sgrParams(fg1, bg1, mod1, depth)
+        delta = ';'.join(delta)
+        full  = ';'.join(full)
+        return f'\033[{delta if len(delta) < len(full) else full}m'
+
     def _256toRgb(val):
         pass
 
@@ -22,7 +22,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import re
 from time import time
 
 import platform
@@ -41,12 +40,13 @@ from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.TTkTerm.inputkey   import TTkKeyEvent
 from TermTk.TTkCore.TTkTerm.inputmouse import TTkMouseEvent
+from TermTk.TTkCore.TTkTerm.term       import TTkTerm
 
 class TTkInput:
     __slots__ = ('_readInput', '_leftLastTime', '_midLastTime', '_rightLastTime', '_leftTap', '_midTap', '_rightTap')
 
-    def __init__(self):
-        self._readInput = ReadInput()
+    def __init__(self, readInput=None):
+        self._readInput = readInput if readInput is not None else ReadInput()
         self._leftLastTime = 0
         self._midLastTime = 0
         self._rightLastTime = 0
@@ -57,87 +57,120 @@ class TTkInput:
     def close(self):
         self._readInput.close()
 
+    def readTime(self):
+        '''The :func:`time.perf_counter` time of the terminal read that delivered the last event'''
+        return self._readInput.readTime()
+
     def get_key(self, callback=None):
-        mouse_re = re.compile(r"\033\[<(\d+);(\d+);(\d+)([mM])")
+        # Each read returns a complete token (see InputTokenizer)
         while stdinRead := self._readInput.read():
-            mevt,kevt = None, None
-            if not stdinRead.startswith("\033[<"):
-                # Key Event
-                kevt = TTkKeyEvent.parse(stdinRead)
-            else:
-                # Mouse Event
-                m = mouse_re.match(stdinRead)
-                if not m:
-                    # TODO: Return Error
-                    hex = [f"0x{ord(x):02x}" for x in stdinRead]
-                    TTkLog.error("UNHANDLED (mouse): "+stdinRead.replace("\033","<ESC>") + " - "+",".join(hex))
-                    continue
-                code = int(m.group(1))
-                x = int(m.group(2))-1
-                y = int(m.group(3))-1
-                state = m.group(4)
-                key = TTkMouseEvent.NoButton
-                evt = TTkMouseEvent.NoEvent
-                tap = 0
-
-                def _checkTap(lastTime, tap):
-                    if state=="M":
-                        t = time()
-                        if (t-lastTime) < 0.4:
-                            return t, tap+1
-                        else:
-                            return t, 1
-                    return lastTime, tap
-
-                mod = TTkK.NoModifier
-                if code & 0x10:
-                    code &= ~0x10
-                    mod |= TTkK.ControlModifier
-                if code & 0x08:
-                    code &= ~0x08
-                    mod |= TTkK.AltModifier
-
-                if code == 0x00:
-                    self._leftLastTime, self._leftTap = _checkTap(self._leftLastTime, self._leftTap)
-                    tap = self._leftTap
-                    key = TTkMouseEvent.LeftButton
-                    evt = TTkMouseEvent.Press if state=="M" else TTkMouseEvent.Release
-                elif code == 0x01:
-                    self._midLastTime, self._midTap = _checkTap(self._midLastTime, self._midTap)
-                    tap = self._midTap
-                    key = TTkMouseEvent.MidButton
-                    evt = TTkMouseEvent.Press if state=="M" else TTkMouseEvent.Release
-                elif code == 0x02:
-                    self._rightLastTime, self._rightTap = _checkTap(self._rightLastTime, self._rightTap)
-                    tap = self._rightTap
-                    key = TTkMouseEvent.RightButton
-                    evt = TTkMouseEvent.Press if state=="M" else TTkMouseEvent.Release
-                elif code == 0x20:
-                    key = TTkMouseEvent.LeftButton
-                    evt = TTkMouseEvent.Drag
-                elif code == 0x21:
-                    key = TTkMouseEvent.MidButton
-                    evt = TTkMouseEvent.Drag
-                elif code == 0x22:
-                    key = TTkMouseEvent.RightButton
-                    evt = TTkMouseEvent.Drag
-                elif code == 0x40:
-                    key = TTkMouseEvent.Wheel
-                    evt = TTkMouseEvent.Up
-                elif code == 0x41:
-                    key = TTkMouseEvent.Wheel
-                    evt = TTkMouseEvent.Down
-                mevt = TTkMouseEvent(x, y, key, evt, mod, tap, m.group(0).replace("\033", "<ESC>"))
-
-            if kevt is None and mevt is None:
-                hex = [f"0x{ord(x):02x}" for x in stdinRead]
-                TTkLog.error("UNHANDLED: "+stdinRead.replace("\033","<ESC>") + " - "+",".join(hex))
-
+            kevt, mevt = self.parse(stdinRead)
             if callback is not None:
                 if not callback(kevt, mevt):
                     break
         TTkLog.debug("Close TTkInput")
 
+    def get_key_async(self, callback):
+        '''asyncio backend, the callback is called by the loop for each event read
+        (the input must be a :class:`~TermTk.TTkCore.TTkTerm.readinputasync.ReadInputAsync`)'''
+        def _token(stdinRead):
+            if stdinRead is None:
+                TTkLog.debug("Close TTkInput")
+                return
+            callback(*self.parse(stdinRead))
+        self._readInput.start(_token)
+
+    def parse(self, stdinRead):
+        '''Convert a token read from the terminal in a key or mouse event
+
+        :return: (kevt, mevt), both None if the token is not an input event
+        '''
+        mevt,kevt = None, None
+        if stdinRead.startswith("\033[?") and stdinRead.endswith("$y"):
+            # Terminal reply to a mode query (i.e. Synchronized Output)
+            try:
+                mode, status = stdinRead[3:-2].split(';')
+                TTkTerm.modeReport(int(mode), int(status))
+            except ValueError:
+                TTkLog.error("UNHANDLED (mode report): "+stdinRead.replace("\033","<ESC>"))
+            return None, None
+        if not stdinRead.startswith("\033[<"):
+            # Key Event
+            kevt = TTkKeyEvent.parse(stdinRead)
+        else:
+            # Mouse Event, "<ESC>[<code>;<x>;<y>[mM]"
+            try:
+                code, x, y = stdinRead[3:-1].split(';')
+                code, x, y = int(code), int(x), int(y)
+            except ValueError:
+                code = None
+            if code is None or stdinRead[-1] not in 'mM':
+                # TODO: Return Error
+                hex = [f"0x{ord(x):02x}" for x in stdinRead]
+                TTkLog.error("UNHANDLED (mouse): "+stdinRead.replace("\033","<ESC>") + " - "+",".join(hex))
+                return None, None
+            x -= 1
+            y -= 1
+            state = stdinRead[-1]
+            key = TTkMouseEvent.NoButton
+            evt = TTkMouseEvent.NoEvent
+            tap = 0
+
+            def _checkTap(lastTime, tap):
+                if state=="M":
+                    t = time()
+                    if (t-lastTime) < 0.4:
+                        return t, tap+1
+                    else:
+                        return t, 1
+                return lastTime, tap
+
+            mod = TTkK.NoModifier
+            if code & 0x10:
+                code &= ~0x10
+                mod |= TTkK.ControlModifier
+            if code & 0x08:
+                code &= ~0x08
+                mod |= TTkK.AltModifier
+
+            if code == 0x00:
+                self._leftLastTime, self._leftTap = _checkTap(self._leftLastTime, self._leftTap)
+                tap = self._leftTap
+                key = TTkMouseEvent.LeftButton
+                evt = TTkMouseEvent.Press if state=="M" else TTkMouseEvent.Release
+            elif code == 0x01:
+                self._midLastTime, self._midTap = _checkTap(self._midLastTime, self._midTap)
+                tap = self._midTap
+                key = TTkMouseEvent.MidButton
+                evt = TTkMouseEvent.Press if state=="M" else TTkMouseEvent.Release
+            elif code == 0x02:
+                self._rightLastTime, self._rightTap = _checkTap(self._rightLastTime, self._rightTap)
+                tap = self._rightTap
+                key = TTkMouseEvent.RightButton
+                evt = TTkMouseEvent.Press if state=="M" else TTkMouseEvent.Release
+            elif code == 0x20:
+                key = TTkMouseEvent.LeftButton
+                evt = TTkMouseEvent.Drag
+            elif code == 0x21:
+                key = TTkMouseEvent.MidButton
+                evt = TTkMouseEvent.Drag
+            elif code == 0x22:
+                key = TTkMouseEvent.RightButton
+                evt = TTkMouseEvent.Drag
+            elif code == 0x40:
+                key = TTkMouseEvent.Wheel
+                evt = TTkMouseEvent.Up
+            elif code == 0x41:
+                key = TTkMouseEvent.Wheel
+                evt = TTkMouseEvent.Down
+            mevt = TTkMouseEvent(x, y, key, evt, mod, tap, stdinRead.replace("\033", "<ESC>"))
+
+        if kevt is None and mevt is None:
+            hex = [f"0x{ord(x):02x}" for x in stdinRead]
+            TTkLog.error("UNHANDLED: "+stdinRead.replace("\033","<ESC>") + " - "+",".join(hex))
+
+        return kevt, mevt
+
 def main():
     print("Retrieve Keyboard, Mouse press/drag/wheel Events")
     print("Press q or <ESC> to exit")
@@ -70,7 +70,12 @@ class TTkKeyEvent:
         return f"KeyEvent: {self.key} {key2str(self.key)} {mod2str(self.mod)} {code}"
 
     @staticmethod
-    def parse(input_key):  # from: Space           except "DEL"
+    def parse(input_key):
+        if input_key.startswith("\033[200~") and input_key.endswith("\033[201~"):
+            # Bracketed Paste, the text is delivered as a single event
+            text = input_key[6:-6].replace('\r\n','\n').replace('\r','\n')
+            return TTkKeyEvent(TTkK.PasteText, text, input_key, TTkK.NoModifier)
+        # from: Space           except "DEL"
         if len(input_key) == 1 and "\040" <= input_key != "\177":
             return TTkKeyEvent(TTkK.Character, input_key, input_key, TTkK.NoModifier)
         else:
@@ -80,194 +85,197 @@ class TTkKeyEvent:
         return None
 
 def _translate_key(key):
-    return {
-        "\177"      : ( TTkK.Key_Backspace , TTkK.NoModifier ) ,
-        "\t"        : ( TTkK.Key_Tab       , TTkK.NoModifier ) ,
-        "\033[Z"    : ( TTkK.Key_Tab       , TTkK.ShiftModifier ) ,
-        "\n"        : ( TTkK.Key_Enter     , TTkK.NoModifier ) ,
-        "\033[A"    : ( TTkK.Key_Up        , TTkK.NoModifier ) ,
-        "\033[B"    : ( TTkK.Key_Down      , TTkK.NoModifier ) ,
-        "\033[C"    : ( TTkK.Key_Right     , TTkK.NoModifier ) ,
-        "\033[D"    : ( TTkK.Key_Left      , TTkK.NoModifier ) ,
+    return _keyTable.get(key,(None, None))
 
-        "\033[1;2A" : ( TTkK.Key_Up        , TTkK.ShiftModifier ) ,
-        "\033[1;2B" : ( TTkK.Key_Down      , TTkK.ShiftModifier ) ,
-        "\033[1;2C" : ( TTkK.Key_Right     , TTkK.ShiftModifier ) ,
-        "\033[1;2D" : ( TTkK.Key_Left      , TTkK.ShiftModifier ) ,
-        "\033[1;3A" : ( TTkK.Key_Up        , TTkK.AltModifier ) ,
-        "\033[1;3B" : ( TTkK.Key_Down      , TTkK.AltModifier ) ,
-        "\033[1;3C" : ( TTkK.Key_Right     , TTkK.AltModifier ) ,
-        "\033[1;3D" : ( TTkK.Key_Left      , TTkK.AltModifier ) ,
-        "\033[1;4A" : ( TTkK.Key_Up        , TTkK.AltModifier | TTkK.ShiftModifier ) ,
-        "\033[1;4B" : ( TTkK.Key_Down      , TTkK.AltModifier | TTkK.ShiftModifier ) ,
-        "\033[1;4C" : ( TTkK.Key_Right     , TTkK.AltModifier | TTkK.ShiftModifier ) ,
-        "\033[1;4D" : ( TTkK.Key_Left      , TTkK.AltModifier | TTkK.ShiftModifier ) ,
-        "\033[1;5A" : ( TTkK.Key_Up        , TTkK.ControlModifier ) ,
-        "\033[1;5B" : ( TTkK.Key_Down      , TTkK.ControlModifier ) ,
-        "\033[1;5C" : ( TTkK.Key_Right     , TTkK.ControlModifier ) ,
-        "\033[1;5D" : ( TTkK.Key_Left      , TTkK.ControlModifier ) ,
+# Terminal code -> (key, modifier)
+_keyTable = {
+    "\177"      : ( TTkK.Key_Backspace , TTkK.NoModifier ) ,
+    "\t"        : ( TTkK.Key_Tab       , TTkK.NoModifier ) ,
+    "\033[Z"    : ( TTkK.Key_Tab       , TTkK.ShiftModifier ) ,
+    "\n"        : ( TTkK.Key_Enter     , TTkK.NoModifier ) ,
+    "\033[A"    : ( TTkK.Key_Up        , TTkK.NoModifier ) ,
+    "\033[B"    : ( TTkK.Key_Down      , TTkK.NoModifier ) ,
+    "\033[C"    : ( TTkK.Key_Right     , TTkK.NoModifier ) ,
+    "\033[D"    : ( TTkK.Key_Left      , TTkK.NoModifier ) ,
 
-        "\033[5~"   : ( TTkK.Key_PageUp    , TTkK.NoModifier ) ,
-        "\033[6~"   : ( TTkK.Key_PageDown  , TTkK.NoModifier ) ,
-        "\033[5;2~" : ( TTkK.Key_PageUp    , TTkK.ShiftModifier ) ,
-        "\033[6;2~" : ( TTkK.Key_PageDown  , TTkK.ShiftModifier ) ,
-        "\033[5;3~" : ( TTkK.Key_PageUp    , TTkK.AltModifier ) ,
-        "\033[6;3~" : ( TTkK.Key_PageDown  , TTkK.AltModifier ) ,
-        "\033[5;4~" : ( TTkK.Key_PageUp    , TTkK.AltModifier | TTkK.ShiftModifier ) ,
-        "\033[6;4~" : ( TTkK.Key_PageDown  , TTkK.AltModifier | TTkK.ShiftModifier ) ,
-        "\033[5;5~" : ( TTkK.Key_PageUp    , TTkK.ControlModifier ) ,
-        "\033[6;5~" : ( TTkK.Key_PageDown  , TTkK.ControlModifier ) ,
-        "\033[5;7~" : ( TTkK.Key_PageUp    , TTkK.AltModifier | TTkK.ControlModifier ) ,
-        "\033[6;7~" : ( TTkK.Key_PageDown  , TTkK.AltModifier | TTkK.ControlModifier ) ,
+    "\033[1;2A" : ( TTkK.Key_Up        , TTkK.ShiftModifier ) ,
+    "\033[1;2B" : ( TTkK.Key_Down      , TTkK.ShiftModifier ) ,
+    "\033[1;2C" : ( TTkK.Key_Right     , TTkK.ShiftModifier ) ,
+    "\033[1;2D" : ( TTkK.Key_Left      , TTkK.ShiftModifier ) ,
+    "\033[1;3A" : ( TTkK.Key_Up        , TTkK.AltModifier ) ,
+    "\033[1;3B" : ( TTkK.Key_Down      , TTkK.AltModifier ) ,
+    "\033[1;3C" : ( TTkK.Key_Right     , TTkK.AltModifier ) ,
+    "\033[1;3D" : ( TTkK.Key_Left      , TTkK.AltModifier ) ,
+    "\033[1;4A" : ( TTkK.Key_Up        , TTkK.AltModifier | TTkK.ShiftModifier ) ,
+    "\033[1;4B" : ( TTkK.Key_Down      , TTkK.AltModifier | TTkK.ShiftModifier ) ,
+    "\033[1;4C" : ( TTkK.Key_Right     , TTkK.AltModifier | TTkK.ShiftModifier ) ,
+    "\033[1;4D" : ( TTkK.Key_Left      , TTkK.AltModifier | TTkK.ShiftModifier ) ,
+    "\033[1;5A" : ( TTkK.Key_Up        , TTkK.ControlModifier ) ,
+    "\033[1;5B" : ( TTkK.Key_Down      , TTkK.ControlModifier ) ,
+    "\033[1;5C" : ( TTkK.Key_Right     , TTkK.ControlModifier ) ,
+    "\033[1;5D" : ( TTkK.Key_Left      , TTkK.ControlModifier ) ,
 
-    # Xterm
-        "\033[F"    : ( TTkK.Key_End       , TTkK.NoModifier ) ,
-        "\033[H"    : ( TTkK.Key_Home      , TTkK.NoModifier ) ,
-    # Terminator + tmux
-        "\033[4~"   : ( TTkK.Key_End       , TTkK.NoModifier ) ,
-        "\033[1~"   : ( TTkK.Key_Home      , TTkK.NoModifier ) ,
-        "\033[2~"   : ( TTkK.Key_Insert    , TTkK.NoModifier ) ,
-        "\033[3~"   : ( TTkK.Key_Delete    , TTkK.NoModifier ) ,
+    "\033[5~"   : ( TTkK.Key_PageUp    , TTkK.NoModifier ) ,
+    "\033[6~"   : ( TTkK.Key_PageDown  , TTkK.NoModifier ) ,
+    "\033[5;2~" : ( TTkK.Key_PageUp    , TTkK.ShiftModifier ) ,
+    "\033[6;2~" : ( TTkK.Key_PageDown  , TTkK.ShiftModifier ) ,
+    "\033[5;3~" : ( TTkK.Key_PageUp    , TTkK.AltModifier ) ,
+    "\033[6;3~" : ( TTkK.Key_PageDown  , TTkK.AltModifier ) ,
+    "\033[5;4~" : ( TTkK.Key_PageUp    , TTkK.AltModifier | TTkK.ShiftModifier ) ,
+    "\033[6;4~" : ( TTkK.Key_PageDown  , TTkK.AltModifier | TTkK.ShiftModifier ) ,
+    "\033[5;5~" : ( TTkK.Key_PageUp    , TTkK.ControlModifier ) ,
+    "\033[6;5~" : ( TTkK.Key_PageDown  , TTkK.ControlModifier ) ,
+    "\033[5;7~" : ( TTkK.Key_PageUp    , TTkK.AltModifier | TTkK.ControlModifier ) ,
+    "\033[6;7~" : ( TTkK.Key_PageDown  , TTkK.AltModifier | TTkK.ControlModifier ) ,
 
-        "\033[1;2F" : ( TTkK.Key_End       , TTkK.ShiftModifier ) ,
-        "\033[1;2H" : ( TTkK.Key_Home      , TTkK.ShiftModifier ) ,
-        "\033[2;2~" : ( TTkK.Key_Insert    , TTkK.ShiftModifier ) ,
-        "\033[3;2~" : ( TTkK.Key_Delete    , TTkK.ShiftModifier ) ,
+# Xterm
+    "\033[F"    : ( TTkK.Key_End       , TTkK.NoModifier ) ,
+    "\033[H"    : ( TTkK.Key_Home      , TTkK.NoModifier ) ,
+# Terminator + tmux
+    "\033[4~"   : ( TTkK.Key_End       , TTkK.NoModifier ) ,
+    "\033[1~"   : ( TTkK.Key_Home      , TTkK.NoModifier ) ,
+    "\033[2~"   : ( TTkK.Key_Insert    , TTkK.NoModifier ) ,
+    "\033[3~"   : ( TTkK.Key_Delete    , TTkK.NoModifier ) ,
 
-        "\033[1;3F" : ( TTkK.Key_End       , TTkK.AltModifier ) ,
-        "\033[1;3H" : ( TTkK.Key_Home      , TTkK.AltModifier ) ,
-        "\033[2;3~" : ( TTkK.Key_Insert    , TTkK.AltModifier ) ,
-        "\033[3;3~" : ( TTkK.Key_Delete    , TTkK.AltModifier ) ,
+    "\033[1;2F" : ( TTkK.Key_End       , TTkK.ShiftModifier ) ,
+    "\033[1;2H" : ( TTkK.Key_Home      , TTkK.ShiftModifier ) ,
+    "\033[2;2~" : ( TTkK.Key_Insert    , TTkK.ShiftModifier ) ,
+    "\033[3;2~" : ( TTkK.Key_Delete    , TTkK.ShiftModifier ) ,
 
-        "\033[1;4F" : ( TTkK.Key_End       , TTkK.ShiftModifier | TTkK.AltModifier ) ,
-        "\033[1;4H" : ( TTkK.Key_Home      , TTkK.ShiftModifier | TTkK.AltModifier ) ,
-        "\033[2;4~" : ( TTkK.Key_Insert    , TTkK.ShiftModifier | TTkK.AltModifier ) ,
-        "\033[3;4~" : ( TTkK.Key_Delete    , TTkK.ShiftModifier | TTkK.AltModifier ) ,
+    "\033[1;3F" : ( TTkK.Key_End       , TTkK.AltModifier ) ,
+    "\033[1;3H" : ( TTkK.Key_Home      , TTkK.AltModifier ) ,
+    "\033[2;3~" : ( TTkK.Key_Insert    , TTkK.AltModifier ) ,
+    "\033[3;3~" : ( TTkK.Key_Delete    , TTkK.AltModifier ) ,
 
-        "\033[1;5F" : ( TTkK.Key_End       , TTkK.ControlModifier ) ,
-        "\033[1;5H" : ( TTkK.Key_Home      , TTkK.ControlModifier ) ,
-        "\033[2;5~" : ( TTkK.Key_Insert    , TTkK.ControlModifier ) ,
-        "\033[3;5~" : ( TTkK.Key_Delete    , TTkK.ControlModifier ) ,
+    "\033[1;4F" : ( TTkK.Key_End       , TTkK.ShiftModifier | TTkK.AltModifier ) ,
+    "\033[1;4H" : ( TTkK.Key_Home      , TTkK.ShiftModifier | TTkK.AltModifier ) ,
+    "\033[2;4~" : ( TTkK.Key_Insert    , TTkK.ShiftModifier | TTkK.AltModifier ) ,
+    "\033[3;4~" : ( TTkK.Key_Delete    , TTkK.ShiftModifier | TTkK.AltModifier ) ,
 
-        "\033[1;6F" : ( TTkK.Key_End       , TTkK.ShiftModifier | TTkK.ControlModifier) ,
-        "\033[1;6H" : ( TTkK.Key_Home      , TTkK.ShiftModifier | TTkK.ControlModifier) ,
-        "\033[2;6~" : ( TTkK.Key_Insert    , TTkK.ShiftModifier | TTkK.ControlModifier) ,
-        "\033[3;6~" : ( TTkK.Key_Delete    , TTkK.ShiftModifier | TTkK.ControlModifier) ,
+    "\033[1;5F" : ( TTkK.Key_End       , TTkK.ControlModifier ) ,
+    "\033[1;5H" : ( TTkK.Key_Home      , TTkK.ControlModifier ) ,
+    "\033[2;5~" : ( TTkK.Key_Insert    , TTkK.ControlModifier ) ,
+    "\033[3;5~" : ( TTkK.Key_Delete    , TTkK.ControlModifier ) ,
 
-        "\033[1;7F" : ( TTkK.Key_End       , TTkK.AltModifier | TTkK.ControlModifier) ,
-        "\033[1;7H" : ( TTkK.Key_Home      , TTkK.AltModifier | TTkK.ControlModifier) ,
-        "\033[2;7~" : ( TTkK.Key_Insert    , TTkK.AltModifier | TTkK.ControlModifier) ,
-        "\033[3;7~" : ( TTkK.Key_Delete    , TTkK.AltModifier | TTkK.ControlModifier) ,
+    "\033[1;6F" : ( TTkK.Key_End       , TTkK.ShiftModifier | TTkK.ControlModifier) ,
+    "\033[1;6H" : ( TTkK.Key_Home      , TTkK.ShiftModifier | TTkK.ControlModifier) ,
+    "\033[2;6~" : ( TTkK.Key_Insert    , TTkK.ShiftModifier | TTkK.ControlModifier) ,
+    "\033[3;6~" : ( TTkK.Key_Delete    , TTkK.ShiftModifier | TTkK.ControlModifier) ,
 
-        "\033[1;8F" : ( TTkK.Key_End       , TTkK.ShiftModifier | TTkK.AltModifier | TTkK.ControlModifier) ,
-        "\033[1;8H" : ( TTkK.Key_Home      , TTkK.ShiftModifier | TTkK.AltModifier | TTkK.ControlModifier) ,
-        "\033[2;8~" : ( TTkK.Key_Insert    , TTkK.ShiftModifier | TTkK.AltModifier | TTkK.ControlModifier) ,
-        "\033[3;8~" : ( TTkK.Key_Delete    , TTkK.ShiftModifier | TTkK.AltModifier | TTkK.ControlModifier) ,
+    "\033[1;7F" : ( TTkK.Key_End       , TTkK.AltModifier | TTkK.ControlModifier) ,
+    "\033[1;7H" : ( TTkK.Key_Home      , TTkK.AltModifier | TTkK.ControlModifier) ,
+    "\033[2;7~" : ( TTkK.Key_Insert    , TTkK.AltModifier | TTkK.ControlModifier) ,
+    "\033[3;7~" : ( TTkK.Key_Delete    , TTkK.AltModifier | TTkK.ControlModifier) ,
 
-        "\033"      : ( TTkK.Key_Escape    , TTkK.NoModifier ) ,
-    # Function Key
-        "\033OP"    : ( TTkK.Key_F1        , TTkK.NoModifier ) ,
-        "\033OQ"    : ( TTkK.Key_F2        , TTkK.NoModifier ) ,
-        "\033OR"    : ( TTkK.Key_F3        , TTkK.NoModifier ) ,
-        "\033OS"    : ( TTkK.Key_F4        , TTkK.NoModifier ) ,
-        "\033[15~"  : ( TTkK.Key_F5        , TTkK.NoModifier ) ,
-        "\033[17~"  : ( TTkK.Key_F6        , TTkK.NoModifier ) ,
-        "\033[18~"  : ( TTkK.Key_F7        , TTkK.NoModifier ) ,
-        "\033[19~"  : ( TTkK.Key_F8        , TTkK.NoModifier ) ,
-        "\033[20~"  : ( TTkK.Key_F9        , TTkK.NoModifier ) ,
-        "\033[21~"  : ( TTkK.Key_F10       , TTkK.NoModifier ) ,
-        "\033[23~"  : ( TTkK.Key_F11       , TTkK.NoModifier ) ,
-        "\033[24~"  : ( TTkK.Key_F12       , TTkK.NoModifier ) ,
-        "\033[1;2P" : ( TTkK.Key_F1        , TTkK.ShiftModifier ) ,
-        "\033[1;2Q" : ( TTkK.Key_F2        , TTkK.ShiftModifier ) ,
-        "\033[1;2R" : ( TTkK.Key_F3        , TTkK.ShiftModifier ) ,
-        "\033[1;2S" : ( TTkK.Key_F4        , TTkK.ShiftModifier ) ,
-        "\033[15;2~": ( TTkK.Key_F5        , TTkK.ShiftModifier ) ,
-        "\033[17;2~": ( TTkK.Key_F6        , TTkK.ShiftModifier ) ,
-        "\033[18;2~": ( TTkK.Key_F7        , TTkK.ShiftModifier ) ,
-        "\033[19;2~": ( TTkK.Key_F8        , TTkK.ShiftModifier ) ,
-        "\033[20;2~": ( TTkK.Key_F9        , TTkK.ShiftModifier ) ,
-        "\033[21;2~": ( TTkK.Key_F10       , TTkK.ShiftModifier ) ,
-        "\033[23;2~": ( TTkK.Key_F11       , TTkK.ShiftModifier ) ,
-        "\033[24;2~": ( TTkK.Key_F12       , TTkK.ShiftModifier ) ,
-        "\033[1;5P" : ( TTkK.Key_F1        , TTkK.ControlModifier ) ,
-        "\033[1;5Q" : ( TTkK.Key_F2        , TTkK.ControlModifier ) ,
-        "\033[1;5R" : ( TTkK.Key_F3        , TTkK.ControlModifier ) ,
-        "\033[1;5S" : ( TTkK.Key_F4        , TTkK.ControlModifier ) ,
-        "\033[15;5~": ( TTkK.Key_F5        , TTkK.ControlModifier ) ,
-        "\033[17;5~": ( TTkK.Key_F6        , TTkK.ControlModifier ) ,
-        "\033[18;5~": ( TTkK.Key_F7        , TTkK.ControlModifier ) ,
-        "\033[19;5~": ( TTkK.Key_F8        , TTkK.ControlModifier ) ,
-        "\033[20;5~": ( TTkK.Key_F9        , TTkK.ControlModifier ) ,
-        "\033[21;5~": ( TTkK.Key_F10       , TTkK.ControlModifier ) ,
-        "\033[23;5~": ( TTkK.Key_F11       , TTkK.ControlModifier ) ,
-        "\033[24;5~": ( TTkK.Key_F12       , TTkK.ControlModifier ) ,
-        # "\033[1;3P" : ( TTkK.Key_F1        , TTkK.AltModifier ) ,
-        # "\033[1;3Q" : ( TTkK.Key_F2        , TTkK.AltModifier ) ,
-        "\033[1;3R" : ( TTkK.Key_F3        , TTkK.AltModifier ) ,
-        # "\033[1;3S" : ( TTkK.Key_F4        , TTkK.AltModifier ) ,
-        # "\033[15;3~": ( TTkK.Key_F5        , TTkK.AltModifier ) ,
-        "\033[17;3~": ( TTkK.Key_F6        , TTkK.AltModifier ) ,
-        # "\033[18;3~": ( TTkK.Key_F7        , TTkK.AltModifier ) ,
-        # "\033[19;3~": ( TTkK.Key_F8        , TTkK.AltModifier ) ,
-        "\033[20;3~": ( TTkK.Key_F9        , TTkK.AltModifier ) ,
-        # "\033[21;3~": ( TTkK.Key_F10       , TTkK.AltModifier ) ,
-        "\033[23;3~": ( TTkK.Key_F11       , TTkK.AltModifier ) ,
-        "\033[24;3~": ( TTkK.Key_F12       , TTkK.AltModifier ) ,
+    "\033[1;8F" : ( TTkK.Key_End       , TTkK.ShiftModifier | TTkK.AltModifier | TTkK.ControlModifier) ,
+    "\033[1;8H" : ( TTkK.Key_Home      , TTkK.ShiftModifier | TTkK.AltModifier | TTkK.ControlModifier) ,
+    "\033[2;8~" : ( TTkK.Key_Insert    , TTkK.ShiftModifier | TTkK.AltModifier | TTkK.ControlModifier) ,
+    "\033[3;8~" : ( TTkK.Key_Delete    , TTkK.ShiftModifier | TTkK.AltModifier | TTkK.ControlModifier) ,
 
-        # # "\033": return( ey_Tab ) ,
-        # if True: return None
-        # "\033": return( ey_Backtab ) ,
-        # "\033": return( ey_Backspace ) ,
-        # "\033": return( ey_Return ) ,
-        # "\033": return( ey_Enter ) ,
-        # "\033": return( ey_Pause ) ,
-        # "\033": return( ey_Print ) ,
-        # "\033": return( ey_SysReq ) ,
-        # "\033": return( ey_Clear ) ,
-        # "\033": return( ey_Shift ) ,
-        # "\033": return( ey_Control ) ,
-        # "\033": return( ey_Meta ) ,
-        # "\033": return( ey_Alt ) ,
-        # "\033": return( ey_AltGr ) ,
-        # "\033": return( ey_CapsLock ) ,
-        # "\033": return( ey_NumLock ) ,
-        # "\033": return( ey_ScrollLock ) ,
-        # "\033": return( ey_F13 ) ,
-        # "\033": return( ey_F14 ) ,
-        # "\033": return( ey_F15 ) ,
-        # "\033": return( ey_F16 ) ,
-        # "\033": return( ey_F17 ) ,
-        # "\033": return( ey_F18 ) ,
-        # "\033": return( ey_F19 ) ,
-        # "\033": return( ey_F20 ) ,
-        # "\033": return( ey_F21 ) ,
-        # "\033": return( ey_F22 ) ,
-        # "\033": return( ey_F23 ) ,
-        # "\033": return( ey_F24 ) ,
-        # "\033": return( ey_F25 ) ,
-        # "\033": return( ey_F26 ) ,
-        # "\033": return( ey_F27 ) ,
-        # "\033": return( ey_F28 ) ,
-        # "\033": return( ey_F29 ) ,
-        # "\033": return( ey_F30 ) ,
-        # "\033": return( ey_F31 ) ,
-        # "\033": return( ey_F32 ) ,
-        # "\033": return( ey_F33 ) ,
-        # "\033": return( ey_F34 ) ,
-        # "\033": return( ey_F35 ) ,
-        # "\033": return( ey_Super_L ) ,
-        # "\033": return( ey_Super_R ) ,
-        # "\033": return( ey_Menu ) ,
-        # "\033": return( ey_Hyper_L ) ,
-        # "\033": return( ey_Hyper_R ) ,
-        # "\033": return( ey_Help ) ,
-        # "\033": return( ey_Direction_L ) ,
-        # "\033": return( ey_Direction_R ) ,
-        # "\033": return( ey_Space ) ,
-        # "\033": return( ey_Any ) ,
-        # return TTkK.NONE
-    }.get(key,(None, None))
+    "\033"      : ( TTkK.Key_Escape    , TTkK.NoModifier ) ,
+# Function Key
+    "\033OP"    : ( TTkK.Key_F1        , TTkK.NoModifier ) ,
+    "\033OQ"    : ( TTkK.Key_F2        , TTkK.NoModifier ) ,
+    "\033OR"    : ( TTkK.Key_F3        , TTkK.NoModifier ) ,
+    "\033OS"    : ( TTkK.Key_F4        , TTkK.NoModifier ) ,
+    "\033[15~"  : ( TTkK.Key_F5        , TTkK.NoModifier ) ,
+    "\033[17~"  : ( TTkK.Key_F6        , TTkK.NoModifier ) ,
+    "\033[18~"  : ( TTkK.Key_F7        , TTkK.NoModifier ) ,
+    "\033[19~"  : ( TTkK.Key_F8        , TTkK.NoModifier ) ,
+    "\033[20~"  : ( TTkK.Key_F9        , TTkK.NoModifier ) ,
+    "\033[21~"  : ( TTkK.Key_F10       , TTkK.NoModifier ) ,
+    "\033[23~"  : ( TTkK.Key_F11       , TTkK.NoModifier ) ,
+    "\033[24~"  : ( TTkK.Key_F12       , TTkK.NoModifier ) ,
+    "\033[1;2P" : ( TTkK.Key_F1        , TTkK.ShiftModifier ) ,
+    "\033[1;2Q" : ( TTkK.Key_F2        , TTkK.ShiftModifier ) ,
+    "\033[1;2R" : ( TTkK.Key_F3        , TTkK.ShiftModifier ) ,
+    "\033[1;2S" : ( TTkK.Key_F4        , TTkK.ShiftModifier ) ,
+    "\033[15;2~": ( TTkK.Key_F5        , TTkK.ShiftModifier ) ,
+    "\033[17;2~": ( TTkK.Key_F6        , TTkK.ShiftModifier ) ,
+    "\033[18;2~": ( TTkK.Key_F7        , TTkK.ShiftModifier ) ,
+    "\033[19;2~": ( TTkK.Key_F8        , TTkK.ShiftModifier ) ,
+    "\033[20;2~": ( TTkK.Key_F9        , TTkK.ShiftModifier ) ,
+    "\033[21;2~": ( TTkK.Key_F10       , TTkK.ShiftModifier ) ,
+    "\033[23;2~": ( TTkK.Key_F11       , TTkK.ShiftModifier ) ,
+    "\033[24;2~": ( TTkK.Key_F12       , TTkK.ShiftModifier ) ,
+    "\033[1;5P" : ( TTkK.Key_F1        , TTkK.ControlModifier ) ,
+    "\033[1;5Q" : ( TTkK.Key_F2        , TTkK.ControlModifier ) ,
+    "\033[1;5R" : ( TTkK.Key_F3        , TTkK.ControlModifier ) ,
+    "\033[1;5S" : ( TTkK.Key_F4        , TTkK.ControlModifier ) ,
+    "\033[15;5~": ( TTkK.Key_F5        , TTkK.ControlModifier ) ,
+    "\033[17;5~": ( TTkK.Key_F6        , TTkK.ControlModifier ) ,
+    "\033[18;5~": ( TTkK.Key_F7        , TTkK.ControlModifier ) ,
+    "\033[19;5~": ( TTkK.Key_F8        , TTkK.ControlModifier ) ,
+    "\033[20;5~": ( TTkK.Key_F9        , TTkK.ControlModifier ) ,
+    "\033[21;5~": ( TTkK.Key_F10       , TTkK.ControlModifier ) ,
+    "\033[23;5~": ( TTkK.Key_F11       , TTkK.ControlModifier ) ,
+    "\033[24;5~": ( TTkK.Key_F12       , TTkK.ControlModifier ) ,
+    # "\033[1;3P" : ( TTkK.Key_F1        , TTkK.AltModifier ) ,
+    # "\033[1;3Q" : ( TTkK.Key_F2        , TTkK.AltModifier ) ,
+    "\033[1;3R" : ( TTkK.Key_F3        , TTkK.AltModifier ) ,
+    # "\033[1;3S" : ( TTkK.Key_F4        , TTkK.AltModifier ) ,
+    # "\033[15;3~": ( TTkK.Key_F5        , TTkK.AltModifier ) ,
+    "\033[17;3~": ( TTkK.Key_F6        , TTkK.AltModifier ) ,
+    # "\033[18;3~": ( TTkK.Key_F7        , TTkK.AltModifier ) ,
+    # "\033[19;3~": ( TTkK.Key_F8        , TTkK.AltModifier ) ,
+    "\033[20;3~": ( TTkK.Key_F9        , TTkK.AltModifier ) ,
+    # "\033[21;3~": ( TTkK.Key_F10       , TTkK.AltModifier ) ,
+    "\033[23;3~": ( TTkK.Key_F11       , TTkK.AltModifier ) ,
+    "\033[24;3~": ( TTkK.Key_F12       , TTkK.AltModifier ) ,
+
+    # # "\033": return( ey_Tab ) ,
+    # if True: return None
+    # "\033": return( ey_Backtab ) ,
+    # "\033": return( ey_Backspace ) ,
+    # "\033": return( ey_Return ) ,
+    # "\033": return( ey_Enter ) ,
+    # "\033": return( ey_Pause ) ,
+    # "\033": return( ey_Print ) ,
+    # "\033": return( ey_SysReq ) ,
+    # "\033": return( ey_Clear ) ,
+    # "\033": return( ey_Shift ) ,
+    # "\033": return( ey_Control ) ,
+    # "\033": return( ey_Meta ) ,
+    # "\033": return( ey_Alt ) ,
+    # "\033": return( ey_AltGr ) ,
+    # "\033": return( ey_CapsLock ) ,
+    # "\033": return( ey_NumLock ) ,
+    # "\033": return( ey_ScrollLock ) ,
+    # "\033": return( ey_F13 ) ,
+    # "\033": return( ey_F14 ) ,
+    # "\033": return( ey_F15 ) ,
+    # "\033": return( ey_F16 ) ,
+    # "\033": return( ey_F17 ) ,
+    # "\033": return( ey_F18 ) ,
+    # "\033": return( ey_F19 ) ,
+    # "\033": return( ey_F20 ) ,
+    # "\033": return( ey_F21 ) ,
+    # "\033": return( ey_F22 ) ,
+    # "\033": return( ey_F23 ) ,
+    # "\033": return( ey_F24 ) ,
+    # "\033": return( ey_F25 ) ,
+    # "\033": return( ey_F26 ) ,
+    # "\033": return( ey_F27 ) ,
+    # "\033": return( ey_F28 ) ,
+    # "\033": return( ey_F29 ) ,
+    # "\033": return( ey_F30 ) ,
+    # "\033": return( ey_F31 ) ,
+    # "\033": return( ey_F32 ) ,
+    # "\033": return( ey_F33 ) ,
+    # "\033": return( ey_F34 ) ,
+    # "\033": return( ey_F35 ) ,
+    # "\033": return( ey_Super_L ) ,
+    # "\033": return( ey_Super_R ) ,
+    # "\033": return( ey_Menu ) ,
+    # "\033": return( ey_Hyper_L ) ,
+    # "\033": return( ey_Hyper_R ) ,
+    # "\033": return( ey_Help ) ,
+    # "\033": return( ey_Direction_L ) ,
+    # "\033": return( ey_Direction_R ) ,
+    # "\033": return( ey_Space ) ,
+    # "\033": return( ey_Any ) ,
+    # return TTkK.NONE
+}
 
 def mod2str(k):
     if k == TTkK.NoModifier         : return ""
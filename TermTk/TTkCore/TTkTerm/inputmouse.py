@@ -64,6 +64,11 @@ class TTkMouseEvent:
 
         The terminal "raw" information reporting this event (Do not use it unless you know what you are looking for)
 
+    .. py:attribute:: steps
+        :type: int
+
+        The number of wheel steps reported in this event, the consecutive wheel events are merged in a single event (see :attr:`~TermTk.TTkCore.cfg.TTkCfg.coalesceWheel`)
+
     '''
     # Keys
     NoButton      = TTkK.NoButton     # The button state does not refer to any button (see QMouseEvent::button()).
@@ -83,8 +88,8 @@ class TTkMouseEvent:
     Up      = TTkK.WHEEL_Up
     Down    = TTkK.WHEEL_Down
 
-    __slots__ = ('x', 'y', 'key', 'evt', 'mod', 'tap', 'raw')
-    def __init__(self, x: int, y: int, key: int, evt: int, mod: int, tap: int, raw: str):
+    __slots__ = ('x', 'y', 'key', 'evt', 'mod', 'tap', 'raw', 'steps')
+    def __init__(self, x: int, y: int, key: int, evt: int, mod: int, tap: int, raw: str, steps: int = 1):
         self.x = x
         self.y = y
         self.key = key
@@ -92,11 +97,12 @@ class TTkMouseEvent:
         self.mod = mod
         self.raw = raw
         self.tap = tap
+        self.steps = steps
 
     def clone(self, pos=None, evt=None):
         x,y = pos or (self.x, self.y)
         evt = evt or self.evt
-        return TTkMouseEvent(x, y, self.key, evt, self.mod, self.tap, self.raw)
+        return TTkMouseEvent(x, y, self.key, evt, self.mod, self.tap, self.raw, self.steps)
 
     def key2str(self):
         return {
@@ -133,4 +139,4 @@ class TTkMouseEvent:
         return "NONE!!!"
 
     def __str__(self):
-        return f"MouseEvent ({self.x},{self.y}) {self.key2str()} {self.evt2str()} {self.mod2str()} tap:{self.tap} - {self.raw}"
+        return f"MouseEvent ({self.x},{self.y}) {self.key2str()} {self.evt2str()} {self.mod2str()} tap:{self.tap} steps:{self.steps} - {self.raw}"
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2023 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import codecs
+
+class InputTokenizer():
+    ''' Incremental tokenizer of the terminal input stream
+
+    The bytes read from the terminal are split in complete tokens:
+
+    * a single char (printable or control)
+    * an escape sequence (CSI "<ESC>[...", SS3 "<ESC>O.", "<ESC>."), i.e. special keys and mouse reports
+    * a whole bracketed paste "<ESC>[200~...<ESC>[201~"
+
+    The sequences and the multibyte chars split between two reads are kept
+    until the following chunk is fed, :meth:`flush` releases an incomplete sequence
+    (i.e. a lone <ESC> key) if no more input is available.
+    An open bracketed paste is never flushed, it is kept until its end is received
+    '''
+    __slots__ = ('_buffer', '_decoder')
+
+    PASTE_BEGIN = "\033[200~"
+    PASTE_END   = "\033[201~"
+
+    TIMEOUT = 0.05
+    '''Seconds to wait for the end of an incomplete sequence before :meth:`flush`'''
+
+    def __init__(self):
+        self._buffer = ''
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def pending(self) -> bool:
+        ''' Return True if an incomplete sequence is waiting for more input (within :attr:`TIMEOUT`)
+
+        An open bracketed paste is not pending, the input is awaited with no timeout
+        '''
+        return bool(self._buffer) and not self._buffer.startswith(InputTokenizer.PASTE_BEGIN)
+
+    def feed(self, data:bytes) -> list:
+        ''' Append the bytes read from the terminal and return the list of the complete tokens '''
+        self._buffer += self._decoder.decode(data)
+        return self._split(final=False)
+
+    def flush(self) -> list:
+        ''' Return the pending incomplete sequence as a token '''
+        return self._split(final=True)
+
+    @staticmethod
+    def _sequenceEnd(buf, i, n):
+        # Return the index after the escape sequence starting at i, -1 if incomplete
+        if i+1 >= n: return -1
+        c = buf[i+1]
+        if c == '[':
+            # CSI: parameters and intermediate bytes (0x20-0x3F) followed by a final byte (0x40-0x7E)
+            j = i+2
+            while j < n and '\x20' <= buf[j] <= '\x3f': j += 1
+            if j >= n: return -1
+            if not '\x40' <= buf[j] <= '\x7e': return j
+            if buf.startswith(InputTokenizer.PASTE_BEGIN, i):
+                k = buf.find(InputTokenizer.PASTE_END, j+1)
+                return -1 if k == -1 else k + len(InputTokenizer.PASTE_END)
+            return j+1
+        if c == 'O':
+            # SS3: one char (F1-F4)
+            return i+3 if i+2 < n else -1
+        if c == '\033':
+            # The first <ESC> is a key press
+            return i+1
+        # Alt + key
+        return i+2
+
+    def _split(self, final):
+        buf = self._buffer
+        n = len(buf)
+        i = 0
+        tokens = []
+        while i < n:
+            if buf[i] != '\033':
+                # Each char until the next escape is a token
+                if (j := buf.find('\033', i)) == -1: j = n
+                tokens.extend(buf[i:j])
+                i = j
+                continue
+            if (j := InputTokenizer._sequenceEnd(buf, i, n)) == -1:
+                # The paste is kept until its end, whatever the gap between the reads
+                if not final or buf.startswith(InputTokenizer.PASTE_BEGIN, i): break
+                j = n
+            tokens.append(buf[i:j])
+            i = j
+        self._buffer = buf[i:]
+        return tokens
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2023 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os
+from time import perf_counter
+
+try: import termios, tty
+except Exception as e:
+    print(f'ERROR: {e}')
+    exit(1)
+
+from TermTk.TTkCore.TTkTerm.inputtokenizer import InputTokenizer
+
+
+class ReadInputAsync():
+    '''asyncio input reader, stdin is watched with loop.add_reader
+    and the tokens are delivered to the callback in the loop thread'''
+    __slots__ = ('_loop', '_callback', '_fn', '_attr', '_tokenizer', '_flushHandle', '_readTime')
+
+    def __init__(self, loop):
+        self._loop = loop
+        self._callback = None
+        self._fn = sys.stdin.fileno()
+        self._attr = None
+        self._tokenizer = InputTokenizer()
+        self._flushHandle = None
+        self._readTime = 0
+
+    def start(self, callback):
+        self._callback = callback
+        self._attr = termios.tcgetattr(self._fn)
+        tty.setcbreak(self._fn)
+        self._loop.add_reader(self._fn, self._read)
+
+    def close(self):
+        if self._attr is None: return
+        self._loop.remove_reader(self._fn)
+        if self._flushHandle is not None:
+            self._flushHandle.cancel()
+            self._flushHandle = None
+        termios.tcsetattr(self._fn, termios.TCSANOW, self._attr)
+        self._attr = None
+        self._callback(None)
+
+    def readTime(self):
+        '''The :func:`time.perf_counter` time of the read that returned the last token'''
+        return self._readTime
+
+    def _read(self):
+        try:
+            stdinRead = os.read(self._fn, 0x1000)
+        except BlockingIOError:
+            return
+        if not stdinRead:
+            self.close()
+            return
+        self._readTime = perf_counter()
+        if self._flushHandle is not None:
+            self._flushHandle.cancel()
+            self._flushHandle = None
+        for token in self._tokenizer.feed(stdinRead):
+            self._callback(token)
+        # Wait a bit for the end of an incomplete sequence (i.e. a lone <ESC>)
+        if self._tokenizer.pending():
+            self._flushHandle = self._loop.call_later(InputTokenizer.TIMEOUT, self._flush)
+
+    def _flush(self):
+        self._flushHandle = None
+        for token in self._tokenizer.flush():
+            self._callback(token)
@@ -23,18 +23,25 @@
 # SOFTWARE.
 
 import sys, os, select
+from collections import deque
+from time import perf_counter
 
 try: import fcntl, termios, tty
 except Exception as e:
     print(f'ERROR: {e}')
     exit(1)
 
+from TermTk.TTkCore.TTkTerm.inputtokenizer import InputTokenizer
+
 
 class ReadInput():
-    __slots__ = ('_readPipe')
+    __slots__ = ('_readPipe', '_tokenizer', '_tokens', '_readTime')
 
     def __init__(self):
         self._readPipe = os.pipe()
+        self._tokenizer = InputTokenizer()
+        self._tokens = deque()
+        self._readTime = 0
 
     def close(self):
         os.write(self._readPipe[1], b'quit')
@@ -43,17 +50,24 @@ class ReadInput():
         _fn = sys.stdin.fileno()
         _attr = termios.tcgetattr(_fn)
         tty.setcbreak(_fn)
-        rlist, _, _ = select.select( [sys.stdin, self._readPipe[0]], [], [] )
-
-        if self._readPipe[0] in rlist:
-            return None
-
-        if (stdinRead := sys.stdin.read(1)) == "\033":  # Check if the stream start with an escape sequence
-            _fl = fcntl.fcntl(_fn, fcntl.F_GETFL)
-            fcntl.fcntl(_fn, fcntl.F_SETFL, _fl | os.O_NONBLOCK) # Set the input as NONBLOCK to read the full sequence
-            stdinRead += sys.stdin.read(20)       # Check if the stream start with an escape sequence
-            if stdinRead.startswith("\033[<"):    # Clear the buffer if this is a mouse code
-                sys.stdin.read(0x40)
-            fcntl.fcntl(_fn, fcntl.F_SETFL, _fl)
+        while not self._tokens:
+            # Wait a bit for the end of an incomplete sequence (i.e. a lone <ESC>)
+            timeout = InputTokenizer.TIMEOUT if self._tokenizer.pending() else None
+            rlist, _, _ = select.select( [_fn, self._readPipe[0]], [], [], timeout )
+
+            if self._readPipe[0] in rlist:
+                self._tokens.append(None)
+            elif _fn in rlist:
+                if stdinRead := os.read(_fn, 0x1000):
+                    self._readTime = perf_counter()
+                    self._tokens.extend(self._tokenizer.feed(stdinRead))
+                else:
+                    self._tokens.append(None)
+            else:
+                self._tokens.extend(self._tokenizer.flush())
         termios.tcsetattr(_fn, termios.TCSANOW, _attr)
-        return stdinRead
+        return self._tokens.popleft()
+
+    def readTime(self):
+        '''The :func:`time.perf_counter` time of the read that returned the last token'''
+        return self._readTime
@@ -25,67 +25,64 @@
 import sys, os, select
 import threading
 import queue
+from time import perf_counter
 
 try: import fcntl, termios, tty
 except Exception as e:
     print(f'ERROR: {e}')
     exit(1)
 
+from TermTk.TTkCore.TTkTerm.inputtokenizer import InputTokenizer
+
 
 class ReadInput():
-    __slots__ = ('_readPipe', '_inputs')
+    __slots__ = ('_readPipe', '_inputs', '_readTime')
 
     def __init__(self):
         self._readPipe = os.pipe()
-        self._inputs = queue.Queue()
+        # (token, readTime) pairs
+        self._inputs = queue.SimpleQueue()
+        self._readTime = 0
         threading.Thread(target=self._pullInputThread).start()
 
     def _pullInputThread(self):
         _fn = sys.stdin.fileno()
         _attr = termios.tcgetattr(_fn)
         tty.setcbreak(_fn)
+        tokenizer = InputTokenizer()
+        readTime = 0
 
         while True:
-            rlist, _, _ = select.select( [sys.stdin, self._readPipe[0]], [], [] )
+            # Wait a bit for the end of an incomplete sequence (i.e. a lone <ESC>)
+            timeout = InputTokenizer.TIMEOUT if tokenizer.pending() else None
+            rlist, _, _ = select.select( [_fn, self._readPipe[0]], [], [], timeout )
 
             if self._readPipe[0] in rlist:
                 break
 
-            if (stdinRead := sys.stdin.read(1)) == "\033":  # Check if the stream start with an escape sequence
-                _fl = fcntl.fcntl(_fn, fcntl.F_GETFL)
-                fcntl.fcntl(_fn, fcntl.F_SETFL, _fl | os.O_NONBLOCK) # Set the input as NONBLOCK to read the full sequence
-                stdinRead += sys.stdin.read(20)       # Check if the stream start with an escape sequence
-                if stdinRead.startswith("\033[<"):    # Clear the buffer if this is a mouse code
-                    sys.stdin.read(0x40)
-                fcntl.fcntl(_fn, fcntl.F_SETFL, _fl)
+            if _fn in rlist:
+                # Read all the available input, the tokenizer keeps
+                # the sequences split between two reads
+                if not (stdinRead := os.read(_fn, 0x1000)):
+                    break
+                readTime = perf_counter()
+                tokens = tokenizer.feed(stdinRead)
+            else:
+                tokens = tokenizer.flush()
 
-            self._inputs.put(stdinRead)
+            for token in tokens:
+                self._inputs.put((token, readTime))
 
         termios.tcsetattr(_fn, termios.TCSANOW, _attr)
-        self._inputs.put(None)
-
+        self._inputs.put((None, 0))
 
     def close(self):
         os.write(self._readPipe[1], b'quit')
 
-    def _read(self):
-        _fn = sys.stdin.fileno()
-        _attr = termios.tcgetattr(_fn)
-        tty.setcbreak(_fn)
-        rlist, _, _ = select.select( [sys.stdin, self._readPipe[0]], [], [] )
-
-        if self._readPipe[0] in rlist:
-            return None
-
-        if (stdinRead := sys.stdin.read(1)) == "\033":  # Check if the stream start with an escape sequence
-            _fl = fcntl.fcntl(_fn, fcntl.F_GETFL)
-            fcntl.fcntl(_fn, fcntl.F_SETFL, _fl | os.O_NONBLOCK) # Set the input as NONBLOCK to read the full sequence
-            stdinRead += sys.stdin.read(20)       # Check if the stream start with an escape sequence
-            if stdinRead.startswith("\033[<"):    # Clear the buffer if this is a mouse code
-                sys.stdin.read(0x40)
-            fcntl.fcntl(_fn, fcntl.F_SETFL, _fl)
-        termios.tcsetattr(_fn, termios.TCSANOW, _attr)
-        return stdinRead
-
     def read(self):
-        return self._inputs.get()
+        token, self._readTime = self._inputs.get()
+        return token
+
+    def readTime(self):
+        '''The :func:`time.perf_counter` time of the read that returned the last token'''
+        return self._readTime
@@ -22,7 +22,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import sys, os, signal
+import sys, os, signal, select
 
 try: import termios
 except Exception as e:
@@ -34,6 +34,27 @@ class TTkTerm():
     ALT_SCREEN    = "\033[?1049h"                       #* Switch to alternate screen
     NORMAL_SCREEN = "\033[?1049l"                       #* Switch to normal screen
 
+    class Sync():
+        # Synchronized Output (DEC private mode 2026)
+        # https://gist.github.com/christianparpart/d8a62cc1ab659194337d73e399004036
+        BEGIN = "\033[?2026h" # Begin the synchronized update, the terminal keeps showing the last frame
+        END   = "\033[?2026l" # End the synchronized update, the terminal renders the new frame
+        QUERY = "\033[?2026$p" # DECRQM, the terminal replies with "\033[?2026;<status>$y" if it knows the mode
+
+    class Scroll():
+        # Scrolling region (DECSTBM), the rows are shifted with IND/RI at the region margins
+        RESET = "\033[r" # Reset the scrolling region to the whole screen, the cursor is moved home
+        UP    = "\033D"  # IND, at the bottom margin scroll the region up by one row
+        DOWN  = "\033M"  # RI, at the top margin scroll the region down by one row
+
+        @staticmethod
+        def region(top:int, bottom:int)->str: return f'\033[{top};{bottom}r'
+
+    class Paste():
+        # Bracketed Paste, the pasted text is enclosed in "\033[200~" ... "\033[201~"
+        ON  = "\033[?2004h"
+        OFF = "\033[?2004l"
+
     class Mouse():
         ON         = "\033[?1002h\033[?1015h\033[?1006h" # Enable reporting of mouse position on click and release
         OFF        = "\033[?1002l"                       # Disable mouse reporting
@@ -80,6 +101,27 @@ class TTkTerm():
         def hide():
             TTkTerm.push(TTkTerm.Cursor.HIDE)
 
+    class Capability():
+        ''' Optional terminal features used by the renderer,
+        initialized by :meth:`TTkTerm.init` '''
+        REP: bool = False
+        '''"Repeat the preceding character" (CSI n b) is supported'''
+        SYNC: bool = False
+        '''Synchronized output (DEC mode 2026) is supported,
+        probed with :attr:`TTkTerm.Sync.QUERY` and set when the terminal replies'''
+
+        @staticmethod
+        def detect():
+            term    = os.environ.get("TERM", "")
+            program = os.environ.get("TERM_PROGRAM", "")
+            vte     = os.environ.get("VTE_VERSION", "0")
+            # REP is not part of the VT100 set, enable it only for the terminals known to support it
+            TTkTerm.Capability.REP = (
+                "XTERM_VERSION" in os.environ or
+                term in ("xterm-kitty", "alacritty", "foot", "wezterm") or
+                program == "WezTerm" or
+                (vte.isdigit() and int(vte) >= 5200) )
+
     title: str = "TermTk"
     mouse: bool = True
     width: int = 0
@@ -87,32 +129,60 @@ class TTkTerm():
 
     _sigWinChCb = None
 
+    # Frame output buffer, the escape stream pushed between
+    # beginFrame() and endFrame() is written with a single os.write
+    _frameBuffer = None
+
+    bytesWritten: int = 0
+    '''Total number of bytes written to the terminal'''
+    writeCalls: int = 0
+    '''Total number of write syscalls issued to the terminal'''
+
     @staticmethod
     def init(mouse: bool = True, title: str = "TermTk"):
         TTkTerm.title = title
         TTkTerm.mouse = mouse
+        TTkTerm.Capability.detect()
         TTkTerm.push(TTkTerm.ALT_SCREEN + TTkTerm.CLEAR + TTkTerm.Cursor.HIDE + TTkTerm.escTitle(TTkTerm.title))
         if TTkTerm.mouse:
             TTkTerm.push(TTkTerm.Mouse.ON)
+        TTkTerm.push(TTkTerm.Paste.ON)
+        # The frames are not synchronized until the terminal confirms the support
+        TTkTerm.push(TTkTerm.Sync.QUERY)
         TTkTerm.setEcho(False)
 
+    @staticmethod
+    def modeReport(mode:int, status:int):
+        '''Handle the DECRPM reply (\033[?<mode>;<status>$y) to a DECRQM query
+
+        :param int mode: the DEC private mode
+        :param int status: 0 = not recognized, 1 = set, 2 = reset, 3 = permanently set, 4 = permanently reset
+        '''
+        if mode == 2026:
+            TTkTerm.Capability.SYNC = status in (1,2,3)
+
     @staticmethod
     def exit():
-        TTkTerm.push(TTkTerm.Mouse.OFF + TTkTerm.Mouse.DIRECT_OFF)
-        TTkTerm.push(TTkTerm.CLEAR + TTkTerm.NORMAL_SCREEN + TTkTerm.Cursor.SHOW + TTkTerm.escTitle())
+        TTkTerm._pushNow(
+            TTkTerm.Mouse.OFF + TTkTerm.Mouse.DIRECT_OFF + TTkTerm.Paste.OFF +
+            TTkTerm.CLEAR + TTkTerm.NORMAL_SCREEN + TTkTerm.Cursor.SHOW + TTkTerm.escTitle())
         TTkTerm.setEcho(True)
 
     @staticmethod
     def stop():
-        TTkTerm.push(TTkTerm.Mouse.OFF + TTkTerm.Mouse.DIRECT_OFF)
-        TTkTerm.push(TTkTerm.CLEAR + TTkTerm.NORMAL_SCREEN + TTkTerm.Cursor.SHOW + TTkTerm.escTitle())
+        # Called from the SIGTSTP handler, possibly in the middle of a frame,
+        # the terminal must be restored before the process is stopped
+        TTkTerm._pushNow(
+            TTkTerm.Mouse.OFF + TTkTerm.Mouse.DIRECT_OFF + TTkTerm.Paste.OFF +
+            TTkTerm.CLEAR + TTkTerm.NORMAL_SCREEN + TTkTerm.Cursor.SHOW + TTkTerm.escTitle())
         TTkTerm.setEcho(True)
 
     @staticmethod
     def cont():
-        TTkTerm.push(TTkTerm.ALT_SCREEN + TTkTerm.CLEAR + TTkTerm.Cursor.HIDE + TTkTerm.escTitle(TTkTerm.title))
-        if TTkTerm.mouse:
-            TTkTerm.push(TTkTerm.Mouse.ON)
+        TTkTerm._pushNow(
+            TTkTerm.ALT_SCREEN + TTkTerm.CLEAR + TTkTerm.Cursor.HIDE + TTkTerm.escTitle(TTkTerm.title) +
+            (TTkTerm.Mouse.ON if TTkTerm.mouse else "") +
+            TTkTerm.Paste.ON + TTkTerm.Sync.QUERY)
         TTkTerm.setEcho(False)
 
     @staticmethod
@@ -125,8 +195,61 @@ class TTkTerm():
 
     @staticmethod
     def push(*args):
-        sys.stdout.write(str(*args))
+        if TTkTerm._frameBuffer is not None:
+            TTkTerm._frameBuffer.append(str(*args))
+        else:
+            TTkTerm._write(str(*args))
+
+    @staticmethod
+    def _pushNow(txt):
+        '''Write txt immediately, the open frame (if any) is flushed and closed first
+        so the sequence is not held back until :meth:`endFrame`'''
+        TTkTerm.endFrame()
+        TTkTerm._write(txt)
+
+    @staticmethod
+    def beginFrame():
+        '''Start collecting the pushed escape stream until :meth:`endFrame` is called'''
+        if TTkTerm._frameBuffer is None:
+            TTkTerm._frameBuffer = []
+
+    @staticmethod
+    def endFrame():
+        '''Write the escape stream collected since :meth:`beginFrame`'''
+        if (frame := TTkTerm._frameBuffer) is None: return
+        TTkTerm._frameBuffer = None
+        if not frame: return
+        if TTkTerm.Capability.SYNC:
+            # Avoid the tearing, the terminal renders the frame only when it is complete
+            TTkTerm._write(TTkTerm.Sync.BEGIN + ''.join(frame) + TTkTerm.Sync.END)
+        else:
+            TTkTerm._write(''.join(frame))
+
+    @staticmethod
+    def _write(txt):
+        try:
+            fd = sys.stdout.fileno()
+        except Exception:
+            # stdout is not a real file (i.e. captured by a test framework)
+            sys.stdout.write(txt)
+            sys.stdout.flush()
+            TTkTerm.writeCalls += 1
+            TTkTerm.bytesWritten += len(txt.encode(sys.stdout.encoding or 'utf-8'))
+            return
+        # Anything previously written through sys.stdout goes out first
         sys.stdout.flush()
+        data = memoryview(txt.encode(sys.stdout.encoding or 'utf-8'))
+        while data:
+            try:
+                n = os.write(fd, data)
+            except BlockingIOError:
+                # stdout is non blocking and the terminal is not draining fast enough,
+                # wait until it is writable again instead of dropping the rest of the frame
+                select.select([], [fd], [])
+                continue
+            TTkTerm.writeCalls += 1
+            TTkTerm.bytesWritten += n
+            data = data[n:]
 
     @staticmethod
     def flush():
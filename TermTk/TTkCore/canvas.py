@@ -22,17 +22,39 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import weakref
+from array import array
+
 from TermTk.TTkCore.TTkTerm.term import TTkTerm
+from TermTk.TTkCore.TTkTerm.colors import TTkTermColor
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.cfg import TTkCfg
-from TermTk.TTkCore.color import TTkColor
+from TermTk.TTkCore.color import TTkColor, _TTkColor
 from TermTk.TTkCore.string import TTkString
 
+# The 'u' typecode is deprecated since python 3.13, use 'w' if available
+try:
+    array('w')
+    _GLYPH = 'w'
+except ValueError:
+    _GLYPH = 'u'
 
 class TTkCanvas:
     ''' Init the Canvas object
 
+    The canvas content is stored in compact per-row buffers:
+
+    * **_data**   - one :class:`array` of unicode glyphs per row
+    * **_colors** - one :class:`array` of interned color ids per row (see :meth:`~TermTk.TTkCore.color._TTkColor._getId`)
+
+    Glyphs that do not fit in a single code point are mapped to
+    private use area code points through :meth:`_glyph`
+
+    A double buffered canvas (the root canvas) records for each row
+    the span written since the last push (**_dirtyFrom**, **_dirtyTo**),
+    only those spans are compared with the previous frame in :meth:`pushToTerminalBuffered`
+
     :param  width: the width of the Canvas
     :param  height: the height of the Canvas
     '''
@@ -42,45 +64,153 @@ class TTkCanvas:
         '_theme',
         '_data', '_colors',
         '_bufferedData', '_bufferedColors',
-        '_visible', '_doubleBuffer')
+        '_dirtyFrom', '_dirtyTo', '_scrollHints',
+        '_visible', '_doubleBuffer',
+        '__weakref__')
+
+    # All the canvases, their color ids are remapped when the color table is compacted
+    _canvases = weakref.WeakSet()
+
+    # Glyphs (multi code point or empty strings) mapped to private use area chars
+    _glyphs = {}
+    _glyphsRev = {}
+
+    # (fromId, toId) -> SGR transition, at the _sgrDepth color depth
+    _sgrCache = {}
+    _sgrDepth = None
+
     def __init__(self, *args, **kwargs):
         self._widget = kwargs.get('widget', None)
         self._visible = True
         self._doubleBuffer = False
         self._width = 0
         self._height = 0
-        self._data = [[0]]
-        self._colors = [[TTkColor.RST]]
+        self._data = []
+        self._colors = []
+        self._dirtyFrom = array('i')
+        self._dirtyTo   = array('i')
+        self._scrollHints = []
         self._newWidth = kwargs.get('width', 0 )
         self._newHeight = kwargs.get('height', 0 )
         self.updateSize()
+        TTkCanvas._canvases.add(self)
         # self.resize(self._width, self._height)
         # TTkLog.debug((self._width, self._height))
 
+    @staticmethod
+    def _glyph(ch):
+        ''' .. caution:: Don't touch this!
+
+        Return a single char representing the glyph
+        '''
+        if len(ch) == 1: return ch
+        if (ret := TTkCanvas._glyphs.get(ch)) is None:
+            # Plane 16 Private Use Area, counting down from the last valid code point
+            ret = chr(0x10FFFD - len(TTkCanvas._glyphs))
+            TTkCanvas._glyphs[ch] = ret
+            TTkCanvas._glyphsRev[ord(ret)] = ch
+        return ret
+
+    @staticmethod
+    def _blankRows(w, h, glyph=' '):
+        data   = [array(_GLYPH, glyph)*w for _ in range(h)]
+        colors = [array('I', [TTkColor.RST._getId()])*w for _ in range(h)]
+        return data, colors
+
     def getWidget(self): return self._widget
 
     def enableDoubleBuffer(self):
         self._doubleBuffer = True
         self._bufferedData, self._bufferedColors = self.copy()
+        self._setDirty()
+
+    def _setDirty(self, dirty=True):
+        ''' .. caution:: Don't touch this!
+
+        Mark all the rows as dirty (or clean)
+        '''
+        w,h = self._width, self._height
+        self._dirtyFrom = array('i', [0 if dirty else w])*h
+        self._dirtyTo   = array('i', [w if dirty else 0])*h
+
+    def _markDirty(self, y, xa, xb):
+        ''' .. caution:: Don't touch this! '''
+        if xa < self._dirtyFrom[y]: self._dirtyFrom[y] = xa
+        if xb > self._dirtyTo[y]:   self._dirtyTo[y]   = xb
+
+    def addScrollHint(self, top, bottom, dy):
+        ''' Inform the double buffered canvas that the rows [top, bottom) have been shifted up by dy rows (down if negative)
+
+        The hint is verified in :meth:`pushToTerminalBuffered`, the terminal scrolling region
+        is used only if the shifted previous frame matches the new one better than the unshifted
+
+        :param  top: the first row of the area
+        :param  bottom: the row after the last one of the area
+        :param  dy: the number of rows
+        '''
+        if self._doubleBuffer and dy:
+            self._scrollHints.append((top, bottom, dy))
+
+    def _pushScroll(self, ansi):
+        ''' .. caution:: Don't touch this!
+
+        Shift the hinted areas using the terminal scrolling region
+        and align the buffer to the shifted terminal content
+        '''
+        hints, self._scrollHints = self._scrollHints, []
+        data, colors = self._data, self._colors
+        oldData, oldColors = self._bufferedData, self._bufferedColors
+        blankData, blankColors = TTkCanvas._blankRows(self._width, 1)
+        def _cost(y, oldD, oldC):
+            # Width of the span to be redrawn
+            spanD = _diffSpan(data[y], oldD, 0, self._width)
+            spanC = _diffSpan(colors[y], oldC, 0, self._width)
+            if spanD and spanC: return max(spanD[1],spanC[1]) - min(spanD[0],spanC[0])
+            if span := spanD or spanC: return span[1] - span[0]
+            return 0
+        for top, bottom, dy in hints:
+            top, bottom = max(0, top), min(self._height, bottom)
+            if abs(dy) >= bottom-top: continue
+            # The scrolling region spans the whole width, the rows are compared entirely;
+            # the exposed rows are compared with a blank one
+            costSame = costShifted = 0
+            for y in range(top, bottom):
+                costSame += _cost(y, oldData[y], oldColors[y])
+                if top <= y+dy < bottom:
+                    costShifted += _cost(y, oldData[y+dy], oldColors[y+dy])
+                else:
+                    costShifted += _cost(y, blankData[0], blankColors[0])
+            if costShifted + 16 + 2*abs(dy) >= costSame: continue
+            # The rows exposed by the scroll are blank with the default color,
+            # at the beginning of the frame no SGR is active
+            exposedData, exposedColors = TTkCanvas._blankRows(self._width, abs(dy))
+            ansi.append(TTkTerm.Scroll.region(top+1, bottom))
+            if dy > 0:
+                ansi.append(TTkTerm.Cursor.moveTo(bottom,1) + TTkTerm.Scroll.UP*dy)
+                oldData[top:bottom]   = oldData[top+dy:bottom]   + exposedData
+                oldColors[top:bottom] = oldColors[top+dy:bottom] + exposedColors
+            else:
+                ansi.append(TTkTerm.Cursor.moveTo(top+1,1) + TTkTerm.Scroll.DOWN*(-dy))
+                oldData[top:bottom]   = exposedData   + oldData[top:bottom+dy]
+                oldColors[top:bottom] = exposedColors + oldColors[top:bottom+dy]
+            ansi.append(TTkTerm.Scroll.RESET)
+            for y in range(top, bottom):
+                self._markDirty(y, 0, self._width)
 
     def updateSize(self):
         if not self._visible: return
         w,h = self._newWidth, self._newHeight
         if w  == self._width and h == self._height:
             return
-        self._data = [[]]*h
-        self._colors = [[]]*h
-        for i in range(0,h):
-            self._data[i] = [' ']*w
-            self._colors[i] = [TTkColor.RST]*w
+        self._data, self._colors = TTkCanvas._blankRows(w, h)
         if self._doubleBuffer:
-            self._bufferedData = [[]]*h
-            self._bufferedColors = [[]]*h
-            for i in range(0,h):
-                self._bufferedData[i] = ['']*w
-                self._bufferedColors[i] = [TTkColor.RST]*w
+            # Use a glyph that is never drawn to force the first push
+            self._bufferedData, self._bufferedColors = TTkCanvas._blankRows(w, h, TTkCanvas._glyph(''))
         self._height = h
         self._width  = w
+        if self._doubleBuffer:
+            self._scrollHints = []
+            self._setDirty()
 
     def size(self):
         return (self._width, self._height)
@@ -98,22 +228,15 @@ class TTkCanvas:
         if not self._visible: return
         x,y = pos
         w,h = size or (self._width, self._height)
+        blankData  = array(_GLYPH, ' ')*w
+        blankColor = array('I', [TTkColor.RST._getId()])*w
         for iy in range(y,y+h):
-            for ix in range(x,x+w):
-                self._data[iy][ix] = ' '
-                self._colors[iy][ix] = TTkColor.RST
+            self._data[iy][x:x+w]   = blankData
+            self._colors[iy][x:x+w] = blankColor
+            if self._doubleBuffer: self._markDirty(iy, x, x+w)
 
     def copy(self):
-        w,h = self._width, self._height
-        retData = [[]]*h
-        retColors = [[]]*h
-        for iy in range(h):
-            retData[iy] = [' ']*w
-            retColors[iy] = [TTkColor.RST]*w
-            for ix in range(w):
-                retData[iy][ix] = self._data[iy][ix]
-                retColors[iy][ix] = self._colors[iy][ix]
-        return retData, retColors
+        return [d[:] for d in self._data], [c[:] for c in self._colors]
 
     def hide(self):
         self._visible = False
@@ -124,8 +247,9 @@ class TTkCanvas:
     def _set(self, _y, _x, _ch, _col=TTkColor.RST):
         if 0 <= _y < self._height and \
            0 <= _x < self._width  :
-            self._data[_y][_x] = _ch
-            self._colors[_y][_x] = _col.mod(_x,_y)
+            self._data[_y][_x] = _ch if len(_ch)==1 else TTkCanvas._glyph(_ch)
+            self._colors[_y][_x] = _col.mod(_x,_y)._getId()
+            if self._doubleBuffer: self._markDirty(_y, _x, _x+1)
 
     def drawVLine(self, pos, size, color=TTkColor.RST):
         if size == 0: return
@@ -212,13 +336,13 @@ class TTkCanvas:
             txt, colors = text.tab2spaces().getData()
             if forceColor:
                 colors=[color]*len(colors)
-            for i in range(max(0,-x), min(len(txt),self._width-x)):
-                #self._set(y, x+i, txt[i-x], colors[i-x])
-                self._data[y][x+i] = txt[i]
-                if colors[i] == TTkColor.RST != color:
-                    self._colors[y][x+i] =  color.mod(x+i,y)
-                else:
-                    self._colors[y][x+i] =  colors[i].mod(x+i,y)
+            a, b = max(0,-x), min(len(txt),self._width-x)
+            if a >= b: return
+            if self._doubleBuffer: self._markDirty(y, x+a, x+b)
+            self._data[y][x+a:x+b] = array(_GLYPH, txt[a:b])
+            self._colors[y][x+a:x+b] = array('I', [
+                    (color if colors[i] == TTkColor.RST != color else colors[i]).mod(x+i,y)._getId()
+                    for i in range(a,b) ])
         else:
             text = text.replace('\t','    ')
             if lentxt < width:
@@ -237,9 +361,14 @@ class TTkCanvas:
             else:
                 text=text[:width]
 
-            arr = list(text)
-            for i in range(0, min(len(arr),self._width-x)):
-                self._set(y, x+i, arr[i], color)
+            a, b = max(0,-x), min(len(text),self._width-x)
+            if a >= b: return
+            if self._doubleBuffer: self._markDirty(y, x+a, x+b)
+            self._data[y][x+a:x+b] = array(_GLYPH, text[a:b])
+            if color._colorMod is None:
+                self._colors[y][x+a:x+b] = array('I', [color._getId()])*(b-a)
+            else:
+                self._colors[y][x+a:x+b] = array('I', [color.mod(x+i,y)._getId() for i in range(a,b)])
 
     def drawBoxTitle(self, pos, size, text, align=TTkK.CENTER_ALIGN, color=TTkColor.RST, colorText=TTkColor.RST, grid=0):
         if not self._visible: return
@@ -609,59 +738,217 @@ class TTkCanvas:
         wslice = w if x+w < bx+bw else bx+bw-x
         hslice = h if y+h < by+bh else by+bh-y
 
-
+        # Clip the slice once to the source canvas and to the destination origin,
+        # the source canvas may still have the old size if it was not repainted yet
+        xoffset = max(xoffset, -x)
+        yoffset = max(yoffset, -y)
+        wslice = min(wslice, canvas._width)
+        hslice = min(hslice, canvas._height)
+        if xoffset >= wslice or yoffset >= hslice: return
+
+        # Blit row by row, the slices have the same size
+        # so the destination rows are never resized
+        xa, xb = x+xoffset, x+wslice
+        dstData,   srcData   = self._data,   canvas._data
+        dstColors, srcColors = self._colors, canvas._colors
         for iy in range(yoffset,hslice):
-            for ix in range(xoffset,wslice):
-                #TTkLog.debug(f"PaintCanvas:{(ix,iy)}")
-                if iy > len(canvas._data)-1:
-                    TTkLog.debug(f"{canvas._width, canvas._height} - {(yoffset,hslice)}, {(xoffset,wslice)}, {slice}")
-                b = canvas._data[iy]
-                a = b[ix]
-                self._data[y+iy][x+ix]   = a # canvas._data[iy][ix]
-                self._colors[y+iy][x+ix] = canvas._colors[iy][ix]
+            dstData[y+iy][xa:xb]   = srcData[iy][xoffset:wslice]
+            dstColors[y+iy][xa:xb] = srcColors[iy][xoffset:wslice]
+        if self._doubleBuffer:
+            for iy in range(y+yoffset,y+hslice):
+                self._markDirty(iy, xa, xb)
 
     def pushToTerminal(self, x, y, w, h):
         # TTkLog.debug("pushToTerminal")
-        lastcolor = TTkColor.RST
+        TTkCanvas._compactColorIds()
+        TTkCanvas._sgrCheckDepth()
+        sgr = TTkCanvas._sgr
+        glyphs = TTkCanvas._glyphsRev
+        rstId = TTkColor.RST._getId()
         for y in range(0, self._height):
-            ansi = TTkColor.RST+TTkTerm.Cursor.moveTo(y+1,1)
+            ansi = [str(TTkColor.RST)+TTkTerm.Cursor.moveTo(y+1,1)]
+            lastId = rstId
+            data, colors = self._data[y], self._colors[y]
             for x in range(0, self._width):
-                ch = self._data[y][x]
-                color = self._colors[y][x]
-                if color != lastcolor:
-                    ansi += color-lastcolor
-                    lastcolor = color
-                ansi+=ch
-            TTkTerm.push(ansi)
+                if (cid := colors[x]) != lastId:
+                    ansi.append(sgr(lastId, cid))
+                    lastId = cid
+                ansi.append(data[x])
+            ansi = ''.join(ansi)
+            TTkTerm.push(ansi.translate(glyphs) if glyphs else ansi)
+
+    @staticmethod
+    def _compactColorIds():
+        ''' .. caution:: Don't touch this!
+
+        Reclaim the color ids not used by any canvas if the color table exceeds its limit
+        (:attr:`~TermTk.TTkCore.color._TTkColor.ID_TABLE_SIZE`),
+        called before pushing the frame when no id is held outside the canvases
+        '''
+        if len(_TTkColor._idTable) <= _TTkColor._idLimit: return
+        canvases = list(TTkCanvas._canvases)
+        # The reset color is always kept, it stays id 0
+        live = {TTkColor.RST._getId()}
+        for canvas in canvases:
+            for row in canvas._colors: live.update(row)
+            if canvas._doubleBuffer:
+                for row in canvas._bufferedColors: live.update(row)
+        remap = _TTkColor._compactIds(live)
+        lut = [0]*(max(remap)+1)
+        for old, new in remap.items(): lut[old] = new
+        lut = lut.__getitem__
+        for canvas in canvases:
+            canvas._colors = [array('I', map(lut, row)) for row in canvas._colors]
+            if canvas._doubleBuffer:
+                canvas._bufferedColors = [array('I', map(lut, row)) for row in canvas._bufferedColors]
+        TTkCanvas._sgrCache.clear()
+
+    @staticmethod
+    def _sgrCheckDepth():
+        ''' .. caution:: Don't touch this!
+
+        Drop the cached SGR transitions if the color depth is changed
+        '''
+        if TTkCanvas._sgrDepth != TTkCfg.color_depth:
+            TTkCanvas._sgrCache.clear()
+            TTkCanvas._sgrDepth = TTkCfg.color_depth
+
+    @staticmethod
+    def _sgr(fromId, toId):
+        ''' .. caution:: Don't touch this!
+
+        Return the (cached) shortest SGR transition between two interned colors
+        '''
+        if (ret := TTkCanvas._sgrCache.get((fromId, toId))) is None:
+            if len(TTkCanvas._sgrCache) > 0x4000:
+                TTkCanvas._sgrCache.clear()
+            c0 = _TTkColor._idTable[fromId]
+            c1 = _TTkColor._idTable[toId]
+            ret = TTkTermColor.sgrTransition((c0._fg,c0._bg,c0._mod),(c1._fg,c1._bg,c1._mod),TTkCanvas._sgrDepth)
+            TTkCanvas._sgrCache[(fromId, toId)] = ret
+        return ret
 
     def pushToTerminalBuffered(self, x, y, w, h):
+        ''' Push to the terminal only the cells changed since the last push
+
+        The escape stream is optimized for size:
+
+        * unchanged gaps inside a row are skipped with a relative move (CUF)
+          or rewritten if shorter
+        * blank runs use ECH (erase chars) or EL (erase to the end of the line)
+        * runs of the same glyph use REP if supported by the terminal (:class:`~TermTk.TTkCore.TTkTerm.term.TTkTerm.Capability`)
+        * the color changes use the shortest SGR transition at the :attr:`~TermTk.TTkCore.cfg.TTkCfg.color_depth` color depth
+        * the areas hinted with :meth:`addScrollHint` are shifted using the terminal scrolling region
+        '''
         # TTkLog.debug("pushToTerminal")
+        TTkCanvas._compactColorIds()
+        TTkCanvas._sgrCheckDepth()
+        colorTable = _TTkColor._idTable
+        glyphs = TTkCanvas._glyphsRev
+        sgr = TTkCanvas._sgr
+        moveTo, moveRight = TTkTerm.Cursor.moveTo, TTkTerm.Cursor.moveRight
+        rep = TTkTerm.Capability.REP
+        width = self._width
         oldData, oldColors = self._bufferedData, self._bufferedColors
-        lastcolor = TTkColor.RST
-        empty = True
-        ansi = ""
+        dirtyFrom, dirtyTo = self._dirtyFrom, self._dirtyTo
+        lastId = TTkColor.RST._getId()
+        ansi = []
+        if self._scrollHints:
+            self._pushScroll(ansi)
         for y in range(0, self._height):
-            for x in range(0, self._width):
-                if self._data[y][x] == oldData[y][x] and \
-                   self._colors[y][x] == oldColors[y][x]:
-                    if not empty:
-                        TTkTerm.push(ansi)
-                        empty=True
+            # Visit only the span written since the last push
+            if (xa := dirtyFrom[y]) >= (xb := dirtyTo[y]):
+                continue
+            data, colors = self._data[y], self._colors[y]
+            oldD, oldC = oldData[y], oldColors[y]
+            spanD = _diffSpan(data, oldD, xa, xb)
+            spanC = _diffSpan(colors, oldC, xa, xb)
+            if spanD and spanC:
+                xa, xb = min(spanD[0],spanC[0]), max(spanD[1],spanC[1])
+            elif spanD or spanC:
+                xa, xb = spanD or spanC
+            else:
+                continue
+            cur = None # Cursor column, None until the cursor is moved in this row
+            x = xa
+            while x < xb:
+                ch, cid = data[x], colors[x]
+                if ch == oldD[x] and cid == oldC[x]:
+                    x += 1
                     continue
-                ch = self._data[y][x]
-                color = self._colors[y][x]
-                if empty:
-                    ansi = TTkTerm.Cursor.moveTo(y+1,x+1)
-                    empty = False
-                if color != lastcolor:
-                    ansi += str(color-lastcolor)
-                    lastcolor = color
-                ansi+=ch
-            if not empty:
-                TTkTerm.push(ansi)
-                empty=True
+                # Move the cursor
+                if cur is None:
+                    ansi.append(moveTo(y+1,x+1))
+                elif cur < x:
+                    move = moveRight(x-cur)
+                    # Rewrite the unchanged gap if it is shorter than the relative move
+                    if x-cur < len(move) and all(colors[i]==lastId and ord(data[i])<0x80 for i in range(cur,x)):
+                        move = ''.join(data[cur:x])
+                    ansi.append(move)
+                cur = x
+                color = colorTable[cid]
+                # Blank run (with the default colors)
+                if ch == ' ' and not (color._fg or color._bg or color._mod):
+                    n = 1
+                    while x+n < width and data[x+n] == ' ' and colors[x+n] == cid: n += 1
+                    if x+n == width and n > 3:
+                        # Erase to the end of the line
+                        ansi.append(sgr(lastId,cid)+'\033[K')
+                        lastId = cid
+                        break
+                    if n > 8:
+                        # Erase n chars, the cursor does not move
+                        ansi.append(sgr(lastId,cid)+f'\033[{n}X')
+                        lastId = cid
+                        x += n
+                        continue
+                if cid != lastId:
+                    ansi.append(sgr(lastId,cid))
+                    lastId = cid
+                ansi.append(ch)
+                x += 1
+                cur = x
+                # Repeat the same glyph
+                if rep and ord(ch) not in glyphs:
+                    n = 0
+                    while x+n < xb and data[x+n] == ch and colors[x+n] == cid: n += 1
+                    if n and len(esc := f'\033[{n}b') < n*len(ch.encode()):
+                        ansi.append(esc)
+                        x += n
+                        cur = x
+            # Align the buffer to the pushed frame
+            oldD[xa:xb] = data[xa:xb]
+            oldC[xa:xb] = colors[xa:xb]
         # Reset the color at the end
-        TTkTerm.push(TTkColor.RST)
-        # Switch the buffer
-        self._bufferedData, self._bufferedColors = self._data, self._colors
-        self._data, self._colors = oldData, oldColors
+        if lastId != TTkColor.RST._getId():
+            ansi.append(str(TTkColor.RST))
+        if ansi:
+            ansi = ''.join(ansi)
+            TTkTerm.push(ansi.translate(glyphs) if glyphs else ansi)
+        self._setDirty(False)
+
+def _diffSpan(a, b, lo, hi):
+    ''' Return the smallest span (from, to) in [lo,hi) containing all the differences between the arrays a and b,
+    None if there are no differences.
+
+    The span is found bisecting the slices, the comparisons are done in C
+    and the cost is O(hi-lo) regardless of the position of the changes
+    '''
+    if lo == 0 and hi == len(a):
+        # Avoid the slice copies if the span is the whole row
+        if a == b: return None
+    elif a[lo:hi] == b[lo:hi]: return None
+    # First difference
+    l, h = lo, hi
+    while h-l > 1:
+        m = (l+h)//2
+        if a[l:m] == b[l:m]: l = m
+        else:                h = m
+    first = l
+    # Last difference
+    l, h = first, hi
+    while h-l > 1:
+        m = (l+h)//2
+        if a[m:h] == b[m:h]: h = m
+        else:                l = m
+    return first, l+1
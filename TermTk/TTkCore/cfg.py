@@ -23,17 +23,26 @@
 # SOFTWARE.
 
 from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkCore.TTkTerm.colors import TTkTermColor
 
 class TTkCfg:
     version="__VERSION__"
     name="__NAME__"
 
-    color_depth: int = TTkK.DEP_24
+    # Autodetected from $COLORTERM/$TERM, the rgb colors are quantized
+    # to the nearest 256/16 colors (no colors for DEP_2) if required.
+    # It can be forced with $TERMTK_COLOR_DEPTH (2, 4, 8 or 24) or assigned
+    # before starting the main loop (i.e. TTkCfg.color_depth = TTkK.DEP_24)
+    color_depth: int = TTkTermColor.detectDepth()
 
     maxFps = 35
     doubleBuffer = True
 
     scrollDelta = 5
+
+    # Mouse events merged in the main loop when they are queued faster than processed
+    coalesceMotion = True # Consecutive Drag/Move of the same button, only the last position is delivered
+    coalesceWheel  = True # Consecutive wheel steps, delivered as a single event (TTkMouseEvent.steps)
     theme = None
 
 class TTkGlbl:
@@ -23,6 +23,7 @@
 # SOFTWARE.
 
 from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkCore.cfg import TTkCfg
 from TermTk.TTkCore.helper import TTkHelper
 
 # Ansi Escape Codes:
@@ -61,15 +62,84 @@ from TermTk.TTkCore.helper import TTkHelper
 # [49m          2.53      set background color to default (black)
 
 class _TTkColor:
-    __slots__ = ('_fg','_bg','_mod', '_colorMod', '_buffer', '_clean')
+    ''' The colors are immutable and interned (flyweight),
+    the constructor returns the existing instance with the same attributes '''
+    __slots__ = ('_fg','_bg','_mod', '_colorMod', '_buffer', '_clean', '_id', '_idEpoch', '_hash')
     _fg: tuple; _bg: tuple; _mod: int
-    def __init__(self, fg:tuple=None, bg:tuple=None, mod:int=0, colorMod=None, clean=False):
-        self._fg  = fg
-        self._bg  = bg
-        self._mod = mod
-        self._clean = clean or not (fg or bg or mod)
-        self._colorMod = colorMod
-        self._buffer = None
+    # (class, fg, bg, mod, colorMod, clean) -> color
+    _interned = {}
+    # Interned color table used by the canvas to store
+    # a compact id instead of a color reference for each cell,
+    # the ids not used by any canvas are reclaimed (see TTkCanvas._compactColorIds)
+    # when the table exceeds _idLimit
+    ID_TABLE_SIZE = 0x4000
+    _idTable = []
+    _idMap = {}
+    _idLimit = ID_TABLE_SIZE
+    # Incremented by each compaction, the ids cached in the colors of a previous epoch are stale
+    _idTableEpoch = 0
+    def __new__(cls, fg:tuple=None, bg:tuple=None, mod:int=0, colorMod=None, clean=False):
+        clean = clean or not (fg or bg or mod)
+        key = (cls, fg, bg, mod, colorMod, clean)
+        if (ret := _TTkColor._interned.get(key)) is None:
+            # The colors are compared by value, the table can be dropped safely
+            if len(_TTkColor._interned) > 0x10000:
+                _TTkColor._interned.clear()
+            ret = super().__new__(cls)
+            ret._fg  = fg
+            ret._bg  = bg
+            ret._mod = mod
+            ret._clean = clean
+            ret._colorMod = colorMod
+            ret._buffer = None
+            ret._id = None
+            ret._idEpoch = -1
+            ret._hash = hash((fg, bg, mod))
+            _TTkColor._interned[key] = ret
+        return ret
+
+    def _getId(self) -> int:
+        ''' .. caution:: Don't touch this!
+
+        Return the interned id of this color,
+        the id is valid as long as the color is not modified
+        and until the table is compacted (:meth:`_compactIds`)
+        '''
+        if self._idEpoch != _TTkColor._idTableEpoch:
+            key = (self._fg, self._bg, self._mod, self._clean)
+            if (cid := _TTkColor._idMap.get(key)) is None:
+                cid = len(_TTkColor._idTable)
+                _TTkColor._idTable.append(self)
+                _TTkColor._idMap[key] = cid
+            self._id = cid
+            self._idEpoch = _TTkColor._idTableEpoch
+        return self._id
+
+    @staticmethod
+    def _compactIds(liveIds) -> dict:
+        ''' .. caution:: Don't touch this!
+
+        Drop from the table the colors whose id is not in liveIds,
+        the live colors are renumbered (keeping their order)
+
+        :param liveIds: the ids still referenced
+        :type liveIds: set
+
+        :return: the old id -> new id map of the live colors
+        :rtype: dict
+        '''
+        remap = {}
+        newTable = []
+        for cid, color in enumerate(_TTkColor._idTable):
+            if cid in liveIds:
+                remap[cid] = len(newTable)
+                newTable.append(color)
+        _TTkColor._idTable = newTable
+        _TTkColor._idMap = {(c._fg, c._bg, c._mod, c._clean):cid for cid,c in enumerate(newTable)}
+        _TTkColor._idTableEpoch += 1
+        # Avoid compacting every frame if most of the colors are in use
+        _TTkColor._idLimit = max(_TTkColor.ID_TABLE_SIZE, 2*len(newTable))
+        return remap
 
     def foreground(self):
         if self._fg:
@@ -118,15 +188,13 @@ class _TTkColor:
         return self._bg if self._bg else (0,0,0)
 
     def invertFgBg(self):
-        ret = self.copy()
-        ret._fg = self._bg
-        ret._bg = self._fg
-        return ret
+        return _TTkColor(self._bg, self._fg, self._mod, self._colorMod, self._clean)
 
     def __str__(self):
-        if not self._buffer:
-            self._buffer = TTkHelper.Color.rgb2ansi(self._fg,self._bg,self._mod,self._clean)
-        return self._buffer
+        # The escape sequence is cached with the color depth used
+        if not self._buffer or self._buffer[0] != TTkCfg.color_depth:
+            self._buffer = (TTkCfg.color_depth, TTkHelper.Color.rgb2ansi(self._fg,self._bg,self._mod,self._clean,TTkCfg.color_depth))
+        return self._buffer[1]
 
     def __eq__(self, other):
         if other is None: return False
@@ -135,11 +203,14 @@ class _TTkColor:
             self._bg  == other._bg and \
             self._mod == other._mod
 
+    def __hash__(self):
+        return self._hash
+
     # self + other
     def __add__(self, other):
         # TTkLog.debug("__add__")
         if other._clean:
-            return other.copy()
+            return other
         clean = self._clean
         fg:  str = other._fg or self._fg
         bg:  str = other._bg or self._bg
@@ -153,30 +224,24 @@ class _TTkColor:
         if ( None == self._bg  != other._bg  or
              None == self._fg  != other._fg  or
                      self._mod != other._mod ):
-            ret = self.copy()
-            ret._clean = True
-            return ret
+            return _TTkColor(self._fg, self._bg, self._mod, self._colorMod, True)
         return self
 
     def modParam(self, *args, **kwargs):
         if not self._colorMod: return self
-        ret = self.copy()
-        ret._colorMod.setParam(*args, **kwargs)
-        return ret
+        # The modifier is shared by all the copies of the color
+        self._colorMod.setParam(*args, **kwargs)
+        return self
 
     def mod(self, x , y):
         if self._colorMod is None: return self
         return self._colorMod.exec(x,y,self)
 
     def copy(self, modifier=True):
-        ret = _TTkColor()
-        ret._fg   = self._fg
-        ret._bg   = self._bg
-        ret._mod  = self._mod
-        ret._clean = self._clean
-        if modifier and self._colorMod:
-            ret._colorMod = self._colorMod.copy()
-        return ret
+        # The colors are immutable, there is no need to duplicate them
+        if modifier or not self._colorMod:
+            return self
+        return _TTkColor(self._fg, self._bg, self._mod, None, self._clean)
 
 class _TTkColorModifier():
     def __init__(self, *args, **kwargs): pass
@@ -205,16 +270,14 @@ class TTkColorGradient(_TTkColorModifier):
             b = max(min(255,b),0)
             return (r,g,b)
 
-        bname = str(color)
+        bname = (color._fg, color._bg, color._mod)
         # I made a buffer to keep all the gradient values to speed up the paint process
         if bname not in self._buffer:
             self._buffer[bname] = [None]*(256*2)
         id = self._val + y - 256
         if self._buffer[bname][id] is not None:
             return self._buffer[bname][id]
-        copy = color.copy(modifier=False)
-        copy._fg = _applyGradient(color._fg)
-        copy._bg = _applyGradient(color._bg)
+        copy = _TTkColor(_applyGradient(color._fg), _applyGradient(color._bg), color._mod, None, color._clean)
         self._buffer[bname][id] = copy
         return self._buffer[bname][id]
 
@@ -326,3 +389,7 @@ class TTkColor(_TTkColor):
         else:
             color = kwargs.get('color', "" )
         return TTkColor(bg=TTkColor.hexToRGB(color), colorMod=mod)
+
+# The Reset color is always interned as the first id (0)
+# so a zero filled buffer is a clean buffer
+TTkColor.RST._getId()
@@ -74,6 +74,8 @@ class TTkConstant:
     SCREEN_EVENT = 0x04
     QUIT_EVENT   = 0x08
     TIME_EVENT   = 0x10
+    TIMER_EVENT  = 0x20
+    SIGNAL_EVENT = 0x40
 
     HORIZONTAL = 0x01
     VERTICAL   = 0x02
@@ -289,9 +291,29 @@ class TTkConstant:
         '''Input Char Key'''
         SpecialKey = 0x0002
         '''Input Special Key'''
+        PasteText  = 0x0004
+        '''Bracketed Paste, the key is the whole pasted text'''
 
     Character  = KeyType.Character
     SpecialKey = KeyType.SpecialKey
+    PasteText  = KeyType.PasteText
+
+    class ConnectionType():
+        '''Signal/Slot connection types
+
+        Used by :meth:`~TermTk.TTkCore.signal.pyTTkSignal.connect`, the thread affinity of the slots is the main loop thread,
+        if the main loop is not running every slot is invoked immediately
+        '''
+        AutoConnection   = 0x00
+        '''(Default) The slot is invoked immediately if the signal is emitted in the main loop thread, otherwise it is queued'''
+        DirectConnection = 0x01
+        '''The slot is invoked immediately in the thread emitting the signal'''
+        QueuedConnection = 0x02
+        '''The slot is invoked by the main loop, in its thread'''
+
+    AutoConnection   = ConnectionType.AutoConnection
+    DirectConnection = ConnectionType.DirectConnection
+    QueuedConnection = ConnectionType.QueuedConnection
 
 
     class KeyModifier():
@@ -22,6 +22,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import bisect
+
 from TermTk.TTkCore.TTkTerm.colors import TTkTermColor
 from TermTk.TTkCore.TTkTerm.term import TTkTerm
 from TermTk.TTkCore.cfg import TTkCfg, TTkGlbl
@@ -32,12 +34,21 @@ class TTkHelper:
     _focusWidget = None
     _rootCanvas = None
     _rootWidget = None
-    _updateWidget = []
-    _updateBuffer  = []
+    # Dirty widgets, the dicts are used as ordered sets
+    _updateWidget = {}
+    _updateBuffer  = {}
+    _scrollHints = {}
+    _frameRequestCb = None
     _mousePos = (0,0)
     _cursorPos = [0,0]
     _cursor = False
     _cursorType = TTkTerm.Cursor.BLINKING_BLOCK
+
+    paintedWidgets: int = 0
+    '''Number of widgets repainted (paintEvent) in the last frame'''
+    composedWidgets: int = 0
+    '''Number of widgets composed to their parent canvas in the last frame'''
+
     class _Overlay():
         __slots__ = ('_widget','_prevFocus','_x','_y','_modal')
         def __init__(self,x,y,widget,prevFocus,modal):
@@ -47,26 +58,49 @@ class TTkHelper:
             widget.move(x,y)
     _overlay = []
 
-    class _Shortcut():
-        __slots__ = ('_letter','_widget')
-        def __init__(self, letter, widget):
-            self._letter = letter.lower()
-            self._widget = widget
-    _shortcut = []
+    # letter -> widgets, in the registration order
+    _shortcut = {}
+
+    class _FocusChain():
+        ''' The visible widgets of a root (widget or overlay) in tab order '''
+        __slots__ = ('_index','_tabPos','_tabWidgets')
+        def __init__(self, rootWidget):
+            self._index = {}
+            self._tabPos = []
+            self._tabWidgets = []
+            for pos, w in enumerate(rootWidget.rootLayout().iterWidgets()):
+                self._index[w] = pos
+                if w.focusPolicy() & TTkK.TabFocus == TTkK.TabFocus:
+                    self._tabPos.append(pos)
+                    self._tabWidgets.append(w)
+    # root -> _FocusChain, cleared when the widget tree or a focus policy change
+    _focusChain = {}
 
     @staticmethod
     def addShortcut(widget, letter):
-        TTkHelper._shortcut.append(TTkHelper._Shortcut(letter, widget))
+        TTkHelper._shortcut.setdefault(letter.lower(), []).append(widget)
 
     @staticmethod
     def execShortcut(letter, widget=None):
         if not isinstance(letter, str): return
-        for sc in TTkHelper._shortcut:
-            if sc._letter == letter.lower() and sc._widget.isVisible():
-                if not widget or TTkHelper.isParent(widget, sc._widget):
-                    sc._widget.shortcutEvent()
+        for scWidget in TTkHelper._shortcut.get(letter.lower(), ()):
+            if scWidget.isVisible():
+                if not widget or TTkHelper.isParent(widget, scWidget):
+                    scWidget.shortcutEvent()
                     return
 
+    @staticmethod
+    def clearFocusChain():
+        ''' Drop the cached tab order, to be called when the widget tree or a focus policy change '''
+        if TTkHelper._focusChain:
+            TTkHelper._focusChain = {}
+
+    @staticmethod
+    def _getFocusChain(rootWidget):
+        if (chain := TTkHelper._focusChain.get(rootWidget)) is None:
+            chain = TTkHelper._focusChain[rootWidget] = TTkHelper._FocusChain(rootWidget)
+        return chain
+
     @staticmethod
     def updateAll():
         if TTkHelper._rootWidget:
@@ -77,22 +111,39 @@ class TTkHelper:
     @staticmethod
     def addUpdateWidget(widget):
         if not widget.isVisible(): return
-        if widget not in TTkHelper._updateWidget:
-            TTkHelper._updateWidget.append(widget)
+        TTkHelper._updateWidget[widget] = None
+        TTkHelper.requestFrame()
 
     @staticmethod
     def addUpdateBuffer(canvas):
         if canvas is not TTkHelper._rootCanvas:
-            if canvas not in TTkHelper._updateBuffer:
-                TTkHelper._updateBuffer.append(canvas)
+            TTkHelper._updateBuffer[canvas] = None
+            TTkHelper.requestFrame()
+
+    @staticmethod
+    def registerFrameRequestCb(cb):
+        ''' Register the main loop callback used to schedule a new frame '''
+        TTkHelper._frameRequestCb = cb
+
+    @staticmethod
+    def requestFrame():
+        ''' Ask the main loop to paint a new frame (thread safe) '''
+        if TTkHelper._frameRequestCb is not None:
+            TTkHelper._frameRequestCb()
+
+    @staticmethod
+    def addScrollHint(widget, dy):
+        ''' Inform the renderer that the content of the widget has been shifted up by dy rows (down if negative) '''
+        TTkHelper._scrollHints[widget] = TTkHelper._scrollHints.get(widget, 0) + dy
 
     @staticmethod
     def registerRootWidget(widget):
         TTkHelper._rootCanvas = widget.getCanvas()
         TTkHelper._rootWidget = widget
         TTkHelper._rootCanvas.enableDoubleBuffer()
-        TTkHelper._updateBuffer = []
-        TTkHelper._updateWidget = []
+        TTkHelper._updateBuffer = {}
+        TTkHelper._updateWidget = {}
+        TTkHelper._scrollHints = {}
 
     @staticmethod
     def rootOverlay(widget):
@@ -238,25 +289,40 @@ class TTkHelper:
         if TTkHelper._rootCanvas is None:
             return
 
+        # The whole frame (including the cursor movements requested
+        # during the paintEvents) is sent to the terminal with a single write
+        TTkTerm.beginFrame()
+        try:
+            TTkHelper._paintAll()
+        finally:
+            TTkTerm.endFrame()
+
+    @staticmethod
+    def _paintAll():
         # Build a list of buffers to be repainted
-        updateBuffers = TTkHelper._updateBuffer.copy()
+        updateBuffers = TTkHelper._updateBuffer
         updateWidgets = TTkHelper._updateWidget.copy()
+        scrollHints = TTkHelper._scrollHints
 
         # TTkLog.debug(f"{len(TTkHelper._updateBuffer)} {len(TTkHelper._updateWidget)}")
+        # The parents of the updated widgets need to be repainted and composed,
+        # each chain is walked until a parent already reached by another one
+        walked = set()
         for widget in TTkHelper._updateWidget:
             if not widget.isVisible(): continue
             parent = widget.parentWidget()
-            while parent is not None:
-                if parent not in updateBuffers:
-                    updateBuffers.append(parent)
-                if parent not in updateWidgets:
-                    updateWidgets.append(parent)
+            while parent is not None and parent not in walked:
+                walked.add(parent)
+                updateBuffers[parent] = None
+                updateWidgets[parent] = None
                 parent = parent.parentWidget()
 
-        TTkHelper._updateBuffer = []
-        TTkHelper._updateWidget = []
+        TTkHelper._updateBuffer = {}
+        TTkHelper._updateWidget = {}
+        TTkHelper._scrollHints = {}
 
         # Paint all the canvas
+        painted = 0
         for widget in updateBuffers:
             if not widget.isVisible(): continue
             # Resize the canvas just before the paintEvent
@@ -264,22 +330,34 @@ class TTkHelper:
             widget.getCanvas().updateSize()
             widget.getCanvas().clean()
             widget.paintEvent()
+            painted += 1
 
         # Compose all the canvas to the parents
-        # From the deepest children to the bottom
+        # From the deepest children to the bottom,
+        # the widgets are grouped by their (cached) depth
+        levels = {}
+        for widget in updateWidgets:
+            levels.setdefault(TTkHelper.widgetDepth(widget), []).append(widget)
         pushToTerminal = False
-        sortedUpdateWidget = [ (w, TTkHelper.widgetDepth(w)) for w in updateWidgets]
-        sortedUpdateWidget = sorted(sortedUpdateWidget, key=lambda w: -w[1])
-        for w in sortedUpdateWidget:
-            widget = w[0]
-            if not widget.isVisible(): continue
-            pushToTerminal = True
-            widget.paintChildCanvas()
+        composed = 0
+        for depth in sorted(levels, reverse=True):
+            for widget in levels[depth]:
+                if not widget.isVisible(): continue
+                pushToTerminal = True
+                widget.paintChildCanvas()
+                composed += 1
+        TTkHelper.paintedWidgets  = painted
+        TTkHelper.composedWidgets = composed
 
         if pushToTerminal:
             if TTkHelper._cursor:
                 TTkTerm.Cursor.hide()
             if TTkCfg.doubleBuffer:
+                # The scrolled widgets are shifted in the terminal if possible
+                for widget, dy in scrollHints.items():
+                    if not dy or not widget.isVisible(): continue
+                    _, wy = TTkHelper.absPos(widget)
+                    TTkHelper._rootCanvas.addScrollHint(wy, wy+widget.height(), dy)
                 TTkHelper._rootCanvas.pushToTerminalBuffered(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
             else:
                 TTkHelper._rootCanvas.pushToTerminal(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
@@ -292,69 +370,69 @@ class TTkHelper:
     def widgetDepth(widget) -> int:
         if widget is None:
             return 0
-        return 1 + TTkHelper.widgetDepth(widget.parentWidget())
+        if (depth := widget._depthCache) is None:
+            depth = widget._depthCache = 1 + TTkHelper.widgetDepth(widget.parentWidget())
+        return depth
 
     @staticmethod
     def isParent(widget, parent):
-        if p := widget.parentWidget():
-            if p == parent:
-                return True
-            return TTkHelper.isParent(p, parent)
-        return False
+        # The parent can only be found (depth difference) levels above the widget
+        steps = TTkHelper.widgetDepth(widget) - TTkHelper.widgetDepth(parent)
+        if steps <= 0: return False
+        for _ in range(steps):
+            widget = widget.parentWidget()
+        return widget == parent
 
     @staticmethod
     def absPos(widget) -> (int,int):
-        wx, wy = 0,0
-        layout = widget.widgetItem()
+        if (pos := widget._absPosCache) is not None:
+            return pos
+        # Sum the positions of the layouts up to the parent widget
+        wx, wy = widget.pos()
+        layout = widget.widgetItem().parent()
         while layout:
+            if layout.layoutItemType == TTkK.WidgetItem:
+                px, py = TTkHelper.absPos(layout.widget())
+                wx, wy = wx+px, wy+py
+                break
             px, py = layout.pos()
             wx, wy = wx+px, wy+py
             layout = layout.parent()
-        return (wx, wy)
+        pos = widget._absPosCache = (wx, wy)
+        return pos
 
     @staticmethod
     def nextFocus(widget):
         rootWidget = TTkHelper.rootOverlay(widget)
         if not rootWidget:
             rootWidget =  TTkHelper._rootWidget
-        if widget == rootWidget:
-            widget = None
-        first = None
-        for w in rootWidget.rootLayout().iterWidgets():
-            if not first and w.focusPolicy() & TTkK.TabFocus == TTkK.TabFocus:
-                first = w
-            # TTkLog.debug(f"{w._name} {widget}")
-            if widget:
-                if w == widget:
-                    widget=None
-                continue
-            if w.focusPolicy() & TTkK.TabFocus == TTkK.TabFocus:
-                w.setFocus()
-                w.update()
-                return
-        if first:
-            first.setFocus()
-            first.update()
+        chain = TTkHelper._getFocusChain(rootWidget)
+        if not chain._tabWidgets: return
+        # The first tab focusable widget after this one, or the first one
+        if (pos := chain._index.get(widget)) is None:
+            w = chain._tabWidgets[0]
+        elif (i := bisect.bisect_right(chain._tabPos, pos)) < len(chain._tabWidgets):
+            w = chain._tabWidgets[i]
+        else:
+            w = chain._tabWidgets[0]
+        w.setFocus()
+        w.update()
 
     @staticmethod
     def prevFocus(widget):
         rootWidget = TTkHelper.rootOverlay(widget)
         if not rootWidget:
             rootWidget = TTkHelper._rootWidget
-        if widget == rootWidget:
-            widget = None
-        prev = None
-        for w in rootWidget.rootLayout().iterWidgets():
-            # TTkLog.debug(f"{w._name} {widget}")
-            if w == widget:
-                widget=None
-                if prev:
-                    break
-            if w.focusPolicy() & TTkK.TabFocus == TTkK.TabFocus:
-                prev = w
-        if prev:
-            prev.setFocus()
-            prev.update()
+        chain = TTkHelper._getFocusChain(rootWidget)
+        if not chain._tabWidgets: return
+        # The last tab focusable widget before this one, or the last one
+        if (pos := chain._index.get(widget)) is not None and \
+           (i := bisect.bisect_left(chain._tabPos, pos)) > 0:
+            w = chain._tabWidgets[i-1]
+        else:
+            w = chain._tabWidgets[-1]
+        w.setFocus()
+        w.update()
 
     @staticmethod
     def setFocus(widget):
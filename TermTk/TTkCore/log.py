@@ -28,6 +28,7 @@
 import inspect
 import logging
 from collections.abc import Callable, Set
+from TermTk.TTkCore.signal import pyTTkSlotEntry
 
 class _TTkContext:
     __slots__ = ['file', 'line', 'function']
@@ -76,12 +77,23 @@ class TTkLog:
 
     @staticmethod
     def _process_msg(mode: int, msg: str):
-        for cb in TTkLog._messageHandler:
+        dead = False
+        # The handlers are stored as the signal slots, see pyTTkSlotEntry
+        for func, ref in TTkLog._messageHandler:
+            if ref is not None and ref() is None:
+                dead = True
+                continue
             curframe = inspect.currentframe()
             calframe = inspect.getouterframes(curframe,1)
             if len(calframe) > 2:
                 ctx = _TTkContext(calframe[2])
-                cb(mode, ctx, msg)
+                if ref is None:
+                    func(mode, ctx, msg)
+                elif (obj := ref()) is not None:
+                    func(obj, mode, ctx, msg)
+        if dead:
+            TTkLog._messageHandler = [(func, ref) for func, ref in TTkLog._messageHandler
+                                      if ref is None or ref() is not None]
 
     @staticmethod
     def debug(msg):
@@ -109,4 +121,7 @@ class TTkLog:
 
     @staticmethod
     def installMessageHandler(mh: Callable):
-        TTkLog._messageHandler.append(mh)
+        '''Install a message handler,
+        the methods of the widgets (i.e. :class:`~TermTk.TTkWidgets.logviewer.TTkLogViewer`)
+        are referenced weakly and removed when the widget is collected'''
+        TTkLog._messageHandler = TTkLog._messageHandler + [pyTTkSlotEntry(mh)]
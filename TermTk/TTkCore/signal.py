@@ -56,6 +56,15 @@ Methods
 .. autofunction:: TermTk.pyTTkSignal
 .. autodecorator:: TermTk.pyTTkSlot
 '''
+
+import asyncio
+import inspect
+import threading
+import weakref
+from collections import deque
+
+from TermTk.TTkCore.constant import TTkK
+
 def pyTTkSlot(*args, **kwargs):
     def pyTTkSlot_d(func):
         # Add signature attributes to the function
@@ -64,10 +73,28 @@ def pyTTkSlot(*args, **kwargs):
     return pyTTkSlot_d
 
 def pyTTkSignal(*args, **kwargs):
+    '''Create a signal with the given argument types
+
+    The signal can be declared as a class attribute,
+    each instance gets its own signal, created the first time it is accessed
+    (the instance must have a __dict__, where the signal is stored)
+
+    .. code-block:: python
+
+        class MyWidget(TTkWidget):
+            valueChanged = pyTTkSignal(int)
+
+    The connected methods of the widgets are referenced weakly (the widget tree owns them),
+    any other slot is referenced strongly and keeps its object alive.
+
+    :param compressed: (keyword) the emissions in the same main loop iteration are delivered once, with the latest arguments,
+                       defaults to False, it is not compressed if the main loop is not running
+    :type compressed: bool, optional
+    '''
     return _pyTTkSignal_obj(*args, **kwargs)
 
 class _pyTTkSignal_obj():
-    __slots__ = ('_types', '_name', '_revision', '_connected_slots')
+    __slots__ = ('_types', '_name', '_revision', '_compressed', '_connected_slots', '_connection_types', '_attr')
     def __init__(self, *args, **kwargs):
         # ref: http://pyqt.sourceforge.net/Docs/PyQt5/signals_slots.html#PyQt5.QtCore.pyqtSignal
 
@@ -84,9 +111,32 @@ class _pyTTkSignal_obj():
         self._types = args
         self._name = kwargs.get('name', None)
         self._revision = kwargs.get('revision', 0)
+        # The emissions in the same main loop iteration are delivered once
+        # with the latest arguments, see _pyTTkSignalQueue
+        self._compressed = kwargs.get('compressed', False)
         self._connected_slots = []
+        # Slot -> ConnectionType, the AutoConnection slots are not included
+        self._connection_types = {}
+        # The class attribute name, if declared in a class
+        self._attr = None
 
-    def connect(self, slot):
+    def __set_name__(self, owner, name):
+        self._attr = name
+
+    def __get__(self, instance, owner=None):
+        # Declared as class attribute,
+        # the signal bound to the instance is created on its first access and stored in
+        # the instance __dict__, the following accesses do not reach this descriptor
+        if instance is None:
+            return self
+        if self._attr is None:
+            # Assigned after the class creation (i.e. the signal has the class itself as argument type)
+            self._attr = next(k for c in type(instance).__mro__ for k,v in vars(c).items() if v is self)
+        signal = _pyTTkSignal_obj(*self._types, name=self._name, revision=self._revision, compressed=self._compressed)
+        instance.__dict__[self._attr] = signal
+        return signal
+
+    def connect(self, slot, type=TTkK.AutoConnection):
         # ref: http://pyqt.sourceforge.net/Docs/PyQt5/signals_slots.html#connect
 
         # connect(slot[, type=PyQt5.QtCore.Qt.AutoConnection[, no_receiver_check=False]]) -> PyQt5.QtCore.QMetaObject.Connection
@@ -106,24 +156,228 @@ class _pyTTkSignal_obj():
                 if not issubclass(a,b):
                     error = "Decorated slot has no signature compatible: "+slot.__name__+str(slot._TTkslot_attr)+" != signal"+str(self._types)
                     raise TypeError(error)
-        if slot not in self._connected_slots:
-            self._connected_slots.append(slot)
+        entry = pyTTkSlotEntry(slot)
+        if entry not in self._connected_slots:
+            self._connected_slots = self._connected_slots + [entry]
+        if type == TTkK.AutoConnection:
+            self._connection_types.pop(entry, None)
+        else:
+            self._connection_types[entry] = type
 
     def disconnect(self, *args, **kwargs):
         for slot in args:
-            self._connected_slots.remove(slot)
+            entry = pyTTkSlotEntry(slot)
+            slots = list(self._connected_slots)
+            slots.remove(entry)
+            self._connected_slots = slots
+            self._connection_types.pop(entry, None)
 
     def emit(self, *args, **kwargs):
         if len(args) != len(self._types):
-            error = "func"+str(self._types)+" signal has "+str(len(self._types))+" argument(s) but "+str(len(args))+" provided"
-            raise TypeError(error)
-        for slot in self._connected_slots:
-            slot(*args, **kwargs)
+            raise TypeError(self._argsError(args))
+        mainThread = _pyTTkSignalQueue.mainThread
+        if mainThread is not None:
+            if self._compressed:
+                _pyTTkSignalQueue.compress(self, args, kwargs)
+                return
+            if self._connection_types or threading.get_ident() != mainThread:
+                self._deliver(mainThread, args, kwargs)
+                return
+        # Fast path, direct call in the main thread
+        slots = self._connected_slots
+        if not slots: return
+        if kwargs:
+            self._deliver(None, args, kwargs)
+            return
+        if len(slots) == 1:
+            func, ref = slots[0]
+            if ref is None:
+                func(*args)
+            elif (obj := ref()) is not None:
+                func(obj, *args)
+            else:
+                self._prune()
+            return
+        dead = False
+        for func, ref in slots:
+            if ref is None:
+                func(*args)
+            elif (obj := ref()) is not None:
+                func(obj, *args)
+            else:
+                dead = True
+        if dead:
+            self._prune()
+
+    def _argsError(self, args):
+        return "func"+str(self._types)+" signal has "+str(len(self._types))+" argument(s) but "+str(len(args))+" provided"
+
+    def _prune(self):
+        # The slots list is replaced (never changed in place),
+        # an emission in progress keeps iterating the previous one
+        alive = []
+        for entry in self._connected_slots:
+            if entry[1] is None or entry[1]() is not None:
+                alive.append(entry)
+            else:
+                self._connection_types.pop(entry, None)
+        self._connected_slots = alive
+
+    def _deliver(self, mainThread, args, kwargs):
+        # Without a main loop (mainThread is None) nothing would process the queue,
+        # every slot is called directly, as in the fast path of emit()
+        noLoop = mainThread is None
+        inMainThread = noLoop or threading.get_ident() == mainThread
+        dead = False
+        for entry in self._connected_slots:
+            func, ref = entry
+            if ref is not None:
+                if (obj := ref()) is None:
+                    dead = True
+                    continue
+                func = func.__get__(obj)
+            ctype = self._connection_types.get(entry, TTkK.AutoConnection)
+            if noLoop or ctype == TTkK.DirectConnection or (inMainThread and ctype == TTkK.AutoConnection):
+                func(*args, **kwargs)
+            else:
+                _pyTTkSignalQueue.post(func, args, kwargs)
+        if dead:
+            self._prune()
 
     def clear(self):
         self._connected_slots = []
+        self._connection_types = {}
 
     def forward(self):
         def _ret(*args, **kwargs):
             self.emit(*args, **kwargs)
         return _ret
+
+def pyTTkSlotEntry(slot):
+    '''Return the (function, reference) entry used to store a connected slot
+
+    The methods of the widgets are stored as (function, weakref to the widget),
+    the widgets are owned by the widget tree and the connection does not keep
+    a closed widget alive, the function is called with the widget as first argument.
+    Any other callable (function, lambda, signal emit, method of any other object, ...)
+    is stored as (slot, None) and keeps its receiver alive.
+    The coroutine functions (async def) are wrapped in a callable that schedules them as tasks.
+
+    The same slot always returns an equal entry, it can be used to find the connection
+
+    :param slot: the callable to be stored
+    :type slot: callable
+
+    :return: (function, weakref) or (function, None)
+    :rtype: tuple
+    '''
+    func = getattr(slot, '__func__', None)
+    obj  = getattr(slot, '__self__', None)
+    if func is not None and obj is not None:
+        # Imported here to avoid the import cycle with the widgets
+        from TermTk.TTkWidgets.widget import TTkWidget
+        if isinstance(obj, TTkWidget):
+            if inspect.iscoroutinefunction(func):
+                func = _pyTTkAsyncSlot(func)
+            return (func, weakref.ref(obj))
+    if inspect.iscoroutinefunction(slot):
+        return (_pyTTkAsyncSlot(slot), None)
+    return (slot, None)
+
+class _pyTTkAsyncSlot():
+    # The coroutine slots (async def) are scheduled as tasks
+    # in the running asyncio loop (see TTk.run)
+    _tasks = set()
+    __slots__ = ('_func',)
+    def __init__(self, func):
+        self._func = func
+
+    def __call__(self, *args, **kwargs):
+        task = asyncio.ensure_future(self._func(*args, **kwargs))
+        # Keep a reference until the task is done
+        _pyTTkAsyncSlot._tasks.add(task)
+        task.add_done_callback(_pyTTkAsyncSlot._tasks.discard)
+        return task
+
+    def __get__(self, instance, owner=None):
+        # Bind the wrapped widget method to the widget (see _pyTTkSignal_obj._deliver)
+        return _pyTTkAsyncSlot(self._func.__get__(instance, owner))
+
+    def __eq__(self, other):
+        if isinstance(other, _pyTTkAsyncSlot):
+            other = other._func
+        return self._func == other
+
+    def __hash__(self):
+        return hash(self._func)
+
+class _pyTTkSignalQueue():
+    # Queued connections, the slot calls are collected here and invoked
+    # in batch by the main loop (see TTk) in its thread,
+    # the compressed signals keep only the arguments of their last emission
+    mainThread = None
+    _wakeupCb = None
+    _calls = deque()
+    _compressed = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def register(mainThread, wakeupCb):
+        '''Register the main loop, the wakeupCb is called (from any thread) when :meth:`process` is required'''
+        with _pyTTkSignalQueue._lock:
+            _pyTTkSignalQueue.mainThread = mainThread
+            _pyTTkSignalQueue._wakeupCb = wakeupCb
+            pending = bool(_pyTTkSignalQueue._calls or _pyTTkSignalQueue._compressed)
+        if pending and wakeupCb is not None:
+            wakeupCb()
+
+    @staticmethod
+    def post(slot, args, kwargs):
+        with _pyTTkSignalQueue._lock:
+            # The main loop is woken once for all the calls queued before it processes them
+            wakeup = not (_pyTTkSignalQueue._calls or _pyTTkSignalQueue._compressed)
+            _pyTTkSignalQueue._calls.append((slot, args, kwargs))
+            wakeupCb = _pyTTkSignalQueue._wakeupCb
+        if wakeup and wakeupCb is not None:
+            wakeupCb()
+
+    @staticmethod
+    def compress(signal, args, kwargs):
+        with _pyTTkSignalQueue._lock:
+            wakeup = not (_pyTTkSignalQueue._calls or _pyTTkSignalQueue._compressed)
+            _pyTTkSignalQueue._compressed[signal] = (args, kwargs)
+            wakeupCb = _pyTTkSignalQueue._wakeupCb
+        if wakeup and wakeupCb is not None:
+            wakeupCb()
+
+    @staticmethod
+    def process():
+        '''Invoke the queued slots and deliver the compressed signals, called by the main loop
+
+        :return: True if any slot call or signal was delivered
+        :rtype: bool
+        '''
+        # The slots may emit compressed signals again,
+        # the chained emissions are delivered in the next rounds
+        delivered = False
+        for _ in range(0x10):
+            with _pyTTkSignalQueue._lock:
+                calls = _pyTTkSignalQueue._calls
+                compressed = _pyTTkSignalQueue._compressed
+                if not (calls or compressed): return delivered
+                _pyTTkSignalQueue._calls = deque()
+                _pyTTkSignalQueue._compressed = {}
+            delivered = True
+            for slot, args, kwargs in calls:
+                slot(*args, **kwargs)
+            mainThread = _pyTTkSignalQueue.mainThread
+            for signal, (args, kwargs) in compressed.items():
+                signal._deliver(mainThread, args, kwargs)
+        # Too many chained emissions, the remaining ones are left to the next iteration,
+        # the loop is woken again since the queue is not empty and post/compress will not do it
+        with _pyTTkSignalQueue._lock:
+            pending = bool(_pyTTkSignalQueue._calls or _pyTTkSignalQueue._compressed)
+            wakeupCb = _pyTTkSignalQueue._wakeupCb
+        if pending and wakeupCb is not None:
+            wakeupCb()
+        return delivered
@@ -23,57 +23,104 @@
 # SOFTWARE.
 
 import threading, time
+import heapq
 
 from TermTk.TTkCore.signal import pyTTkSlot, pyTTkSignal
 
 
-class TTkTimer(threading.Thread):
-    _timers = []
-    __slots__ = (
-        'timeout', '_timerEvent',
-        '_delay', '_delayLock', '_quit',
-        '_stopTime')
+class TTkTimer():
+    '''Single shot timer, the :attr:`timeout` signal is emitted
+    in the main loop thread once the interval is elapsed.
+
+    All the timers share a single scheduler driven by the main loop,
+    the pending timeouts are kept in a heap ordered by deadline.
+    '''
+    # Heap of (deadline, id, timer), a restarted or stopped timer
+    # leaves a stale entry (id != timer._id) discarded when it is popped
+    _heap = []
+    _lastId = 0
+    _lock = threading.Lock()
+    # Called when the first deadline changes (see TTk)
+    _wakeupCb = None
+
+    __slots__ = ('timeout', '_id', '__weakref__')
     def __init__(self):
         # Define Signals
         self.timeout = pyTTkSignal()
+        self._id = None
+
+    @staticmethod
+    def registerWakeupCb(cb):
+        '''Register the main loop callback invoked (from any thread) when the first deadline changes'''
+        TTkTimer._wakeupCb = cb
+
+    @staticmethod
+    def nextTimeout():
+        '''Seconds until the first pending timeout, None if there is no timer pending'''
+        heap = TTkTimer._heap
+        with TTkTimer._lock:
+            while heap and heap[0][1] != heap[0][2]._id:
+                heapq.heappop(heap)
+            if not heap: return None
+            return max(0, heap[0][0] - time.monotonic())
 
-        self._timerEvent = threading.Event()
-        self._quit = threading.Event()
-        self._stopTime = 0
-        self._delay=0
-        self._delayLock = threading.Lock()
-        threading.Thread.__init__(self)
-        TTkTimer._timers.append(self)
-        threading.Thread.start(self)
+    @staticmethod
+    def processTimers():
+        '''Emit the timeout of the expired timers, called by the main loop'''
+        heap = TTkTimer._heap
+        now = time.monotonic()
+        expired = []
+        with TTkTimer._lock:
+            while heap and heap[0][0] <= now:
+                _, tid, timer = heapq.heappop(heap)
+                if tid == timer._id:
+                    timer._id = None
+                    expired.append(timer)
+        for timer in expired:
+            timer.timeout.emit()
+
+    @staticmethod
+    def singleShot(sec, callback):
+        '''Call the callback after the given interval
+
+        :param sec: the interval in seconds
+        :type sec: float
+        :param callback: the function called in the main loop thread
+        :type callback: callable
+
+        :return: the timer, it can be used to :meth:`stop` the call
+        :rtype: :class:`TTkTimer`
+        '''
+        timer = TTkTimer()
+        timer.timeout.connect(callback)
+        timer.start(sec)
+        return timer
 
     @staticmethod
     def quitAll():
-        for timer in TTkTimer._timers:
-            timer.quit()
+        with TTkTimer._lock:
+            for _, _, timer in TTkTimer._heap:
+                timer._id = None
+            TTkTimer._heap.clear()
 
     def quit(self):
-        self._quit.set()
-        self._timerEvent.set()
-
-    def run(self):
-        while self._timerEvent.wait():
-            self._timerEvent.clear()
-            while self._delay > 0:
-                # self._delayLock.acquire()
-                delay = self._delay
-                self._delay = 0
-                # self._delayLock.release()
-                if self._quit.wait(delay):
-                    return
-            self.timeout.emit()
+        self.stop()
+
+    def isActive(self):
+        return self._id is not None
 
     @pyTTkSlot(int)
     def start(self, sec=0):
-        self._lastTime = time.time()
-        self._delay = sec
-        self._timerEvent.set()
+        # A running timer is rescheduled
+        with TTkTimer._lock:
+            TTkTimer._lastId += 1
+            self._id = TTkTimer._lastId
+            entry = (time.monotonic()+sec, self._id, self)
+            heapq.heappush(TTkTimer._heap, entry)
+            first = TTkTimer._heap[0] is entry
+        if first and (cb := TTkTimer._wakeupCb) is not None:
+            cb()
 
     @pyTTkSlot()
     def stop(self):
-        # TODO: Timer.stop()
-        self._stopTime = time.time()
+        self._id = None
@@ -26,12 +26,15 @@ import os
 import signal
 import time
 import queue
+import asyncio
+from time import perf_counter
 
 from TermTk.TTkCore.TTkTerm.input import TTkInput
+from TermTk.TTkCore.TTkTerm.readinputasync import ReadInputAsync
 from TermTk.TTkCore.TTkTerm.inputkey import TTkKeyEvent
 from TermTk.TTkCore.TTkTerm.inputmouse import TTkMouseEvent
 from TermTk.TTkCore.TTkTerm.term import TTkTerm
-from TermTk.TTkCore.signal import pyTTkSignal
+from TermTk.TTkCore.signal import pyTTkSignal, _pyTTkSignalQueue
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.cfg import *
@@ -42,23 +45,37 @@ from TermTk.TTkWidgets.widget import *
 class TTk(TTkWidget):
     __slots__ = (
         '_name', '_running', '_input',
-        '_events', '_key_events', '_mouse_events', '_screen_events',
+        '_events', '_lastMultiTap', '_latencyHook',
+        '_loop', '_loopDone', '_loopThread', '_drainPending', '_timersHandle',
         '_title',
-        #Signals
-        'eventKeyPress', 'eventMouse' )
+        '_timer', '_framePending', '_lastFrame')
+    # Max number of repaints in a frame for the compressed signals emitted while painting
+    MAX_SIGNAL_FRAMES = 4
+    # Signals
+    eventKeyPress = pyTTkSignal(TTkKeyEvent)
+    eventMouse    = pyTTkSignal(TTkMouseEvent)
 
     def __init__(self, *args, **kwargs):
         TTkWidget.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTk' )
-        self.eventKeyPress = pyTTkSignal(TTkKeyEvent)
-        self.eventMouse    = pyTTkSignal(TTkMouseEvent)
         self._running = False
         self._input = None
-        self._events = queue.Queue()
-        self._key_events = queue.Queue()
-        self._mouse_events = queue.Queue()
-        self._screen_events = queue.Queue()
+        # Single queue of (evtType, evt, readTime) records, filled by
+        # the input thread, the timers and the signal handlers
+        self._events = queue.SimpleQueue()
+        # Keep track of the multiTap to avoid the extra key release
+        self._lastMultiTap = False
+        self._latencyHook = None
+        # asyncio backend (see run)
+        self._loop = None
+        self._loopDone = None
+        self._loopThread = None
+        self._drainPending = False
+        self._timersHandle = None
         self._title = kwargs.get('title','TermTk')
+        self._timer = None
+        self._framePending = False
+        self._lastFrame = 0
         self.setFocusPolicy(TTkK.ClickFocus)
         self.hide()
         try:
@@ -82,6 +99,70 @@ class TTk(TTkWidget):
 
     def mainloop(self):
         '''Enters the main event loop and waits until :meth:`~quit` is called or the main widget is destroyed.'''
+        self._mainloopInit()
+        threading.Thread(target=self._input_thread, daemon=True).start()
+
+        self._running = True
+        TTkTerm.init(title=self._title)
+        while self._running:
+            # Main Loop, wait for the next event or the next timer
+            try:
+                batch = [self._events.get(timeout=TTkTimer.nextTimeout())]
+            except queue.Empty:
+                batch = []
+            # The timers are fired in this thread
+            TTkTimer.processTimers()
+            # All the queued events are processed in a single batch
+            try:
+                while True: batch.append(self._events.get_nowait())
+            except queue.Empty:
+                pass
+            self._processEvents(batch)
+        TTkTimer.registerWakeupCb(None)
+        _pyTTkSignalQueue.register(None, None)
+        TTkTerm.exit()
+
+    async def run(self):
+        '''Coroutine version of :meth:`mainloop`, the application runs in the asyncio loop of the caller
+        and this coroutine returns when :meth:`~quit` is called.
+
+        The terminal input is read through :meth:`asyncio.loop.add_reader`,
+        the :class:`~TermTk.TTkCore.timer.TTkTimer` (the frames included) are scheduled with :meth:`asyncio.loop.call_later`
+        and the slots are executed in the loop thread,
+        the slots can await any I/O (i.e. defined as **async def**) without extra threads.
+
+        ::
+
+            async def main():
+                root = TTk()
+                ...
+                await root.run()
+
+            asyncio.run(main())
+        '''
+        self._loop = asyncio.get_running_loop()
+        self._loopDone = self._loop.create_future()
+        self._mainloopInit()
+        self._scheduleTimers()
+
+        self._running = True
+        TTkTerm.init(title=self._title)
+        self._input = TTkInput(ReadInputAsync(self._loop))
+        self._input.get_key_async(self._inputCallback)
+        try:
+            await self._loopDone
+        finally:
+            self._running = False
+            self._input.close()
+            TTkTimer.registerWakeupCb(None)
+            _pyTTkSignalQueue.register(None, None)
+            if self._timersHandle is not None:
+                self._timersHandle.cancel()
+                self._timersHandle = None
+            self._loop = None
+            TTkTerm.exit()
+
+    def _mainloopInit(self):
         TTkLog.debug( "" )
         TTkLog.debug( "         ████████╗            ████████╗    " )
         TTkLog.debug( "         ╚══██╔══╝            ╚══██╔══╝    " )
@@ -105,131 +186,274 @@ class TTk(TTkWidget):
         else:
             TTkLog.debug("Signal Event Registered")
 
-
         TTkTerm.registerResizeCb(self._win_resize_cb)
-        threading.Thread(target=self._input_thread, daemon=True).start()
+        self._loopThread = threading.get_ident()
+        TTkTimer.registerWakeupCb(self._timersChanged)
+        # The queued signals are delivered in this thread
+        _pyTTkSignalQueue.register(self._loopThread, self._signalsQueued)
         self._timer = TTkTimer()
         self._timer.timeout.connect(self._time_event)
-        self._timer.start(0.1)
+        # The frames are painted only when requested by the widgets
+        TTkHelper.registerFrameRequestCb(self._requestFrame)
         self.show()
+        self._requestFrame()
 
-        self._running = True
-        # Keep track of the multiTap to avoid the extra key release
-        lastMultiTap = False
-        TTkTerm.init(title=self._title)
-        while self._running:
-            # Main Loop
-            evt = self._events.get()
-            if   evt is TTkK.MOUSE_EVENT:
-                mevt = self._mouse_events.get()
-                self.eventMouse.emit(mevt)
-
-                # Upload the global mouse position
-                # Mainly used by the drag pixmap display
-                TTkHelper.setMousePos((mevt.x,mevt.y))
-
-                # Avoid to broadcast a key release after a multitap event
-                if mevt.evt == TTkK.Release and lastMultiTap: continue
-                lastMultiTap = mevt.tap > 1
-
-                if ( TTkHelper.isDnD() and
-                     mevt.evt != TTkK.Drag   and
-                     mevt.evt != TTkK.Release ):
-                    # Clean Drag Drop status for any event that is not
-                    # Mouse Drag, Key Release
-                    TTkHelper.dndEnd()
-
-                # Mouse Events forwarded straight to the Focus widget:
-                #  - Drag
-                #  - Move
-                #  - Release
-                focusWidget = TTkHelper.getFocus()
-                if ( focusWidget is not None and
-                     mevt.evt != TTkK.Press  and
-                     mevt.key != TTkK.Wheel  and
-                     not TTkHelper.isDnD()   ) :
-                    x,y = TTkHelper.absPos(focusWidget)
-                    nmevt = mevt.clone(pos=(mevt.x-x, mevt.y-y))
-                    focusWidget.mouseEvent(nmevt)
-                else:
-                    # Sometimes the release event is not retrieved
-                    if ( focusWidget and
-                         focusWidget._pendingMouseRelease and
-                         not TTkHelper.isDnD() ):
-                        focusWidget.mouseEvent(nmevt.clone(evt=TTkK.Release))
-                        focusWidget._pendingMouseRelease = False
-                    # Adding this Crappy logic to handle a corner case in the drop routine
-                    # where the mouse is leaving any widget able to handle the drop event
-                    if not self.mouseEvent(mevt):
-                        if dndw := TTkHelper.dndWidget():
-                            dndw.dragLeaveEvent(TTkHelper.dndGetDrag().getDragLeaveEvent(mevt))
-                            TTkHelper.dndEnter(None)
-                        if mevt.evt == TTkK.Press and focusWidget:
-                            focusWidget.clearFocus()
-
-                # Clean the Drag and Drop in case of mouse release
-                if mevt.evt == TTkK.Release:
-                    TTkHelper.dndEnd()
-            elif evt is TTkK.KEY_EVENT:
-                keyHandled = False
-                kevt = self._key_events.get()
-                self.eventKeyPress.emit(kevt)
-                # TTkLog.debug(f"Key: {kevt}")
-                focusWidget = TTkHelper.getFocus()
-                # TTkLog.debug(f"{focusWidget}")
-                if focusWidget is not None:
-                    TTkHelper.execShortcut(kevt.key,focusWidget)
-                    keyHandled = focusWidget.keyEvent(kevt)
-                else:
-                    TTkHelper.execShortcut(kevt.key)
-                # Handle Next Focus Key Binding
-                if not keyHandled and \
-                   ((kevt.key == TTkK.Key_Tab and kevt.mod == TTkK.NoModifier) or
-                   ( kevt.key == TTkK.Key_Right )):
-                        TTkHelper.nextFocus(focusWidget if focusWidget else self)
-                # Handle Prev Focus Key Binding
-                if not keyHandled and \
-                   ((kevt.key == TTkK.Key_Tab and kevt.mod == TTkK.ShiftModifier) or
-                   ( kevt.key == TTkK.Key_Left )):
-                        TTkHelper.prevFocus(focusWidget if focusWidget else self)
-            elif evt is TTkK.TIME_EVENT:
-                size = os.get_terminal_size()
-                self.setGeometry(0,0,size.columns,size.lines)
-                TTkHelper.paintAll()
-                self._timer.start(1/TTkCfg.maxFps)
-                self._fps()
-                pass
-            elif evt is TTkK.SCREEN_EVENT:
+    def _postEvent(self, evtType, evt=None, readTime=0):
+        # Called from any thread, in the asyncio backend
+        # the queue is drained by a callback scheduled in the loop
+        self._events.put((evtType, evt, readTime))
+        if self._loop is not None and not self._drainPending:
+            self._drainPending = True
+            self._loop.call_soon_threadsafe(self._drainEvents)
+
+    def _signalsQueued(self):
+        # Called (from any thread) when a queued signal is emitted
+        self._postEvent(TTkK.SIGNAL_EVENT)
+
+    def _timersChanged(self):
+        # Called (from any thread) when the first timer deadline changes
+        if self._loop is not None:
+            if threading.get_ident() == self._loopThread:
+                self._scheduleTimers()
+            else:
+                self._loop.call_soon_threadsafe(self._scheduleTimers)
+        elif threading.get_ident() != self._loopThread:
+            # Wake up the main loop, it has to wait for the new deadline
+            self._events.put((TTkK.TIMER_EVENT, None, 0))
+
+    def _scheduleTimers(self):
+        # asyncio backend, a single loop timer is set to the first deadline
+        if self._timersHandle is not None:
+            self._timersHandle.cancel()
+            self._timersHandle = None
+        if (timeout := TTkTimer.nextTimeout()) is not None:
+            self._timersHandle = self._loop.call_later(timeout, self._fireTimers)
+
+    def _fireTimers(self):
+        self._timersHandle = None
+        if self._loopDone.done(): return
+        try:
+            TTkTimer.processTimers()
+        except Exception as e:
+            # Raised by run()
+            self._loopDone.set_exception(e)
+            return
+        self._scheduleTimers()
+
+    def _drainEvents(self):
+        self._drainPending = False
+        batch = []
+        try:
+            while True: batch.append(self._events.get_nowait())
+        except queue.Empty:
+            pass
+        if self._loopDone.done(): return
+        try:
+            self._processEvents(batch)
+        except Exception as e:
+            # Raised by run()
+            self._loopDone.set_exception(e)
+            return
+        if not self._running:
+            self._loopDone.set_result(None)
+
+    def _processEvents(self, batch):
+        # The batch is a list of (evtType, evt, readTime) records
+        paint = False
+        i, n = 0, len(batch)
+        while i < n:
+            evtType, evt, readTime = batch[i]
+            i += 1
+            if   evtType is TTkK.MOUSE_EVENT:
+                evt, i = self._coalesceMouse(evt, batch, i)
+                self._mouseEvent(evt)
+            elif evtType is TTkK.KEY_EVENT:
+                self._keyEvent(evt)
+            elif evtType is TTkK.TIME_EVENT:
+                # The frame is painted once, after the whole batch
+                paint = True
+                continue
+            elif evtType is TTkK.SIGNAL_EVENT:
+                _pyTTkSignalQueue.process()
+                continue
+            elif evtType is TTkK.TIMER_EVENT:
+                # Only used to wake up the loop, the timers are already processed
+                continue
+            elif evtType is TTkK.SCREEN_EVENT:
                 self.setGeometry(0,0,TTkGlbl.term_w,TTkGlbl.term_h)
                 TTkLog.info(f"Resize: w:{TTkGlbl.term_w}, h:{TTkGlbl.term_h}")
-            elif evt is TTkK.QUIT_EVENT:
+                continue
+            elif evtType is TTkK.QUIT_EVENT:
                 TTkLog.debug("Quit.")
-                break
+                self._running = False
+                return
             else:
-                TTkLog.error(f"Unhandled Event {evt}")
+                TTkLog.error(f"Unhandled Event {evtType}")
+                self._running = False
+                return
+            if self._latencyHook is not None:
+                self._latencyHook(evt, perf_counter() - readTime)
+        # The compressed signals emitted in this batch are delivered once
+        _pyTTkSignalQueue.process()
+        if paint:
+            # The terminal size is updated by the resize callback (SCREEN_EVENT)
+            self._framePending = False
+            self._lastFrame = time.time()
+            TTkHelper.paintAll()
+            # The compressed signals emitted during the paint/layout are delivered now,
+            # the updates requested by their slots are painted in this same frame
+            for _ in range(self.MAX_SIGNAL_FRAMES):
+                if not _pyTTkSignalQueue.process(): break
+                TTkHelper.paintAll()
+            self._fps()
+
+    def _mouseEvent(self, mevt):
+        self.eventMouse.emit(mevt)
+
+        # Upload the global mouse position
+        # Mainly used by the drag pixmap display
+        TTkHelper.setMousePos((mevt.x,mevt.y))
+
+        # Avoid to broadcast a key release after a multitap event
+        if mevt.evt == TTkK.Release and self._lastMultiTap: return
+        self._lastMultiTap = mevt.tap > 1
+
+        if ( TTkHelper.isDnD() and
+             mevt.evt != TTkK.Drag   and
+             mevt.evt != TTkK.Release ):
+            # Clean Drag Drop status for any event that is not
+            # Mouse Drag, Key Release
+            TTkHelper.dndEnd()
+
+        # Mouse Events forwarded straight to the Focus widget:
+        #  - Drag
+        #  - Move
+        #  - Release
+        focusWidget = TTkHelper.getFocus()
+        if ( focusWidget is not None and
+             mevt.evt != TTkK.Press  and
+             mevt.key != TTkK.Wheel  and
+             not TTkHelper.isDnD()   ) :
+            x,y = TTkHelper.absPos(focusWidget)
+            nmevt = mevt.clone(pos=(mevt.x-x, mevt.y-y))
+            focusWidget.mouseEvent(nmevt)
+        else:
+            # Sometimes the release event is not retrieved
+            if ( focusWidget and
+                 focusWidget._pendingMouseRelease and
+                 not TTkHelper.isDnD() ):
+                focusWidget.mouseEvent(nmevt.clone(evt=TTkK.Release))
+                focusWidget._pendingMouseRelease = False
+            # Adding this Crappy logic to handle a corner case in the drop routine
+            # where the mouse is leaving any widget able to handle the drop event
+            if not self.mouseEvent(mevt):
+                if dndw := TTkHelper.dndWidget():
+                    dndw.dragLeaveEvent(TTkHelper.dndGetDrag().getDragLeaveEvent(mevt))
+                    TTkHelper.dndEnter(None)
+                if mevt.evt == TTkK.Press and focusWidget:
+                    focusWidget.clearFocus()
+
+        # Clean the Drag and Drop in case of mouse release
+        if mevt.evt == TTkK.Release:
+            TTkHelper.dndEnd()
+
+    def _keyEvent(self, kevt):
+        keyHandled = False
+        self.eventKeyPress.emit(kevt)
+        # TTkLog.debug(f"Key: {kevt}")
+        focusWidget = TTkHelper.getFocus()
+        # TTkLog.debug(f"{focusWidget}")
+        if kevt.type == TTkK.PasteText:
+            # The pasted text is typed one char at time
+            # if the focus widget does not handle it
+            if focusWidget is not None and not focusWidget.pasteEvent(kevt.key):
+                for ch in kevt.key:
+                    if chevt := TTkKeyEvent.parse(ch):
+                        focusWidget.keyEvent(chevt)
+            return
+        if focusWidget is not None:
+            TTkHelper.execShortcut(kevt.key,focusWidget)
+            keyHandled = focusWidget.keyEvent(kevt)
+        else:
+            TTkHelper.execShortcut(kevt.key)
+        # Handle Next Focus Key Binding
+        if not keyHandled and \
+           ((kevt.key == TTkK.Key_Tab and kevt.mod == TTkK.NoModifier) or
+           ( kevt.key == TTkK.Key_Right )):
+                TTkHelper.nextFocus(focusWidget if focusWidget else self)
+        # Handle Prev Focus Key Binding
+        if not keyHandled and \
+           ((kevt.key == TTkK.Key_Tab and kevt.mod == TTkK.ShiftModifier) or
+           ( kevt.key == TTkK.Key_Left )):
+                TTkHelper.prevFocus(focusWidget if focusWidget else self)
+
+    def _coalesceMouse(self, mevt, batch, i):
+        # Merge the mouse events following this one in the batch:
+        #  - Drag/Move of the same button, only the last position is relevant
+        #  - Wheel steps in the same direction and position, accumulated in mevt.steps
+        if mevt.key == TTkK.Wheel:
+            if not TTkCfg.coalesceWheel: return mevt, i
+        elif mevt.evt == TTkK.Drag or mevt.evt == TTkK.Move:
+            if not TTkCfg.coalesceMotion: return mevt, i
+        else:
+            return mevt, i
+        steps = mevt.steps
+        while i < len(batch):
+            evtType, nevt, _ = batch[i]
+            if ( evtType is not TTkK.MOUSE_EVENT or
+                 nevt.key != mevt.key or nevt.evt != mevt.evt or nevt.mod != mevt.mod or
+                 ( mevt.key == TTkK.Wheel and (nevt.x != mevt.x or nevt.y != mevt.y) ) ):
                 break
-        TTkTerm.exit()
+            mevt = nevt
+            steps += mevt.steps
+            i += 1
+        if mevt.key == TTkK.Wheel:
+            mevt.steps = steps
+        return mevt, i
+
+    def setLatencyHook(self, hook):
+        '''Install an instrumentation hook to measure the input latency
+
+        The hook is called after each key/mouse event has been dispatched to the widgets
+        as **hook(evt, latency)** where **latency** is the time (sec) elapsed since
+        the input has been read from the terminal.
+
+        :param hook: the hook, None to remove it
+        :type hook: callable
+        '''
+        self._latencyHook = hook
 
     def _time_event(self):
-        self._events.put(TTkK.TIME_EVENT)
+        self._postEvent(TTkK.TIME_EVENT)
+
+    def _requestFrame(self):
+        # Called (from any thread) when a widget needs to be repainted,
+        # the requests are coalesced in a single frame and
+        # the frames are delayed to not exceed TTkCfg.maxFps
+        if self._framePending: return
+        self._framePending = True
+        delay = self._lastFrame + 1/TTkCfg.maxFps - time.time()
+        if delay > 0:
+            self._timer.start(delay)
+        else:
+            self._postEvent(TTkK.TIME_EVENT)
 
     def _win_resize_cb(self, width, height):
         TTkGlbl.term_w = int(width)
         TTkGlbl.term_h = int(height)
-        self._events.put(TTkK.SCREEN_EVENT)
+        self._postEvent(TTkK.SCREEN_EVENT)
+
+    def _inputCallback(self, kevt=None, mevt=None):
+        if kevt is not None:
+            self._postEvent(TTkK.KEY_EVENT, kevt, self._input.readTime())
+        if mevt is not None:
+            self._postEvent(TTkK.MOUSE_EVENT, mevt, self._input.readTime())
+        return self._running
 
     def _input_thread(self):
-        def _inputCallback(kevt=None, mevt=None):
-            if kevt is not None:
-                self._key_events.put(kevt)
-                self._events.put(TTkK.KEY_EVENT)
-            if mevt is not None:
-                self._mouse_events.put(mevt)
-                self._events.put(TTkK.MOUSE_EVENT)
-            return self._running
         # Start input key loop
         self._input = TTkInput()
-        self._input.get_key(_inputCallback)
+        self._input.get_key(self._inputCallback)
         self._input.close()
 
     def _canvas_thread(self):
@@ -237,8 +461,9 @@ class TTk(TTkWidget):
 
     def quit(self):
         '''Tells the application to exit with a return code.'''
-        self._events.put(TTkK.QUIT_EVENT)
+        self._postEvent(TTkK.QUIT_EVENT)
         TTkTimer.quitAll()
+        TTkHelper.registerFrameRequestCb(None)
         self._running = False
 
     def _SIGSTOP(self, signum, frame):
@@ -304,7 +304,8 @@ class TTkTextCursor():
                 p.anchor.set(line,pos)
         return self.insertText(text)
 
-    def insertText(self, text):
+    def insertText(self, text, moveCursor=False):
+        # moveCursor: place the cursors at the end of the inserted text
         l,b,c = 0,1,1
         if self.hasSelection():
             l,b,c = self._removeSelectedText()
@@ -319,10 +320,8 @@ class TTkTextCursor():
                 ttktext = TTkString(text, color)
 
             newLines = (self._document._dataLines[l].substring(to=p) + ttktext + self._document._dataLines[l].substring(fr=p)).split('\n')
-            self._document._dataLines[l] = newLines[0]
-            for nl in reversed(newLines[1:]):
-                self._document._dataLines.insert(l+1, nl)
-                c+=1
+            self._document._dataLines[l:l+1] = newLines
+            c += len(newLines)-1
 
             # 2 scenarios:
             #  1) No Newline(s) added
@@ -346,6 +345,11 @@ class TTkTextCursor():
                 diffPos = len(text.split('\n')[-1]) - p
             else:
                 diffPos = len(text)
+            if moveCursor:
+                pr.position.line += diffLine
+                pr.position.pos  += diffPos
+                pr.anchor.line = pr.position.line
+                pr.anchor.pos  = pr.position.pos
             for pp in self._properties[i+1:]:
                 if pp.position.line == l:
                     pp.position.pos  += diffPos
@@ -53,10 +53,13 @@ class TTkGridLayout(TTkLayout):
     :param int columnMinHeight: the minimum height of the column, optional, defaults to 0
     '''
 
-    __slots__ = ('_gridItems','_columnMinWidth','_columnMinHeight', '_rows', '_cols')
+    __slots__ = ('_gridItems','_columnMinWidth','_columnMinHeight', '_rows', '_cols', '_sizeHints')
+    # Maximum number of times the items are rearranged in a single update
+    MAX_ARRANGEMENTS = 4
     def __init__(self, *args, **kwargs):
         self._rows = 0
         self._cols = 0
+        self._sizeHints = None
         TTkLayout.__init__(self, *args, **kwargs)
         self._gridItems = [[]]
         self._columnMinWidth = kwargs.get('columnMinWidth',0)
@@ -75,6 +78,7 @@ class TTkGridLayout(TTkLayout):
     def _reshapeGrid(self, size):
         rows, cols = size
         self._rows, self._cols = size
+        self._sizeHints = None
 
         # remove extra rows
         if   rows < len(self._gridItems):
@@ -180,108 +184,99 @@ class TTkGridLayout(TTkLayout):
                 return item
         return None
 
+    def _setDirty(self):
+        self._sizeHints = None
+        TTkLayout._setDirty(self)
+
+    def _getSizeHints(self):
+        # The min/max sizes of the rows and cols are computed once
+        # and kept until the items or their size hints change (see TTkLayoutItem._invalidate)
+        if self._sizeHints is not None:
+            return self._sizeHints
+        rows, cols = self._rows, self._cols
+        # Map each cell to the item placed there (see itemAtPosition),
+        # only the layouts and the visible widgets are considered
+        cells = [[None]*cols for _ in range(rows)]
+        for gridRow in range(rows):
+            for gridCol in range(cols):
+                cells[gridRow][gridCol] = self._gridItems[gridRow][gridCol]
+        for item in self.children():
+            for gridRow in range(item._row, min(rows, item._row + item._rowspan)):
+                for gridCol in range(item._col, min(cols, item._col + item._colspan)):
+                    if cells[gridRow][gridCol] is None:
+                        cells[gridRow][gridCol] = item
+        for cellsRow in cells:
+            for gridCol, item in enumerate(cellsRow):
+                if item is not None and \
+                   item.layoutItemType == TTkK.WidgetItem and not item.widget()._visible:
+                    cellsRow[gridCol] = None
+
+        minColWidth, maxColWidth = [], []
+        for gridCol in range(cols):
+            items = [cells[gridRow][gridCol] for gridRow in range(rows) if cells[gridRow][gridCol] is not None]
+            if items:
+                minColWidth.append(max(0,       *(item.minimumWidthSpan(gridCol) for item in items)))
+                maxColWidth.append(min(0x10000, *(item.maximumWidthSpan(gridCol) for item in items)))
+            else:
+                minColWidth.append(self._columnMinWidth)
+                maxColWidth.append(self._columnMinWidth)
+        minRowHeight, maxRowHeight = [], []
+        for gridRow in range(rows):
+            items = [item for item in cells[gridRow] if item is not None]
+            if items:
+                minRowHeight.append(max(0,       *(item.minimumHeightSpan(gridRow) for item in items)))
+                maxRowHeight.append(min(0x10000, *(item.maximumHeightSpan(gridRow) for item in items)))
+            else:
+                minRowHeight.append(self._columnMinHeight)
+                maxRowHeight.append(self._columnMinHeight)
+
+        self._sizeHints = (minColWidth, maxColWidth, minRowHeight, maxRowHeight)
+        return self._sizeHints
+
     def minimumColWidth(self, gridCol: int) -> int:
-        colw = 0
-        anyItem = False
-        for gridRow in range(self._rows):
-            item = self.itemAtPosition(gridRow,gridCol)
-            if item is not None and \
-               ( item.layoutItemType == TTkK.LayoutItem or item.isVisible() ):
-                    anyItem = True
-                    w = item.minimumWidthSpan(gridCol)
-                    if colw < w:
-                        colw = w
-        if not anyItem:
-            return self._columnMinWidth
-        return colw
+        return self._getSizeHints()[0][gridCol]
 
     def minimumRowHeight(self, gridRow: int):
-        rowh = 0
-        anyItem = False
-        for gridCol in range(self._cols):
-            item = self.itemAtPosition(gridRow,gridCol)
-            if item is not None and \
-               ( item.layoutItemType == TTkK.LayoutItem or item.isVisible() ):
-                    anyItem = True
-                    h = item.minimumHeightSpan(gridRow)
-                    if rowh < h:
-                        rowh = h
-        if not anyItem:
-            return self._columnMinHeight
-        return rowh
+        return self._getSizeHints()[2][gridRow]
 
     def maximumColWidth(self, gridCol: int) -> int:
-        colw = 0x10000
-        anyItem = False
-        for gridRow in range(self._rows):
-            item = self.itemAtPosition(gridRow,gridCol)
-            if item is not None and \
-               ( item.layoutItemType == TTkK.LayoutItem or item.isVisible() ):
-                    anyItem = True
-                    w = item.maximumWidthSpan(gridCol)
-                    if colw > w:
-                        colw = w
-        if not anyItem:
-            return self._columnMinWidth
-        return colw
+        return self._getSizeHints()[1][gridCol]
 
     def maximumRowHeight(self, gridRow: int):
-        rowh = 0x10000
-        anyItem = False
-        for gridCol in range(self._cols):
-            item = self.itemAtPosition(gridRow,gridCol)
-            if item is not None and \
-               ( item.layoutItemType == TTkK.LayoutItem or item.isVisible() ):
-                    anyItem = True
-                    h = item.maximumHeightSpan(gridRow)
-                    if rowh > h:
-                        rowh = h
-        if not anyItem:
-            return self._columnMinHeight
-        return rowh
+        return self._getSizeHints()[3][gridRow]
 
     def minimumWidth(self) -> int:
         ''' process the widgets and get the min size '''
-        minw = 0
-        for gridCol in range(self._cols):
-            minw += self.minimumColWidth(gridCol)
-        return minw
+        return sum(self._getSizeHints()[0])
 
     def minimumHeight(self) -> int:
         ''' process the widgets and get the min size '''
-        minh = 0
-        for gridRow in range(self._rows):
-            minh += self.minimumRowHeight(gridRow)
-        return minh
+        return sum(self._getSizeHints()[2])
 
     def maximumWidth(self) -> int:
         ''' process the widgets and get the min size '''
         if not self._rows:
             return 0x1000
-        maxw = 0
-        for gridCol in range(self._cols):
-            maxw += self.maximumColWidth(gridCol)
-        return maxw
+        return sum(self._getSizeHints()[1])
 
     def maximumHeight(self) -> int:
         ''' process the widgets and get the min size '''
         if not self._cols:
             return 0x1000
-        maxh = 0
-        for gridRow in range(self._rows):
-            maxh += self.maximumRowHeight(gridRow)
-        return maxh
+        return sum(self._getSizeHints()[3])
 
 
-    def update(self, *args, **kwargs):
+    def _itemsSizes(self):
+        ''' Return the [pos,size] of each col and row '''
         _, _, w, h = self.geometry()
         newx, newy = 0, 0
 
         # Sorted List of minimum heights
         #                    min                        max                       val
         #  content IDs     0 1                          2                         3
-        sortedHeights = [ [i, self.minimumRowHeight(i), self.maximumRowHeight(i), -1] for i in range(self._rows) ]
-        sortedWidths  = [ [i, self.minimumColWidth(i),  self.maximumColWidth(i),  -1] for i in range(self._cols) ]
+        minColWidth, maxColWidth, minRowHeight, maxRowHeight = self._getSizeHints()
+        sortedHeights = [ [i, minRowHeight[i], maxRowHeight[i], -1] for i in range(self._rows) ]
+        sortedWidths  = [ [i, minColWidth[i],  maxColWidth[i],  -1] for i in range(self._cols) ]
         sortedHeights = sorted(sortedHeights, key=lambda h: h[1])
         sortedWidths  = sorted(sortedWidths,  key=lambda w: w[1])
 
@@ -341,18 +336,39 @@ class TTkGridLayout(TTkLayout):
 
         # TTkLog.debug(f"h:{horSizes} v:{vertSizes}")
 
-        # loop and set the geometry of any item
-        for item in self.children():
-            col = item._col
-            row = item._row
-            x,y = horSizes[col][0], vertSizes[row][0]
-            w = sum( horSizes[col+i][1]  for i in range(item._colspan) )
-            h = sum( vertSizes[row+i][1] for i in range(item._rowspan) )
-            item.setGeometry(x, y, w, h)
-            #TTkLog.debug(f"Children: {item.geometry()}")
-            if item.layoutItemType == TTkK.WidgetItem and not item.isEmpty():
-                #TTkLog.debug(f"Children name: {item.widget()._name}")
-                item.widget().update(*args, **kwargs)
-            elif item.layoutItemType == TTkK.LayoutItem:
-                item.update(*args, **kwargs)
+        return horSizes, vertSizes
+
+    def update(self, *args, **kwargs):
+        if not self._dirty:
+            # Nothing changed since the last arrangement, the items are only updated
+            for item in self.children():
+                if item.layoutItemType == TTkK.WidgetItem and not item.isEmpty():
+                    TTkLayout._updateWidget(item.widget(), *args, **kwargs)
+                elif item.layoutItemType == TTkK.LayoutItem:
+                    item.update(*args, **kwargs)
+            return True
+        # The arrangement is repeated if the items change the size hints or the size
+        # while they are placed (i.e. a scrollbar shown/hidden), unless a nested update already did it
+        for arrangement in range(TTkGridLayout.MAX_ARRANGEMENTS):
+            if not self._dirty: break
+            self._dirty = False
+            sizeHints, size = self._getSizeHints(), self.size()
+            horSizes, vertSizes = self._itemsSizes()
+            # loop and set the geometry of any item,
+            # the last arrangement is always completed
+            for item in self.children():
+                if arrangement < TTkGridLayout.MAX_ARRANGEMENTS-1 and \
+                   (self._sizeHints is not sizeHints or self.size() != size): break
+                col = item._col
+                row = item._row
+                x,y = horSizes[col][0], vertSizes[row][0]
+                w = sum( horSizes[col+i][1]  for i in range(item._colspan) )
+                h = sum( vertSizes[row+i][1] for i in range(item._rowspan) )
+                item.setGeometry(x, y, w, h)
+                #TTkLog.debug(f"Children: {item.geometry()}")
+                if item.layoutItemType == TTkK.WidgetItem and not item.isEmpty():
+                    #TTkLog.debug(f"Children name: {item.widget()._name}")
+                    TTkLayout._updateWidget(item.widget(), *args, **kwargs)
+                elif item.layoutItemType == TTkK.LayoutItem:
+                    item.update(*args, **kwargs)
         return True
@@ -27,6 +27,7 @@
 '''
 
 from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkCore.helper import TTkHelper
 
 class TTkLayoutItem:
     ''' :class:`~TTkLayoutItem` is the base class of layout Items inherited by :class:`~TTkLayout`, :class:`~TTkWidgetItem`, and all the derived layout managers.
@@ -50,7 +51,9 @@ class TTkLayoutItem:
         '_sMin', '_sMinVal',
         '_parent',
         '_alignment',
-        '_layoutItemType')
+        '_layoutItemType',
+        # The signals reference the connected methods weakly
+        '__weakref__')
     def __init__(self, *args, **kwargs):
         self._x = kwargs.get('x', 0 )
         self._y = kwargs.get('y', 0 )
@@ -114,6 +117,7 @@ class TTkLayoutItem:
     def setOffset(self, x, y):
         self._xOffset = x
         self._yOffset = y
+        self._geometryChanged()
 
     def setGeometry(self, x, y, w, h):
         self._x = x
@@ -126,6 +130,20 @@ class TTkLayoutItem:
     def setParent(self, parent):
         self._parent = parent
 
+    def _invalidate(self):
+        # The size hints of this item changed, the layouts above it
+        # need to recompute theirs and to rearrange their items
+        item = self
+        while item is not None:
+            if item.layoutItemType == TTkK.LayoutItem:
+                item._setDirty()
+            item = item._parent
+
+    def _geometryChanged(self):
+        # The parent layout indexes its items by row (see TTkLayout.itemsAtRow)
+        if self._parent is not None and self._parent.layoutItemType == TTkK.LayoutItem:
+            self._parent._hitRows = None
+
     @property
     def z(self): return self._z
     @z.setter
@@ -156,11 +174,15 @@ class TTkLayout(TTkLayoutItem):
         ║                            ║
         ╚════════════════════════════╝
     '''
-    __slots__ = ('_items', '_zSortedItems')
+    __slots__ = ('_items', '_zSortedItems', '_hitRows', '_dirty')
+    # Minimum number of items required to index them by row for the hit-testing (see itemsAtRow)
+    HIT_INDEX_MIN_ITEMS = 32
     def __init__(self, *args, **kwargs):
         TTkLayoutItem.__init__(self, *args, **kwargs)
         self._items = []
         self._zSortedItems = []
+        self._hitRows = None
+        self._dirty = True
         self.layoutItemType = TTkK.LayoutItem
 
     def children(self):
@@ -202,13 +224,41 @@ class TTkLayout(TTkLayoutItem):
 
     def _zSortItems(self):
         self._zSortedItems = sorted(self._items, key=lambda item: item.z)
+        self._hitRows = None
 
     @property
     def zSortedItems(self): return self._zSortedItems
 
+    def itemsAtRow(self, y):
+        ''' Return the items that may cover the row **y** (relative to this layout), from the topmost
+
+        | The hit-testing of the layouts with many items (i.e. a :class:`~TermTk.TTkWidgets.scrollarea.TTkScrollArea` or a :class:`~TermTk.TTkWidgets.listwidget.TTkListWidget`)
+          uses an index of the items by row, rebuilt only after the items, their z order or their geometry change.
+        | The smaller layouts return all their items.
+        '''
+        if len(self._items) < TTkLayout.HIT_INDEX_MIN_ITEMS:
+            return reversed(self._zSortedItems)
+        if (rows := self._hitRows) is None:
+            rows = self._hitRows = {}
+            for item in reversed(self._zSortedItems):
+                if item.layoutItemType == TTkK.WidgetItem and item.isEmpty(): continue
+                _, iy, _, ih = item.geometry()
+                if item.layoutItemType == TTkK.LayoutItem:
+                    # the nested layouts are hit inside their offset area (see TTkWidget._mouseEventLayoutHandle)
+                    _, ioy = item.offset()
+                    iy, ih = iy+ioy, ih-ioy
+                for row in range(iy, iy+ih):
+                    if (bucket := rows.get(row)) is None:
+                        rows[row] = [item]
+                    else:
+                        bucket.append(item)
+        return rows.get(y, ())
+
     def replaceItem(self, item, index):
         self._items[index] = item
         self._zSortItems()
+        TTkHelper.clearFocusChain()
+        self._invalidate()
         self.update()
         item.setParent(self)
         if item.layoutItemType == TTkK.WidgetItem:
@@ -222,6 +272,8 @@ class TTkLayout(TTkLayoutItem):
     def insertItem(self, index, item):
         self._items.insert(index, item)
         self._zSortItems()
+        TTkHelper.clearFocusChain()
+        self._invalidate()
         self.update()
         item.setParent(self)
         if item.layoutItemType == TTkK.WidgetItem:
@@ -245,6 +297,12 @@ class TTkLayout(TTkLayoutItem):
     def removeItem(self, item):
         if item in self._items:
             self._items.remove(item)
+            if item.layoutItemType == TTkK.WidgetItem:
+                item.widget()._clearCache(absPos=True, depth=True, visible=True)
+            elif item.layoutItemType == TTkK.LayoutItem:
+                item._clearCache(absPos=True, depth=True, visible=True)
+            TTkHelper.clearFocusChain()
+            self._invalidate()
         self._zSortItems()
 
     def removeWidget(self, widget):
@@ -292,8 +350,21 @@ class TTkLayout(TTkLayoutItem):
         ax, ay, aw, ah = self.geometry()
         if ax==x and ay==y and aw==w and ah==h: return
         TTkLayoutItem.setGeometry(self, x, y, w, h)
+        if ax!=x or ay!=y:
+            self._clearCache(absPos=True)
+        if aw!=w or ah!=h:
+            self._dirty = True
+        self._geometryChanged()
         self.update(repaint=True, updateLayout=True)
 
+    def _clearCache(self, absPos=False, depth=False, visible=False):
+        # Clear the cached geometry of the widgets placed in this layout (see TTkWidget._clearCache)
+        for item in self._items:
+            if item.layoutItemType == TTkK.WidgetItem:
+                item.widget()._clearCache(absPos, depth, visible)
+            elif item.layoutItemType == TTkK.LayoutItem:
+                item._clearCache(absPos, depth, visible)
+
     def fullWidgetAreaGeometry(self):
         if not self._items: return 0,0,0,0
         minx,miny,maxx,maxy = 0x10000,0x10000,-0x10000,-0x10000
@@ -305,11 +376,27 @@ class TTkLayout(TTkLayoutItem):
             maxy = max(maxy,y+h)
         return minx, miny, maxx-minx, maxy-miny
 
+    def _setDirty(self):
+        self._dirty = True
+
+    def isDirty(self) -> bool:
+        ''' Return True if the items or their size hints changed after the last :meth:`update` '''
+        return self._dirty
+
+    @staticmethod
+    def _updateWidget(widget, *args, **kwargs):
+        # The layout of a child widget is updated only if something changed inside it,
+        # a resize of the child already updates it (see TTkWidget.resize)
+        if kwargs.get('updateLayout') and not widget.rootLayout()._dirty:
+            kwargs['updateLayout'] = False
+        return widget.update(*args, **kwargs)
+
     def update(self, *args, **kwargs):
+        self._dirty = False
         ret = False
         for i in self.children():
             if i.layoutItemType == TTkK.WidgetItem and not i.isEmpty():
-                ret = ret or i.widget().update(*args, **kwargs)
+                ret = ret or TTkLayout._updateWidget(i.widget(), *args, **kwargs)
                 # TODO: Have a look at this:
                 # i.getCanvas().top()
             elif i.layoutItemType == TTkK.LayoutItem:
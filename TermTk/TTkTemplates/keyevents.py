@@ -50,6 +50,22 @@ class TKeyEvents():
         '''
         return False
 
+    def pasteEvent(self, txt:str) -> bool :
+        '''
+        This event handler, can be reimplemented in a subclass to receive the text pasted in the terminal (Bracketed Paste).
+
+        If the event is not handled, the text is delivered to :meth:`keyEvent` one char at time
+
+        .. note:: Reimplement this function to handle this event
+
+        :param txt: The pasted text
+        :type txt: str
+
+        :return: **True** if the event has been handled
+        :rtype: bool
+        '''
+        return False
+
     def keyEvent(self, evt) -> bool :
         '''
         This event handler, can be reimplemented in a subclass to receive key events for the widget.
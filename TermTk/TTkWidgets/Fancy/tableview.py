@@ -83,9 +83,10 @@ class _TTkFancyTableView(TTkAbstractScrollView):
             '_alignments', '_headerColor',
             '_columns', '_columnColors',
             '_tableDataId', '_tableDataText', '_tableDataWidget', '_shownWidgets',
-            '_selectColor', '_selected',
-            # Signals
-            'activated', 'doubleClicked')
+            '_selectColor', '_selected')
+    # Signals
+    activated     = pyTTkSignal(int) # Value
+    doubleClicked = pyTTkSignal(int) # Value
     def __init__(self, *args, **kwargs):
         self._tableDataId = []
         self._tableDataText = []
@@ -93,9 +94,6 @@ class _TTkFancyTableView(TTkAbstractScrollView):
         self._shownWidgets = []
         TTkAbstractScrollView.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , '_TTkFancyTableView' )
-        # define signals
-        self.activated = pyTTkSignal(int) # Value
-        self.doubleClicked = pyTTkSignal(int) # Value
 
         self._columns = kwargs.get('columns' , [-1] )
         self._alignments = [TTkK.NONE]*len(self._columns)
@@ -44,11 +44,9 @@ class _TTkDisplayedTreeItemControl(TTkCheckbox):
 
 
 class _TTkDisplayedTreeItem(TTkWidget):
-    __slots__ = ('_depth', '_control', '_text', '_id', '_clicked', '_treeWidgetItem', '_isLeaf' )
+    __slots__ = ('_depth', '_control', '_text', '_id', '_treeWidgetItem', '_isLeaf' )
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        #Signals
-        self._clicked = pyTTkSignal(bool, _TTkDisplayedTreeItem, TTkFancyTreeWidgetItem)
 
         self._name = kwargs.get('name' , '_TTkDisplayedTreeItem' )
         self._depth = kwargs.get('depth' , 0 )
@@ -73,6 +71,8 @@ class _TTkDisplayedTreeItem(TTkWidget):
             self._canvas.drawText(pos=(self._depth, 0), text="•")
         self._canvas.drawText(pos=(self._depth+2, 0), text=self._text)
 
+# The signal has the class itself as argument type, it is declared after the class
+_TTkDisplayedTreeItem._clicked = pyTTkSignal(bool, _TTkDisplayedTreeItem, TTkFancyTreeWidgetItem)
 
 class TTkFancyTreeWidget(TTkFancyTableView):
     __slots__ = ( '_topLevelItems')
@@ -27,11 +27,9 @@ from TermTk.TTkCore.signal import pyTTkSignal
 
 class TTkFancyTreeWidgetItem():
     __slots__ = ('_parent', '_data', '_children', '_expand', '_childIndicatorPolicy',
-        # Signals
-        'refreshData')
+        # The signals are created on their first access and stored in the __dict__
+        '__dict__')
     def __init__(self, *args, **kwargs):
-        # Signals
-        self.refreshData = pyTTkSignal(TTkFancyTreeWidgetItem)
         self._data = args[0]
         self._children = []
         self._childIndicatorPolicy = kwargs.get('childIndicatorPolicy', TTkK.DontShowIndicatorWhenChildless)
@@ -64,4 +62,7 @@ class TTkFancyTreeWidgetItem():
         return self._parent
 
     def children(self):
-        return self._children
\ No newline at end of file
+        return self._children
+
+# The signal has the class itself as argument type, it is declared after the class
+TTkFancyTreeWidgetItem.refreshData = pyTTkSignal(TTkFancyTreeWidgetItem)
@@ -35,17 +35,15 @@ from TermTk.TTkWidgets.TTkModelView.filetreewidgetitem import TTkFileTreeWidgetI
 from TermTk.TTkCore.signal import pyTTkSlot, pyTTkSignal
 
 class TTkFileTreeWidget(TTkTreeWidget):
-    __slots__ = ('_path', '_filter',
-                 # Signals
-                 'fileClicked', 'folderClicked', 'fileDoubleClicked', 'folderDoubleClicked', 'fileActivated', 'folderActivated')
+    __slots__ = ('_path', '_filter')
+    # Signals
+    fileClicked         = pyTTkSignal(TTkFileTreeWidgetItem)
+    folderClicked       = pyTTkSignal(TTkFileTreeWidgetItem)
+    fileDoubleClicked   = pyTTkSignal(TTkFileTreeWidgetItem)
+    folderDoubleClicked = pyTTkSignal(TTkFileTreeWidgetItem)
+    fileActivated       = pyTTkSignal(TTkFileTreeWidgetItem)
+    folderActivated     = pyTTkSignal(TTkFileTreeWidgetItem)
     def __init__(self, *args, **kwargs):
-        # Signals
-        self.fileClicked         = pyTTkSignal(TTkFileTreeWidgetItem)
-        self.folderClicked       = pyTTkSignal(TTkFileTreeWidgetItem)
-        self.fileDoubleClicked   = pyTTkSignal(TTkFileTreeWidgetItem)
-        self.folderDoubleClicked = pyTTkSignal(TTkFileTreeWidgetItem)
-        self.fileActivated       = pyTTkSignal(TTkFileTreeWidgetItem)
-        self.folderActivated     = pyTTkSignal(TTkFileTreeWidgetItem)
         TTkTreeWidget.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkFileTreeWidget' )
         self._path   = kwargs.get('path','.')
@@ -35,9 +35,14 @@ class TTkTreeWidget(TTkAbstractScrollView):
                   '_selectedId', '_selected', '_separatorSelected', '_mouseDelta',
                   '_headerColor', '_selectedColor', '_lineColor',
                   '_sortColumn', '_sortOrder',
-                  # Signals
-                  'itemChanged', 'itemClicked', 'itemDoubleClicked', 'itemExpanded', 'itemCollapsed', 'itemActivated'
                   )
+    # Signals
+    itemActivated     = pyTTkSignal(TTkTreeWidgetItem, int)
+    itemChanged       = pyTTkSignal(TTkTreeWidgetItem, int)
+    itemClicked       = pyTTkSignal(TTkTreeWidgetItem, int)
+    itemDoubleClicked = pyTTkSignal(TTkTreeWidgetItem, int)
+    itemExpanded      = pyTTkSignal(TTkTreeWidgetItem)
+    itemCollapsed     = pyTTkSignal(TTkTreeWidgetItem)
     @dataclass(frozen=True)
     class _Cache:
         item: TTkTreeWidgetItem
@@ -45,14 +50,6 @@ class TTkTreeWidget(TTkAbstractScrollView):
         data: list
 
     def __init__(self, *args, **kwargs):
-        # Signals
-        self.itemActivated     = pyTTkSignal(TTkTreeWidgetItem, int)
-        self.itemChanged       = pyTTkSignal(TTkTreeWidgetItem, int)
-        self.itemClicked       = pyTTkSignal(TTkTreeWidgetItem, int)
-        self.itemDoubleClicked = pyTTkSignal(TTkTreeWidgetItem, int)
-        self.itemExpanded      = pyTTkSignal(TTkTreeWidgetItem)
-        self.itemCollapsed     = pyTTkSignal(TTkTreeWidgetItem)
-
         super().__init__(*args, **kwargs)
         self._name = kwargs.get('name' , 'TTkTreeView' )
         self._selected = None
@@ -41,11 +41,10 @@ from TermTk.TTkLayouts.gridlayout import TTkGridLayout
 from TermTk.TTkTemplates.color import TColor
 
 class _TTkHueCanvas(TTkWidget):
-    __slots__ = ('_hueList', '_selected', 'colorPicked')
+    __slots__ = ('_hueList', '_selected')
+    # Signals
+    colorPicked = pyTTkSignal(int)
     def __init__(self, *args, **kwargs):
-        # signals
-        self.colorPicked=pyTTkSignal(int)
-
         TTkWidget.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , '_TTkHueCanvas' )
 
@@ -96,10 +95,10 @@ class _TTkHueCanvas(TTkWidget):
         _printSlice(5, 0xff0000, 0x0000ff, False)
 
 class _TTkColorCanvas(TTkWidget):
-    __slots__ = ('_hue', 'colorPicked', '_selected')
+    __slots__ = ('_hue', '_selected')
+    # Signals
+    colorPicked = pyTTkSignal(int)
     def __init__(self, *args, **kwargs):
-        # signals
-        self.colorPicked=pyTTkSignal(int)
         self._selected=(-1,-1)
         TTkWidget.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkColorPicker' )
@@ -171,9 +170,10 @@ class _TTkShowColor(TTkWidget,TColor):
 
 class _TTkColorButton(TTkButton):
     lastClicked = None
-    __slots__ = ('colorClicked','_custom')
+    __slots__ = ('_custom',)
+    # Signals
+    colorClicked = pyTTkSignal(TTkColor)
     def __init__(self, *args, **kwargs):
-        self.colorClicked = pyTTkSignal(TTkColor)
         TTkButton.__init__(self, *args, **kwargs)
         TColor.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , '_TTkColorButton' )
@@ -236,12 +236,10 @@ class TTkColorDialogPicker(TTkWindow,TColor):
         '_color',
         '_colorCanvas', '_hueCanvas',
         '_redLE', '_greenLE', '_blueRE', '_htmlLE',
-        # Signals
-        'colorSelected'
         )
+    # Signals
+    colorSelected = pyTTkSignal(TTkColor)
     def __init__(self, *args, **kwargs):
-        # Signals
-        self.colorSelected = pyTTkSignal(TTkColor)
         TTkWindow.__init__(self, *args, **kwargs)
         TColor.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkColorPicker' )
@@ -426,10 +424,10 @@ class TTkColorDialogPicker(TTkWindow,TColor):
         self._canvas.drawBoxTitle(pos=(0,17), size=(26,0), text=" Conrols ", align=TTkK.CENTER_ALIGN, color=color, colorText=TTkCfg.theme.frameTitleColor)
 
 class TTkColorButtonPicker(_TTkColorButton):
-    __slots__ = ('_type', 'colorSelected')
+    __slots__ = ('_type',)
+    # Signals
+    colorSelected = pyTTkSignal(TTkColor)
     def __init__(self, *args, **kwargs):
-        # Signals
-        self.colorSelected = pyTTkSignal(TTkColor)
         _TTkColorButton.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkColorButtonPicker' )
         self._custom = False
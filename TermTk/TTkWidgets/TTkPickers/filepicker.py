@@ -61,17 +61,14 @@ class TTkFileDialogPicker(TTkWindow):
     __slots__ = ('_path', '_recentPath', '_recentPathId', '_filters', '_filter', '_caption', '_fileMode',
                  # Widgets
                  '_fileTree', '_lookPath', '_btnPrev', '_btnNext', '_btnUp',
-                 '_fileName', '_fileType', '_btnOpen', '_btnCancel',
-                 # Signals
-                 'pathPicked', 'filePicked', 'filesPicked', 'folderPicked')
+                 '_fileName', '_fileType', '_btnOpen', '_btnCancel')
+    # Signals
+    pathPicked   = pyTTkSignal(str)
+    filePicked   = pyTTkSignal(str)
+    filesPicked  = pyTTkSignal(list)
+    folderPicked = pyTTkSignal(str)
 
     def __init__(self, *args, **kwargs):
-        # Signals
-        self.pathPicked = pyTTkSignal(str)
-        self.filePicked = pyTTkSignal(str)
-        self.filesPicked = pyTTkSignal(list)
-        self.folderPicked = pyTTkSignal(str)
-
         TTkWindow.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkFileDialogPicker' )
 
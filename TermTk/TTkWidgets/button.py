@@ -86,16 +86,14 @@ class TTkButton(TTkWidget):
         '_borderColorClicked', '_textColorClicked',
         '_borderColorFocus',   '_textColorFocus'
         '_borderColorDisabled','_textColorDisabled',
-        # Signals
-        'clicked', 'toggled'
         )
+    # Signals
+    clicked = pyTTkSignal()
+    toggled = pyTTkSignal(bool)
     def __init__(self, *args, **kwargs):
 
         TTkWidget.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkButton' )
-        # Define Signals
-        self.clicked = pyTTkSignal()
-        self.toggled = pyTTkSignal(bool)
 
         self._text = TTkString(kwargs.get('text', ""))
         self._checked = kwargs.get('checked', False )
@@ -68,15 +68,13 @@ class TTkCheckbox(TTkWidget):
      '''
     __slots__ = (
         '_checked', '_text',
-        # Signals
-        'clicked', 'stateChanged'
         )
+    # Signals
+    stateChanged = pyTTkSignal(int)
+    clicked      = pyTTkSignal(bool)
     def __init__(self, *args, **kwargs):
         TTkWidget.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkCheckbox' )
-        # Define Signals
-        self.stateChanged = pyTTkSignal(int)
-        self.clicked = pyTTkSignal(bool)
         self._checked = kwargs.get('checked', False )
         self._text = kwargs.get('text', '' )
         self.setMinimumSize(3 + len(self._text), 1)
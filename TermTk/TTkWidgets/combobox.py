@@ -34,14 +34,12 @@ from TermTk.TTkWidgets.lineedit import TTkLineEdit
 from TermTk.TTkWidgets.resizableframe import TTkResizableFrame
 
 class TTkComboBox(TTkWidget):
-    __slots__ = ('_list', '_id', '_lineEdit', '_listw', '_editable', '_insertPolicy', '_textAlign'
-        #signals
-        'currentIndexChanged', 'currentTextChanged', 'editTextChanged')
+    __slots__ = ('_list', '_id', '_lineEdit', '_listw', '_editable', '_insertPolicy', '_textAlign')
+    # Signals
+    currentIndexChanged = pyTTkSignal(int)
+    currentTextChanged  = pyTTkSignal(str)
+    editTextChanged     = pyTTkSignal(str)
     def __init__(self, *args, **kwargs):
-        # Define Signals
-        self.currentIndexChanged = pyTTkSignal(int)
-        self.currentTextChanged  = pyTTkSignal(str)
-        self.editTextChanged     = pyTTkSignal(str)
         TTkWidget.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkCheckbox' )
         # self.cehcked = pyTTkSignal()
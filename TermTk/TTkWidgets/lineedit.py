@@ -39,14 +39,12 @@ from TermTk.TTkWidgets.widget import *
 '''
 class TTkLineEdit(TTkWidget):
     __slots__ = (
-        '_text', '_cursorPos', '_offset', '_replace', '_inputType', '_selectionFrom', '_selectionTo',
-        # Signals
-        'returnPressed', 'textChanged', 'textEdited'     )
+        '_text', '_cursorPos', '_offset', '_replace', '_inputType', '_selectionFrom', '_selectionTo')
+    # Signals
+    returnPressed = pyTTkSignal()
+    textChanged   = pyTTkSignal(str)
+    textEdited    = pyTTkSignal(str, compressed=True)
     def __init__(self, *args, **kwargs):
-        # Signals
-        self.returnPressed = pyTTkSignal()
-        self.textChanged =  pyTTkSignal(str)
-        self.textEdited =  pyTTkSignal(str)
         TTkWidget.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkLineEdit' )
         self._inputType = kwargs.get('inputType' , TTkK.Input_Text )
@@ -208,31 +206,45 @@ class TTkLineEdit(TTkWidget):
             if evt.key == TTkK.Key_Enter:
                 self.returnPressed.emit()
         else:
-            text = self._text
-
-            if self._selectionFrom < self._selectionTo:
-                pre  = text[:self._selectionFrom]
-                post = text[self._selectionTo:]
-                self._cursorPos = self._selectionFrom
-            else:
-                pre = text[:self._cursorPos]
-                if self._replace:
-                    post = text[self._cursorPos+1:]
-                else:
-                    post = text[self._cursorPos:]
-
-            text = pre + evt.key + post
-            if self._inputType & TTkK.Input_Number and \
-               not text.lstrip('-').isdigit():
+            if not self._insertText(evt.key):
                 return
-            self.setText(text, self._cursorPos+1)
+        # Emit event only if the text changed
+        if baseText != self._text:
+            self.textEdited.emit(self._text)
+        return True
 
-            self._pushCursor()
+    def pasteEvent(self, txt):
+        baseText = self._text
+        # The line edit is single line, the newlines are flattened
+        self._insertText(txt.replace('\n',' '))
         # Emit event only if the text changed
         if baseText != self._text:
             self.textEdited.emit(self._text)
         return True
 
+    def _insertText(self, txt):
+        text = self._text
+
+        if self._selectionFrom < self._selectionTo:
+            pre  = text[:self._selectionFrom]
+            post = text[self._selectionTo:]
+            self._cursorPos = self._selectionFrom
+        else:
+            pre = text[:self._cursorPos]
+            if self._replace:
+                post = text[self._cursorPos+len(txt):]
+            else:
+                post = text[self._cursorPos:]
+
+        text = pre + txt + post
+        if self._inputType & TTkK.Input_Number and \
+           not text.lstrip('-').isdigit():
+            return False
+        self.setText(text, self._cursorPos+len(txt))
+
+        self._pushCursor()
+        return True
+
     def focusInEvent(self):
         self._pushCursor()
 
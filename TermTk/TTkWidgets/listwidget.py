@@ -34,13 +34,11 @@ from TermTk.TTkAbstract.abstractscrollview import TTkAbstractScrollView
 from TermTk.TTkTemplates.data import TData
 
 class TTkAbstractListItem(TTkLabel, TData):
-    __slots__ = ('_pressed', '_selected', '_highlighted', 'listItemClicked')
+    __slots__ = ('_pressed', '_selected', '_highlighted')
     def __init__(self, *args, **kwargs):
         TData.__init__(self, *args, **kwargs)
         TTkLabel.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkAbstractListItem' )
-        # Define Signals
-        self.listItemClicked = pyTTkSignal(TTkAbstractListItem)
         self._selected = False
         self._pressed = False
         self._highlighted = False
@@ -92,9 +90,14 @@ class TTkAbstractListItem(TTkLabel, TData):
             self._highlighted = highlighted
             self._updateColor()
 
+# The signal has the class itself as argument type, it is declared after the class
+TTkAbstractListItem.listItemClicked = pyTTkSignal(TTkAbstractListItem)
 
 class TTkListWidget(TTkAbstractScrollView):
-    __slots__ = ('itemClicked', 'textClicked', '_color', '_selectedColor', '_selectedItems', '_selectionMode', '_highlighted', '_items')
+    __slots__ = ('_color', '_selectedColor', '_selectedItems', '_selectionMode', '_highlighted', '_items')
+    # Signals
+    itemClicked = pyTTkSignal(TTkWidget)
+    textClicked = pyTTkSignal(str)
     def __init__(self, *args, **kwargs):
         # Default Class Specific Values
         self._selectionMode = kwargs.get("selectionMode", TTkK.SingleSelection)
@@ -103,9 +106,6 @@ class TTkListWidget(TTkAbstractScrollView):
         self._highlighted = None
         self._color = TTkCfg.theme.listColor
         self._selectedColor = TTkCfg.theme.listColorSelected
-        # Signals
-        self.itemClicked = pyTTkSignal(TTkWidget)
-        self.textClicked = pyTTkSignal(str)
         # Init Super
         TTkAbstractScrollView.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkListWidget' )
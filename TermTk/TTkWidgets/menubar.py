@@ -65,12 +65,12 @@ class _TTkMenuSpacer(TTkAbstractListItem):
         self._canvas.drawText(pos=(0,0), text="-"*self.width())
 
 class TTkMenuButton(TTkAbstractListItem):
-    __slots__ = ('_border', '_borderColor', '_shortcut', '_menu', 'menuButtonClicked', '_menuOffset')
+    __slots__ = ('_border', '_borderColor', '_shortcut', '_menu', '_menuOffset')
+    # Signals
+    menuButtonClicked = pyTTkSignal(TTkButton)
     def __init__(self, *args, **kwargs):
         TTkAbstractListItem.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkMenuButton' )
-        # signals
-        self.menuButtonClicked = pyTTkSignal(TTkButton)
         self._color = kwargs.get('color', TTkCfg.theme.menuButtonColor )
         self._border = kwargs.get('border', TTkCfg.theme.menuButtonColor )
         self._borderColor = kwargs.get('borderColor', TTkCfg.theme.menuButtonBorderColor )
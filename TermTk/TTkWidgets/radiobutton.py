@@ -61,12 +61,10 @@ class TTkRadioButton(TTkWidget):
     _radioLists = {}
     __slots__ = (
         '_checked', '_text',
-        # Signals
-        'clicked'
         )
+    # Signals
+    clicked = pyTTkSignal()
     def __init__(self, *args, **kwargs):
-        # Define Signals
-        self.clicked = pyTTkSignal()
         TTkWidget.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkRadioButton' )
         # self.cehcked = pyTTkSignal()
@@ -43,17 +43,15 @@ class TTkScrollBar(TTkWidget):
         #            |-----| Screen Pg Up
         # <------|XXX|----->
         '_screenPgDown','_screenPgUp','_screenScroller',
-        # Signals
-        'valueChanged', 'rangeChanged', 'sliderMoved'
         )
+    # Signals
+    valueChanged = pyTTkSignal(int, compressed=True) #  Value
+    rangeChanged = pyTTkSignal(int, int) # Min, Max
+    sliderMoved  = pyTTkSignal(int) # Value
 
     def __init__(self, *args, **kwargs):
         TTkWidget.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkScrollBar' )
-        # Define Signals
-        self.valueChanged = pyTTkSignal(int) #  Value
-        self.rangeChanged = pyTTkSignal(int, int) # Min, Max
-        self.sliderMoved  = pyTTkSignal(int) # Value
 
         self._orientation = kwargs.get('orientation' , TTkK.VERTICAL )
         if self._orientation == TTkK.VERTICAL:
@@ -119,9 +117,9 @@ class TTkScrollBar(TTkWidget):
 
     def wheelEvent(self, evt):
         if evt.evt == TTkK.WHEEL_Up:
-            self.value = self.value - self.pagestep
+            self.value = self.value - self.pagestep * evt.steps
         else:
-            self.value = self.value + self.pagestep
+            self.value = self.value + self.pagestep * evt.steps
         self.sliderMoved.emit(self.value)
         return True
 
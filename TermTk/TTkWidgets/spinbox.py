@@ -34,12 +34,10 @@ from TermTk.TTkWidgets.lineedit import TTkLineEdit
 class TTkSpinBox(TTkWidget):
     __slots__= (
         '_lineEdit', '_value', '_maximum', '_minimum',
-        '_mouseDelta', '_valueDelta', '_draggable',
-        # Signals
-        'valueChanged')
+        '_mouseDelta', '_valueDelta', '_draggable')
+    # Signals
+    valueChanged = pyTTkSignal(int, compressed=True)
     def __init__(self, *args, **kwargs):
-        # Signals
-        self.valueChanged=pyTTkSignal(int)
         TTkWidget.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkSpinBox' )
         self._value = kwargs.get("value",0)
@@ -54,12 +54,13 @@ class _TTkTabBarDragData():
     def tabBar(self): return self._tabBar
 
 class TTkTabButton(TTkButton):
-    __slots__ = ('_sideEnd', '_tabStatus', '_closable', 'closeClicked', '_closeButton')
+    __slots__ = ('_sideEnd', '_tabStatus', '_closable', '_closeButton')
+    # Signals
+    closeClicked = pyTTkSignal()
     def __init__(self, *args, **kwargs):
         self._sideEnd = TTkK.NONE
         self._tabStatus = TTkK.Unchecked
         self._closable = kwargs.get('closable', False)
-        self.closeClicked = pyTTkSignal()
         TTkButton.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'TTkTabButton' )
         size = len(self.text) + 2
@@ -223,8 +224,11 @@ class TTkTabBar(TTkWidget):
         '_leftScroller', '_rightScroller',
         '_borderColor', '_tabClosable',
         '_sideEnd',
-        #Signals
-        'currentChanged', 'tabBarClicked', 'tabCloseRequested')
+        )
+    # Signals
+    currentChanged    = pyTTkSignal(int)
+    tabBarClicked     = pyTTkSignal(int)
+    tabCloseRequested = pyTTkSignal(int)
 
     def __init__(self, *args, **kwargs):
         self._tabButtons = []
@@ -252,10 +256,6 @@ class TTkTabBar(TTkWidget):
         self.layout().addWidget(self._leftScroller)
         self.layout().addWidget(self._rightScroller)
 
-        # Signals
-        self.currentChanged    = pyTTkSignal(int)
-        self.tabBarClicked     = pyTTkSignal(int)
-        self.tabCloseRequested = pyTTkSignal(int)
 
         self.setFocusPolicy(TTkK.ClickFocus + TTkK.TabFocus)
 
@@ -402,10 +402,11 @@ class TTkTabBar(TTkWidget):
         self._updateTabs()
 
     def wheelEvent(self, evt):
-        if evt.evt == TTkK.WHEEL_Up:
-            self._moveToTheLeft()
-        else:
-            self._andMoveToTheRight()
+        for _ in range(evt.steps):
+            if evt.evt == TTkK.WHEEL_Up:
+                self._moveToTheLeft()
+            else:
+                self._andMoveToTheRight()
         return True
 
     def keyEvent(self, evt):
@@ -45,9 +45,9 @@ class _TTkTextEditView(TTkAbstractScrollView):
             # # Forwarded Methods
             # 'wrapWidth',    'setWrapWidth',
             # 'wordWrapMode', 'setWordWrapMode',
-            # Signals
-            'currentColorChanged'
-        )
+            )
+    # Signals
+    currentColorChanged = pyTTkSignal(TTkColor)
     '''
         in order to support the line wrap, I need to divide the full data text in;
         _textDocument = the entire text divided in lines, easy to add/remove/append lines
@@ -59,7 +59,6 @@ class _TTkTextEditView(TTkAbstractScrollView):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._name = kwargs.get('name' , '_TTkTextEditView' )
-        self.currentColorChanged = pyTTkSignal(TTkColor)
         self._readOnly = True
         self._multiCursor = True
         self._hsize = 0
@@ -250,6 +249,19 @@ class _TTkTextEditView(TTkAbstractScrollView):
         self.update()
         return True
 
+    def pasteEvent(self, txt):
+        if self._readOnly:
+            return super().pasteEvent(txt)
+        # The whole pasted text is inserted with a single document change
+        self._textCursor.insertText(txt, moveCursor=True)
+        # Scroll to align to the cursor
+        p = self._textCursor.position()
+        cx, cy = self._textWrap.dataToScreenPosition(p.line, p.pos)
+        self._updateSize()
+        self._scrolToInclude(cx,cy)
+        self.update()
+        return True
+
     def keyEvent(self, evt):
         if self._readOnly:
             return super().keyEvent(evt)
@@ -94,13 +94,13 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
         '_visible', '_transparent',
         '_pendingMouseRelease',
         '_enabled',
-        #Signals
-        'focusChanged')
+        # Cached absolute position, depth and effective visibility,
+        # cleared in the whole branch when they change (see _clearCache)
+        '_absPosCache', '_depthCache', '_visibleCache')
+    # Signals
+    focusChanged = pyTTkSignal(bool)
 
     def __init__(self, *args, **kwargs):
-        #Signals
-        self.focusChanged = pyTTkSignal(bool)
-
         self._name = kwargs.get('name', 'TTkWidget' )
         self._parent = kwargs.get('parent', None )
 
@@ -129,6 +129,10 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
         self._visible = kwargs.get('visible', True)
         self._enabled = kwargs.get('enabled', True)
 
+        self._absPosCache  = None
+        self._depthCache   = None
+        self._visibleCache = None
+
         self._focus = False
         self._focus_policy = TTkK.NoFocus
 
@@ -248,6 +252,8 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
         if x==self._x and y==self._y: return
         self._x = x
         self._y = y
+        self._clearCache(absPos=True)
+        self._widgetItem._geometryChanged()
         self.update(repaint=False, updateLayout=False)
         self.moveEvent(x,y)
 
@@ -262,6 +268,7 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
             self._width  = w
             self._height = h
             self._canvas.resize(self._width, self._height)
+            self._widgetItem._geometryChanged()
             self.update(repaint=True, updateLayout=True)
         self.resizeEvent(w,h)
 
@@ -297,12 +304,14 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
         self._padb = bottom
         self._padl = left
         self._padr = right
+        self._widgetItem._invalidate()
         self.update(repaint=True, updateLayout=True)
 
     @staticmethod
-    def _mouseEventLayoutHandle(evt, layout):
+    def _mouseEventLayoutHandle(evt, layout, x, y):
         ''' .. caution:: Don't touch this! '''
-        x, y = evt.x, evt.y
+        # x,y are relative to the layout's parent,
+        # the event is translated only when it is forwarded to a widget
         lx,ly,lw,lh =layout.geometry()
         lox, loy = layout.offset()
         lx,ly,lw,lh = lx+lox, ly+loy, lw-lox, lh-loy
@@ -311,28 +320,17 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
             return False
         x-=lx
         y-=ly
-        for item in reversed(layout.zSortedItems):
-        # for item in layout.zSortedItems:
+        for item in layout.itemsAtRow(y):
             if item.layoutItemType == TTkK.WidgetItem and not item.isEmpty():
                 widget = item.widget()
                 if not widget._visible: continue
-                wevt = None
-                mouseEvent = False
-                if isinstance(evt, TTkMouseEvent):
-                    mouseEvent = True
-                    wx,wy,ww,wh = widget.geometry()
-                    # Skip the mouse event if outside this widget
-                    if wx <= x < wx+ww and wy <= y < wy+wh:
-                        wevt = evt.clone(pos=(x-wx, y-wy))
-                if mouseEvent:
-                    if wevt is not None:
-                        if widget.mouseEvent(wevt):
-                            return True
-                    continue
-
+                wx,wy,ww,wh = widget.geometry()
+                # Skip the mouse event if outside this widget
+                if wx <= x < wx+ww and wy <= y < wy+wh:
+                    if widget.mouseEvent(evt.clone(pos=(x-wx, y-wy))):
+                        return True
             elif item.layoutItemType == TTkK.LayoutItem:
-                levt = evt.clone(pos=(x, y))
-                if TTkWidget._mouseEventLayoutHandle(levt, item):
+                if TTkWidget._mouseEventLayoutHandle(evt, item, x, y):
                     return True
         return False
 
@@ -348,7 +346,7 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
                 return True
 
         if self.rootLayout() is not None:
-            if  TTkWidget._mouseEventLayoutHandle(evt, self.rootLayout()):
+            if  TTkWidget._mouseEventLayoutHandle(evt, self.rootLayout(), evt.x, evt.y):
                 return True
 
         # If there is an overlay and it is modal,
@@ -426,6 +424,7 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
 
     def setParent(self, parent):
         self._parent = parent
+        self._clearCache(absPos=True, depth=True, visible=True)
     def parentWidget(self):
         return self._parent
 
@@ -488,10 +487,12 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
     def setMaximumHeight(self, maxh):
         if self._maxh == maxh: return
         self._maxh = maxh
+        self._widgetItem._invalidate()
         self.update(updateLayout=True, updateParent=True)
     def setMaximumWidth(self, maxw):
         if self._maxw == maxw: return
         self._maxw = maxw
+        self._widgetItem._invalidate()
         self.update(updateLayout=True, updateParent=True)
 
     def setMinimumSize(self, minw, minh):
@@ -500,10 +501,12 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
     def setMinimumHeight(self, minh):
         if self._minh == minh: return
         self._minh = minh
+        self._widgetItem._invalidate()
         self.update(updateLayout=True, updateParent=True)
     def setMinimumWidth(self, minw):
         if self._minw == minw: return
         self._minw = minw
+        self._widgetItem._invalidate()
         self.update(updateLayout=True, updateParent=True)
 
     @staticmethod
@@ -527,6 +530,9 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
     def show(self):
         if self._visible: return
         self._visible = True
+        self._clearCache(visible=True)
+        self._widgetItem._invalidate()
+        TTkHelper.clearFocusChain()
         self._canvas.show()
         self._propagateShow()
 
@@ -534,6 +540,9 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
     def hide(self):
         if not self._visible: return
         self._visible = False
+        self._clearCache(visible=True)
+        self._widgetItem._invalidate()
+        TTkHelper.clearFocusChain()
         self._canvas.hide()
         self.update(repaint=False, updateParent=True)
 
@@ -553,9 +562,14 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
     def close(self):
         if self._parent is not None and \
            self._parent.rootLayout() is not None:
-            self._parent.rootLayout().removeWidget(self)
+            # The widget is usually placed in a nested layout (i.e. the parent's layout()),
+            # it must be removed from there, or the closed widget is kept alive
+            layout = self._widgetItem.parent()
+            if not isinstance(layout, TTkLayout):
+                layout = self._parent.rootLayout()
+            layout.removeWidget(self)
         TTkHelper.removeOverlayAndChild(self)
-        self._parent = None
+        self.setParent(None)
 
     @pyTTkSlot(bool)
     def setVisible(self, visible):
@@ -563,10 +577,25 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
         else: self.hide()
 
     def isVisible(self):
-        if self._parent is None:
-            return self._visible
-        else:
-            return self._visible & self._parent.isVisible()
+        if (visible := self._visibleCache) is None:
+            if self._parent is None:
+                visible = self._visible
+            else:
+                visible = self._visible & self._parent.isVisible()
+            self._visibleCache = visible
+        return visible
+
+    def _clearCache(self, absPos=False, depth=False, visible=False):
+        # A cache is computed from the parent's one (see TTkHelper.absPos/widgetDepth and isVisible),
+        # if it is already clear it is clear in the whole branch as well
+        absPos  = absPos  and self._absPosCache  is not None
+        depth   = depth   and self._depthCache   is not None
+        visible = visible and self._visibleCache is not None
+        if not (absPos or depth or visible): return
+        if absPos:  self._absPosCache  = None
+        if depth:   self._depthCache   = None
+        if visible: self._visibleCache = None
+        self._layout._clearCache(absPos, depth, visible)
 
     # Event to be sent
     # TODO: Remove This
@@ -577,6 +606,9 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
             TTkHelper.addUpdateBuffer(self)
         TTkHelper.addUpdateWidget(self)
         if updateLayout and self.rootLayout() is not None:
+            # An explicit request rearranges this widget's layout (not the whole branch),
+            # the cached size hints are still valid
+            self.layout()._dirty = True
             self.rootLayout().setGeometry(0,0,self._width,self._height)
             self.layout().setGeometry(
                         self._padl, self._padt,
@@ -622,6 +654,7 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
 
     def setFocusPolicy(self, policy):
         self._focus_policy = policy
+        TTkHelper.clearFocusChain()
 
     def focusInEvent(self): pass
     def focusOutEvent(self): pass
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2023 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Connect/Disconnect/Emit of the coroutine (async def) methods of a widget,
+# the widget is referenced weakly by the connection
+#
+#   python3 tests/test.signal.001.py
+#   python3 -m pytest --import-mode=importlib tests/test.signal.001.py
+
+import sys, os
+import weakref
+import asyncio
+import threading
+
+sys.path.append(os.path.join(sys.path[0],'..'))
+import TermTk as ttk
+from TermTk.TTkCore.signal import _pyTTkSignalQueue
+
+class _AsyncWidget(ttk.TTkWidget):
+    def __init__(self, *args, **kwargs):
+        ttk.TTkWidget.__init__(self, *args, **kwargs)
+        self.received = []
+
+    async def aslot(self, value):
+        await asyncio.sleep(0)
+        self.received.append(value)
+
+def test_async_widget_slot_emit():
+    async def _main():
+        signal = ttk.pyTTkSignal(int)
+        widget = _AsyncWidget()
+        signal.connect(widget.aslot)
+        signal.emit(1)
+        await asyncio.sleep(0.01)
+        return widget.received
+    assert asyncio.run(_main()) == [1]
+
+def test_async_widget_slot_deliver():
+    # Main loop registered, the slot is bound and called by pyTTkSignal._deliver
+    async def _main():
+        signal = ttk.pyTTkSignal(int)
+        widget = _AsyncWidget()
+        signal.connect(widget.aslot, type=ttk.TTkK.DirectConnection)
+        _pyTTkSignalQueue.register(threading.get_ident(), None)
+        try:
+            signal.emit(2)
+        finally:
+            _pyTTkSignalQueue.register(None, None)
+        await asyncio.sleep(0.01)
+        return widget.received
+    assert asyncio.run(_main()) == [2]
+
+def test_async_widget_slot_disconnect():
+    async def _main():
+        signal = ttk.pyTTkSignal(int)
+        widget = _AsyncWidget()
+        signal.connect(widget.aslot)
+        signal.disconnect(widget.aslot)
+        signal.emit(1)
+        await asyncio.sleep(0.01)
+        return widget.received
+    assert asyncio.run(_main()) == []
+
+def test_async_widget_slot_weak():
+    signal = ttk.pyTTkSignal(int)
+    widget = _AsyncWidget()
+    signal.connect(widget.aslot)
+    # The connection stores the unbound coroutine and a weak reference to the widget
+    (func, ref), = signal._connected_slots
+    assert isinstance(ref, weakref.ref) and ref() is widget
+    assert func == _AsyncWidget.aslot
+
+if __name__ == '__main__':
+    for test in (test_async_widget_slot_emit,
+                 test_async_widget_slot_deliver,
+                 test_async_widget_slot_disconnect,
+                 test_async_widget_slot_weak):
+        test()
+        print(f"{test.__name__}: OK")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2023 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Run the application in an asyncio loop (TTk.run)
+# the slots defined as "async def" can await without blocking the UI
+
+import sys, os
+import asyncio
+
+sys.path.append(os.path.join(sys.path[0],'..'))
+import TermTk as ttk
+
+ttk.TTkLog.use_default_file_logging()
+
+async def main():
+    root = ttk.TTk(layout=ttk.TTkGridLayout())
+    win = ttk.TTkWindow(parent=root, title="asyncio", layout=ttk.TTkGridLayout())
+    button = ttk.TTkButton(text="Fetch", border=True, maxHeight=3)
+    label  = ttk.TTkLabel(text="...")
+    win.layout().addWidget(button,0,0)
+    win.layout().addWidget(label,1,0)
+
+    async def _fetch():
+        for i in range(5,0,-1):
+            label.setText(f"Fetching... {i}")
+            await asyncio.sleep(1)
+        label.setText("Done")
+
+    button.clicked.connect(_fetch)
+
+    await root.run()
+
+asyncio.run(main())
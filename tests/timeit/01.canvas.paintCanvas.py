@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2022 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Composition benchmark,
+# the cost of TTkCanvas.paintCanvas should scale with the number of rows
+# and be (almost) independent from the number of columns
+
+import sys, os
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+from TermTk import TTkCanvas
+
+loop = 500
+
+def _blit(w, h):
+    parent = TTkCanvas(width=w, height=h)
+    child  = TTkCanvas(width=w, height=h)
+    return lambda : parent.paintCanvas(child, (0,0,w,h), (0,0,w,h), (0,0,w,h))
+
+print(f"paintCanvas - {loop} loops")
+print(" Fixed Rows (50):")
+for w in (20, 80, 320, 1280):
+    t = timeit.timeit(_blit(w,50), number=loop)
+    print(f"  {w:5}x{50:<5} {t*1000/loop:8.4f} ms/blit  {t*1e9/loop/(w*50):8.2f} ns/cell")
+print(" Fixed Columns (80):")
+for h in (20, 80, 320, 1280):
+    t = timeit.timeit(_blit(80,h), number=loop)
+    print(f"  {80:5}x{h:<5} {t*1000/loop:8.4f} ms/blit  {t*1e6/loop/h:8.2f} us/row")
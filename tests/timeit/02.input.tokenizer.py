@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2022 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Input throughput benchmark,
+# a stream of typed text, special keys and mouse reports is split
+# in random chunks (as returned by os.read) and tokenized/parsed
+
+import sys, os
+import random
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+from TermTk.TTkCore.TTkTerm.inputtokenizer import InputTokenizer
+from TermTk.TTkCore.TTkTerm.input import TTkInput
+
+random.seed(1)
+loop = 20
+
+def _stream(n):
+    tokens = []
+    for _ in range(n):
+        r = random.random()
+        if   r < 0.4: tokens.append(random.choice("abcdefghijklmnopqrstuvwxyz àèìòù"))
+        elif r < 0.5: tokens.append(random.choice(["\033[A","\033[B","\033[1;5C","\033[3~","\033OP","\t","\n"]))
+        elif r < 0.9: tokens.append(f"\033[<32;{random.randint(1,300)};{random.randint(1,100)}M")
+        else:         tokens.append(random.choice(["\033[<64;10;10M","\033[<65;10;10M"]))
+    return tokens
+
+def _chunks(data, size):
+    ret = []
+    while data:
+        n = random.randint(1, size)
+        ret.append(data[:n])
+        data = data[n:]
+    return ret
+
+def _tokenize(chunks):
+    def _run():
+        tokenizer = InputTokenizer()
+        for chunk in chunks:
+            tokenizer.feed(chunk)
+    return _run
+
+def _parse(chunks):
+    def _tokens():
+        tokenizer = InputTokenizer()
+        for chunk in chunks:
+            yield from tokenizer.feed(chunk)
+    def _run():
+        # Replace the terminal reader, each read returns a token
+        tokens = _tokens()
+        ttkInput = TTkInput.__new__(TTkInput)
+        ttkInput._readInput = type('',(),{'read': lambda _: next(tokens, None)})()
+        ttkInput._leftLastTime = ttkInput._midLastTime = ttkInput._rightLastTime = 0
+        ttkInput._leftTap = ttkInput._midTap = ttkInput._rightTap = 0
+        ttkInput.get_key(lambda kevt, mevt: True)
+    return _run
+
+tokens = _stream(20000)
+data = ''.join(tokens).encode()
+assert InputTokenizer().feed(data) == tokens
+
+print(f"Input - {len(tokens)} tokens, {len(data)} bytes, {loop} loops")
+for size in (16, 256, 4096):
+    chunks = _chunks(data, size)
+    t = timeit.timeit(_tokenize(chunks), number=loop)
+    print(f"  tokenize    chunks<={size:<5} {len(tokens)*loop/t:12.0f} tokens/s")
+    t = timeit.timeit(_parse(chunks), number=loop)
+    print(f"  parse/event chunks<={size:<5} {len(tokens)*loop/t:12.0f} tokens/s")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2022 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Signal benchmark,
+# the cost of pyTTkSignal.emit with 0/1/3 slots (functions and bound methods)
+# and the objects left alive by an app that keeps opening and closing windows
+
+import sys, os
+import gc
+import timeit
+import tracemalloc
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+import TermTk as ttk
+
+loop = 200000
+
+class _Receiver():
+    def slot(self, a): pass
+
+def _func(a): pass
+
+def _emit(slots):
+    signal = ttk.pyTTkSignal(int)
+    for s in slots:
+        signal.connect(s)
+    return lambda : signal.emit(1)
+
+receivers = [_Receiver() for _ in range(3)]
+
+print(f"emit - {loop} loops")
+for name, slots in (
+        ("no slots",        []),
+        ("1 function",      [_func]),
+        ("1 method",        [receivers[0].slot]),
+        ("3 functions",     [_func, lambda a: None, lambda a: None]),
+        ("3 methods",       [r.slot for r in receivers])):
+    t = timeit.timeit(_emit(slots), number=loop)
+    print(f"  {name:15} {t*1e9/loop:8.1f} ns/emit")
+
+class _Null():
+    encoding = 'utf-8'
+    def write(self, txt): pass
+    def flush(self): pass
+
+# Open and close a window with a log viewer and few widgets,
+# the frames are painted to a null terminal
+root = ttk.TTk()
+out, sys.stdout = sys.stdout, _Null()
+def _cycle():
+    win = ttk.TTkWindow(parent=root, size=(40,20), layout=ttk.TTkGridLayout())
+    ttk.TTkLogViewer(parent=win)
+    ttk.TTkButton(parent=win, text="Button")
+    ttk.TTkLineEdit(parent=win, text="Text")
+    ttk.TTkLog.debug("Window Open")
+    ttk.TTkHelper.paintAll()
+    win.close()
+    ttk.TTkHelper.paintAll()
+
+tracemalloc.start()
+print("open/close windows:", file=out)
+for i in range(6):
+    t = timeit.timeit(_cycle, number=50)
+    gc.collect()
+    print(f"  {(i+1)*50:5} windows {t*1000/50:8.3f} ms/window  "
+          f"objects:{len(gc.get_objects()):7}  "
+          f"log handlers:{len(ttk.TTkLog._messageHandler):3}  "
+          f"traced:{tracemalloc.get_traced_memory()[0]//1024:6} KiB", file=out)
+sys.stdout = out
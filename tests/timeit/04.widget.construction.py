@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2022 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Construction benchmark,
+# time and memory required to create the widgets,
+# the signals are allocated only when they are accessed
+
+import sys, os
+import timeit
+import tracemalloc
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+import TermTk as ttk
+
+loop = 500
+repeat = 10
+
+class _Null():
+    encoding = 'utf-8'
+    def write(self, txt): pass
+    def flush(self): pass
+
+root = ttk.TTk()
+out, sys.stdout = sys.stdout, _Null()
+
+def _drain():
+    # The new widgets are queued for the next frame,
+    # the queue is painted (to a null terminal) outside the measure
+    ttk.TTkHelper.paintAll()
+
+def _memory(widgetClass):
+    _drain()
+    tracemalloc.start()
+    widgets = [widgetClass() for _ in range(loop)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+print(f"construction - {loop} widgets", file=out)
+for widgetClass in (
+        ttk.TTkWidget,
+        ttk.TTkLabel,
+        ttk.TTkAbstractListItem,
+        ttk.TTkButton,
+        ttk.TTkLineEdit,
+        ttk.TTkScrollBar,
+        ttk.TTkSpinBox,
+        ttk.TTkAbstractScrollView ):
+    t = min(timeit.repeat(widgetClass, setup=_drain, number=loop, repeat=repeat))
+    size = _memory(widgetClass)
+    print(f"  {widgetClass.__name__:22} {t*1e6/loop:8.2f} us/widget  {size/loop:8.0f} bytes/widget", file=out)
+sys.stdout = out
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# MIT License
+#
+# Copyright (c) 2022 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Frame scheduling benchmark,
+# every label of a grid is updated before each frame,
+# the cost per updated widget should not grow with the number of widgets
+
+import sys, os
+import timeit
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+import TermTk as ttk
+
+loop = 10
+
+class _Null():
+    encoding = 'utf-8'
+    def write(self, txt): pass
+    def flush(self): pass
+
+root = ttk.TTk()
+ttk.TTkGlbl.term_w, ttk.TTkGlbl.term_h = 200, 100
+root.setGeometry(0, 0, 200, 100)
+root.show()
+out, sys.stdout = sys.stdout, _Null()
+
+def _frame(labels):
+    def _run():
+        for label in labels:
+            label.update()
+        ttk.TTkHelper.paintAll()
+    return _run
+
+print(f"paintAll - {loop} frames", file=out)
+for rows in (10, 20, 40, 80):
+    frame = ttk.TTkFrame(parent=root, pos=(0,0), size=(200,100), layout=ttk.TTkGridLayout())
+    labels = []
+    for y in range(rows):
+        # Each row is a nested container, to have some depth
+        row = ttk.TTkWidget(layout=ttk.TTkHBoxLayout())
+        frame.layout().addWidget(row, y, 0)
+        for x in range(25):
+            labels.append(ttk.TTkLabel(parent=row, text=f"{x},{y}"))
+    ttk.TTkHelper.paintAll()
+    t = timeit.timeit(_frame(labels), number=loop)
+    print(f"  {len(labels):5} labels {t*1000/loop:8.2f} ms/frame  {t*1e6/loop/len(labels):6.2f} us/label  "
+          f"painted:{ttk.TTkHelper.paintedWidgets:5} composed:{ttk.TTkHelper.composedWidgets:5}", file=out)
+    frame.close()
+    ttk.TTkHelper.paintAll()
+sys.stdout = out
@@ -8,19 +8,32 @@ __check(){
         grep -v \
             -e "from dataclasses" \
             -e "colors.py:from .colors_ansi_map" \
+            -e "canvas.py:import weakref" \
+            -e "canvas.py:from array import array" \
             -e "timer.py:import threading, time" \
+            -e "timer.py:import heapq" \
+            -e "helper.py:import bisect" \
             -e "log.py:import inspect" \
             -e "log.py:import logging" \
             -e "log.py:from collections.abc import Callable, Set" \
             -e "from time" -e "input.py:import platform" \
             -e "readinputlinux.py:import sys, os, select" \
+            -e "readinputlinux.py:from collections import deque" \
+            -e "inputtokenizer.py:import codecs" \
             -e "readinputlinux_thread.py:import sys, os, select" \
             -e "readinputlinux_thread.py:import threading" \
             -e "readinputlinux_thread.py:import queue" \
-            -e "term.py:import sys, os, signal" \
+            -e "term.py:import sys, os, signal, select" \
             -e "ttk.py:import signal" \
             -e "ttk.py:import time" \
             -e "ttk.py:import queue" \
+            -e "ttk.py:import asyncio" \
+            -e "signal.py:import asyncio" \
+            -e "signal.py:import inspect" \
+            -e "signal.py:import threading" \
+            -e "signal.py:import weakref" \
+            -e "signal.py:from collections import deque" \
+            -e "readinputasync.py:import sys, os" \
             -e "filebuffer.py:import threading"
 } ;
 